@@ -16,7 +16,7 @@ def print_progress(range_pos):
 client = GraphClient.with_username_and_password(
     test_tenant, test_client_id, test_username, test_password
 )
-chunk_size = 1 * 1024 * 1024
+chunk_size = 10 * 320 * 1024
 local_path = "../../../tests/data/big_buck_bunny.mp4"
 remote_folder = client.me.drive.root.get_by_path("archive")
 remote_file = (
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Optional, Type, TypeVar
 
+from office365.delta_iterator import DeltaCheckpointStore, DeltaIterator
 from office365.delta_path import DeltaPath
 from office365.entity import Entity
 from office365.entity_collection import EntityCollection
@@ -25,6 +26,20 @@ class DeltaCollection(EntityCollection[T]):
         self.query_options.custom["changeType"] = type_name
         return self
 
+    def iter_changes(self, store=None, key=None, page_size=None, prefetch=True):
+        # type: (Optional[DeltaCheckpointStore], Optional[str], Optional[int], bool) -> DeltaIterator[T]
+        """
+        Tracks created, updated and removed entities page by page. The link to resume from is saved into the store
+        once a page has been consumed, hence subsequent runs return only the changes made since.
+
+        :param DeltaCheckpointStore or None store: Persistent store of links, by default links are kept in memory
+        :param str or None key: Identifies the delta query in the store, defaults to its url
+        :param int or None page_size: Number of entities per page
+        :param bool prefetch: Requests the next page in a background thread while the current one is processed
+        """
+        collection = self if isinstance(self.resource_path, DeltaPath) else self.delta
+        return DeltaIterator(collection, store, key, page_size, prefetch)
+
     @property
     def delta(self):
         # type: () -> DeltaCollection[T]
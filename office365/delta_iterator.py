@@ -0,0 +1,193 @@
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Generic, Iterator, Optional, TypeVar
+
+from office365.runtime.queries.read_entity import ReadEntityQuery
+
+if TYPE_CHECKING:
+    from office365.runtime.client_object_collection import ClientObjectCollection
+
+T = TypeVar("T")
+
+
+class DeltaCheckpointStore(object):
+    """
+    Persistent store of delta query links (@odata.nextLink or @odata.deltaLink), so that tracking of changes
+    resumes from the page where the previous run has stopped
+    """
+
+    def get(self, key):
+        # type: (str) -> Optional[str]
+        """
+        Returns the link stored under the key or None if it is missing
+
+        :param str key: Identifies the delta query, e.g. its url
+        """
+        raise NotImplementedError("get")
+
+    def set(self, key, value):
+        # type: (str, str) -> None
+        """
+        Stores the link
+
+        :param str key: Identifies the delta query
+        :param str value: The link to resume from
+        """
+        raise NotImplementedError("set")
+
+    def remove(self, key):
+        # type: (str) -> None
+        """Removes the link stored under the key"""
+        raise NotImplementedError("remove")
+
+
+class MemoryDeltaCheckpointStore(DeltaCheckpointStore):
+    """Keeps links in memory, for the lifetime of a process"""
+
+    def __init__(self):
+        self._links = {}  # type: Dict[str, str]
+
+    def get(self, key):
+        # type: (str) -> Optional[str]
+        return self._links.get(key, None)
+
+    def set(self, key, value):
+        # type: (str, str) -> None
+        self._links[key] = value
+
+    def remove(self, key):
+        # type: (str) -> None
+        self._links.pop(key, None)
+
+
+class FileDeltaCheckpointStore(DeltaCheckpointStore):
+    """Keeps links in a JSON file which is replaced atomically on every change"""
+
+    def __init__(self, path):
+        # type: (str) -> None
+        """
+        :param str path: Path to the file
+        """
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        # type: () -> str
+        return self._path
+
+    def get(self, key):
+        # type: (str) -> Optional[str]
+        return self._read().get(key, None)
+
+    def set(self, key, value):
+        # type: (str, str) -> None
+        with self._lock:
+            links = self._read()
+            links[key] = value
+            self._write(links)
+
+    def remove(self, key):
+        # type: (str) -> None
+        with self._lock:
+            links = self._read()
+            if links.pop(key, None) is not None:
+                self._write(links)
+
+    def _read(self):
+        # type: () -> Dict[str, str]
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _write(self, links):
+        # type: (Dict[str, str]) -> None
+        tmp_path = "{0}.{1}.tmp".format(self._path, os.getpid())
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(links, f)
+        os.replace(tmp_path, self._path)
+
+
+class DeltaChange(Generic[T]):
+    """A created, updated or removed entity returned by a delta query"""
+
+    def __init__(self, entity):
+        # type: (T) -> None
+        self.entity = entity
+
+    @property
+    def removed_reason(self):
+        # type: () -> Optional[str]
+        """
+        For removed entities, either deleted (the entity is deleted permanently) or
+        changed (the entity is deleted but can be restored), otherwise None
+        """
+        removed = self.entity.properties.get("@removed", None)
+        if removed is None:
+            return None
+        return removed.get("reason", "deleted")
+
+    @property
+    def is_removed(self):
+        # type: () -> bool
+        return self.removed_reason is not None
+
+    def __repr__(self):
+        return "{0}({1})".format(
+            "removed" if self.is_removed else "changed",
+            self.entity.properties.get("id", None),
+        )
+
+
+class DeltaIterator(Generic[T]):
+    """
+    Tracks changes of a delta query page by page, only a single page of entities is kept in memory.
+
+    Once the entities of a page have been consumed, the link to the next page (@odata.nextLink) is saved
+    into the store, after the last page the link to track further changes (@odata.deltaLink) is saved instead.
+    The next run resumes from the saved link, so an interrupted run returns the entities of the unfinished page
+    once again and a completed one returns only the changes made since.
+    """
+
+    def __init__(self, collection, store=None, key=None, page_size=None, prefetch=True):
+        # type: (ClientObjectCollection[T], Optional[DeltaCheckpointStore], Optional[str], Optional[int], bool) -> None
+        """
+        :param ClientObjectCollection collection: The delta query, e.g. client.users.delta
+        :param DeltaCheckpointStore or None store: Persistent store of links, by default links are kept in memory
+        :param str or None key: Identifies the delta query in the store, defaults to its url
+        :param int or None page_size: Number of entities per page
+        :param bool prefetch: Requests the next page in a background thread while the current one is processed
+        """
+        self._collection = collection
+        self._store = store if store is not None else MemoryDeltaCheckpointStore()
+        self._key = key if key is not None else ReadEntityQuery(collection).url
+        self._page_size = page_size
+        self._prefetch = prefetch
+
+    @property
+    def delta_link(self):
+        # type: () -> Optional[str]
+        """The saved link, i.e. the one the next run resumes from"""
+        return self._store.get(self._key)
+
+    def reset(self):
+        # type: () -> None
+        """Discards the saved link, the next run starts tracking from scratch"""
+        self._store.remove(self._key)
+
+    def __iter__(self):
+        # type: () -> Iterator[DeltaChange[T]]
+        collection = self._collection
+        pages = collection._iter_pages(
+            self._page_size, self._prefetch, False, self._store.get(self._key)
+        )
+        for page in pages:
+            # links of the page received last, the next one is not processed until the page is consumed
+            link = collection._next_request_url or collection.delta_link
+            for entity in page:
+                yield DeltaChange(entity)
+            if link is not None:
+                self._store.set(self._key, link)
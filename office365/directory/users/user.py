@@ -483,9 +483,9 @@ class User(DirectoryObject):
     @property
     def created_objects(self):
         """Directory objects created by this user."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "createdObjects",
-            DirectoryObjectCollection(
+            lambda: DirectoryObjectCollection(
                 self.context, ResourcePath("createdObjects", self.resource_path)
             ),
         )
@@ -516,9 +516,9 @@ class User(DirectoryObject):
     @property
     def app_role_assignments(self):
         """Get the apps and app roles which this user has been assigned."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "appRoleAssignments",
-            AppRoleAssignmentCollection(
+            lambda: AppRoleAssignmentCollection(
                 self.context, ResourcePath("appRoleAssignments", self.resource_path)
             ),
         )
@@ -527,9 +527,11 @@ class User(DirectoryObject):
     def chats(self):
         # type: () -> ChatCollection
         """The user's chats."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "chats",
-            ChatCollection(self.context, ResourcePath("chats", self.resource_path)),
+            lambda: ChatCollection(
+                self.context, ResourcePath("chats", self.resource_path)
+            ),
         )
 
     @property
@@ -565,9 +567,9 @@ class User(DirectoryObject):
         """
         The authentication methods that are supported for the user.
         """
-        return self.properties.get(
+        return self._get_navigation_property(
             "authentication",
-            Authentication(
+            lambda: Authentication(
                 self.context, ResourcePath("authentication", self.resource_path)
             ),
         )
@@ -632,9 +634,9 @@ class User(DirectoryObject):
     def activities(self):
         # type: () -> UserActivityCollection
         """The user's activities across devices."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "activities",
-            UserActivityCollection(
+            lambda: UserActivityCollection(
                 self.context, ResourcePath("activities", self.resource_path)
             ),
         )
@@ -650,9 +652,9 @@ class User(DirectoryObject):
     @property
     def followed_sites(self):
         """ """
-        return self.properties.get(
+        return self._get_navigation_property(
             "followedSites",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context, Site, ResourcePath("followedSites", self.resource_path)
             ),
         )
@@ -661,9 +663,9 @@ class User(DirectoryObject):
     def insights(self):
         # type: () -> OfficeGraphInsights
         """Insights are relationships calculated using advanced analytics and machine learning techniques."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "insights",
-            OfficeGraphInsights(
+            lambda: OfficeGraphInsights(
                 self.context, ResourcePath("insights", self.resource_path)
             ),
         )
@@ -671,17 +673,19 @@ class User(DirectoryObject):
     @property
     def photo(self):
         """The user's profile photo. Read-only."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "photo",
-            ProfilePhoto(self.context, ResourcePath("photo", self.resource_path)),
+            lambda: ProfilePhoto(
+                self.context, ResourcePath("photo", self.resource_path)
+            ),
         )
 
     @property
     def photos(self):
         """The collection of the user's profile photos in different sizes"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "photos",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context, ProfilePhoto, ResourcePath("photos", self.resource_path)
             ),
         )
@@ -689,9 +693,11 @@ class User(DirectoryObject):
     @property
     def manager(self):
         """The user or contact that is this user's manager"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "manager",
-            DirectoryObject(self.context, ResourcePath("manager", self.resource_path)),
+            lambda: DirectoryObject(
+                self.context, ResourcePath("manager", self.resource_path)
+            ),
         )
 
     @property
@@ -711,18 +717,20 @@ class User(DirectoryObject):
     def calendar(self):
         # type: () -> Calendar
         """The user's primary calendar. Read-only."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "calendar",
-            Calendar(self.context, ResourcePath("calendar", self.resource_path)),
+            lambda: Calendar(
+                self.context, ResourcePath("calendar", self.resource_path)
+            ),
         )
 
     @property
     def calendars(self):
         # type: () -> EntityCollection[Calendar]
         """The user's calendar groups. Read-only. Nullable."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "calendars",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context, Calendar, ResourcePath("calendars", self.resource_path)
             ),
         )
@@ -731,9 +739,9 @@ class User(DirectoryObject):
     def calendar_groups(self):
         # type: () -> EntityCollection[CalendarGroup]
         """The user's calendar groups. Read-only. Nullable."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "calendarGroups",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context,
                 CalendarGroup,
                 ResourcePath("calendarGroups", self.resource_path),
@@ -744,9 +752,9 @@ class User(DirectoryObject):
     def license_details(self):
         # type: () -> EntityCollection[LicenseDetails]
         """Retrieve the properties and relationships of a Drive resource."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "licenseDetails",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context,
                 LicenseDetails,
                 ResourcePath("licenseDetails", self.resource_path),
@@ -757,9 +765,9 @@ class User(DirectoryObject):
     def drive(self):
         # type: () -> Drive
         """Retrieve the properties and relationships of a Drive resource."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "drive",
-            Drive(
+            lambda: Drive(
                 self.context,
                 EntityPath("drive", self.resource_path, ResourcePath("drives")),
             ),
@@ -770,9 +778,9 @@ class User(DirectoryObject):
         # type: () -> ContactCollection
         """Get a contact collection from the default Contacts folder of the signed-in user (.../me/contacts),
         or from the specified contact folder."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "contacts",
-            ContactCollection(
+            lambda: ContactCollection(
                 self.context, ResourcePath("contacts", self.resource_path)
             ),
         )
@@ -781,9 +789,9 @@ class User(DirectoryObject):
     def contact_folders(self):
         # type: () -> DeltaCollection[ContactFolder]
         """Get the contact folder collection in the default Contacts folder of the signed-in user."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "contactFolders",
-            DeltaCollection(
+            lambda: DeltaCollection(
                 self.context,
                 ContactFolder,
                 ResourcePath("contactFolders", self.resource_path),
@@ -794,9 +802,9 @@ class User(DirectoryObject):
     def events(self):
         # type: () -> DeltaCollection[Event]
         """Get an event collection or an event."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "events",
-            DeltaCollection(
+            lambda: DeltaCollection(
                 self.context, Event, ResourcePath("events", self.resource_path)
             ),
         )
@@ -805,9 +813,9 @@ class User(DirectoryObject):
     def messages(self):
         # type: () -> MessageCollection
         """Get an event collection or an event."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "messages",
-            MessageCollection(
+            lambda: MessageCollection(
                 self.context, ResourcePath("messages", self.resource_path)
             ),
         )
@@ -816,9 +824,9 @@ class User(DirectoryObject):
     def joined_teams(self):
         # type: () -> TeamCollection
         """Get the teams in Microsoft Teams that the user is a direct member of."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "joinedTeams",
-            TeamCollection(
+            lambda: TeamCollection(
                 self.context, ResourcePath("joinedTeams", self.resource_path)
             ),
         )
@@ -827,9 +835,9 @@ class User(DirectoryObject):
     def managed_devices(self):
         # type: () -> EntityCollection[ManagedDevice]
         """Devices that are managed or pre-enrolled through Intune"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "managedDevices",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context,
                 ManagedDevice,
                 ResourcePath("managedDevices", self.resource_path),
@@ -840,9 +848,9 @@ class User(DirectoryObject):
     def member_of(self):
         # type: () -> DirectoryObjectCollection
         """Get groups and directory roles that the user is a direct member of."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "memberOf",
-            DirectoryObjectCollection(
+            lambda: DirectoryObjectCollection(
                 self.context, ResourcePath("memberOf", self.resource_path)
             ),
         )
@@ -851,9 +859,9 @@ class User(DirectoryObject):
     def oauth2_permission_grants(self):
         # type: () -> DeltaCollection[OAuth2PermissionGrant]
         """"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "oauth2PermissionGrants",
-            DeltaCollection(
+            lambda: DeltaCollection(
                 self.context,
                 OAuth2PermissionGrant,
                 ResourcePath("oauth2PermissionGrants", self.resource_path),
@@ -884,9 +892,9 @@ class User(DirectoryObject):
         """Devices that are owned by the user. Read-only. Nullable.
         Supports $expand and $filter (/$count eq 0, /$count ne 0, /$count eq 1, /$count ne 1).
         """
-        return self.properties.get(
+        return self._get_navigation_property(
             "ownedDevices",
-            DirectoryObjectCollection(
+            lambda: DirectoryObjectCollection(
                 self.context, ResourcePath("ownedDevices", self.resource_path)
             ),
         )
@@ -894,9 +902,9 @@ class User(DirectoryObject):
     @property
     def owned_objects(self):
         """Directory objects that are owned by the user. Read-only. Nullable. Supports $expand."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ownedObjects",
-            DirectoryObjectCollection(
+            lambda: DirectoryObjectCollection(
                 self.context, ResourcePath("ownedObjects", self.resource_path)
             ),
         )
@@ -917,9 +925,9 @@ class User(DirectoryObject):
     def transitive_member_of(self):
         """Get groups, directory roles that the user is a member of. This API request is transitive, and will also
         return all groups the user is a nested member of."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "transitiveMemberOf",
-            DirectoryObjectCollection(
+            lambda: DirectoryObjectCollection(
                 self.context, ResourcePath("transitiveMemberOf", self.resource_path)
             ),
         )
@@ -928,9 +936,9 @@ class User(DirectoryObject):
     def mail_folders(self):
         # type: () -> MailFolderCollection
         """Get the mail folder collection under the root folder of the signed-in user."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "mailFolders",
-            MailFolderCollection(
+            lambda: MailFolderCollection(
                 self.context, ResourcePath("mailFolders", self.resource_path)
             ),
         )
@@ -939,43 +947,49 @@ class User(DirectoryObject):
     def outlook(self):
         # type: () -> OutlookUser
         """Represents the Outlook services available to a user."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "outlook",
-            OutlookUser(self.context, ResourcePath("outlook", self.resource_path)),
+            lambda: OutlookUser(
+                self.context, ResourcePath("outlook", self.resource_path)
+            ),
         )
 
     @property
     def onenote(self):
         # type: () -> Onenote
         """Represents the Onenote services available to a user."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "onenote",
-            Onenote(self.context, ResourcePath("onenote", self.resource_path)),
+            lambda: Onenote(self.context, ResourcePath("onenote", self.resource_path)),
         )
 
     @property
     def settings(self):
         """Represents the user and organization settings object."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "settings",
-            UserSettings(self.context, ResourcePath("settings", self.resource_path)),
+            lambda: UserSettings(
+                self.context, ResourcePath("settings", self.resource_path)
+            ),
         )
 
     @property
     def planner(self):
         """The plannerUser resource provide access to Planner resources for a user."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "planner",
-            PlannerUser(self.context, ResourcePath("planner", self.resource_path)),
+            lambda: PlannerUser(
+                self.context, ResourcePath("planner", self.resource_path)
+            ),
         )
 
     @property
     def extensions(self):
         # type: () -> EntityCollection[Extension]
         """The collection of open extensions defined for the user. Nullable."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "extensions",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context, Extension, ResourcePath("extensions", self.resource_path)
             ),
         )
@@ -983,9 +997,9 @@ class User(DirectoryObject):
     @property
     def direct_reports(self):
         """Get a user's direct reports"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "directReports",
-            DirectoryObjectCollection(
+            lambda: DirectoryObjectCollection(
                 self.context, ResourcePath("directReports", self.resource_path)
             ),
         )
@@ -993,9 +1007,9 @@ class User(DirectoryObject):
     @property
     def online_meetings(self):
         """Get a user's online meetings."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "onlineMeetings",
-            OnlineMeetingCollection(
+            lambda: OnlineMeetingCollection(
                 self.context, ResourcePath("onlineMeetings", self.resource_path)
             ),
         )
@@ -1023,17 +1037,19 @@ class User(DirectoryObject):
     @property
     def presence(self):
         """Get a user's presence information."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "presence",
-            Presence(self.context, ResourcePath("presence", self.resource_path)),
+            lambda: Presence(
+                self.context, ResourcePath("presence", self.resource_path)
+            ),
         )
 
     @property
     def registered_devices(self):
         """Get the devices that are registered for the user from the registeredDevices navigation property."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "registeredDevices",
-            DirectoryObjectCollection(
+            lambda: DirectoryObjectCollection(
                 self.context, ResourcePath("registeredDevices", self.resource_path)
             ),
         )
@@ -1054,25 +1070,27 @@ class User(DirectoryObject):
     def teamwork(self):
         # type: () -> UserTeamwork
         """A container for the range of Microsoft Teams functionalities that are available per user in the tenant."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "teamwork",
-            UserTeamwork(self.context, ResourcePath("teamwork", self.resource_path)),
+            lambda: UserTeamwork(
+                self.context, ResourcePath("teamwork", self.resource_path)
+            ),
         )
 
     @property
     def todo(self):
         # type: () -> Todo
         """Represents the To Do services available to a user."""
-        return self.properties.get(
-            "todo", Todo(self.context, ResourcePath("todo", self.resource_path))
+        return self._get_navigation_property(
+            "todo", lambda: Todo(self.context, ResourcePath("todo", self.resource_path))
         )
 
     @property
     def employee_experience(self):
         """Represents the To Do services available to a user."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "employeeExperience",
-            EmployeeExperienceUser(
+            lambda: EmployeeExperienceUser(
                 self.context, ResourcePath("employeeExperience", self.resource_path)
             ),
         )
@@ -0,0 +1,214 @@
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import requests
+from requests import HTTPError
+
+from office365.folder_uploader import RemoteFile
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.queries.client_query import ClientQuery
+
+if TYPE_CHECKING:
+    from office365.runtime.client_object_collection import ClientObjectCollection
+    from office365.runtime.client_runtime_context import ClientRuntimeContext
+
+T = TypeVar("T")
+
+
+class ExportedFile(object):
+    """A remote file to be written into the archive"""
+
+    def __init__(self, path, folder, entity, remote_file):
+        # type: (str, Any, Any, RemoteFile) -> None
+        """
+        :param str path: Path of the file relative to the exported folder, the name of the archive entry
+        :param Any folder: The remote folder containing the file
+        :param Any entity: The listed remote file
+        :param RemoteFile remote_file: Size and modification time of the file
+        """
+        self.path = path
+        self.folder = folder
+        self.entity = entity
+        self.remote_file = remote_file
+
+
+class BaseFolderExporter(Generic[T]):
+    """
+    Exports a remote folder tree into a zip archive:
+
+        - the remote tree is listed level by level, folders of a level are listed concurrently,
+          each of them page by page
+        - file contents are requested by a bounded pool of threads, while the archive is written by the
+          calling thread in the order the files were listed. Files up to small_file_size are read by the pool,
+          larger ones are streamed into their archive entry chunk by chunk, hence memory usage does not depend
+          on the size of files
+        - a single archive is kept open and every entry is written once
+
+    Subclasses bind the steps to a service, T is the type of a remote folder
+    """
+
+    def __init__(
+        self,
+        context,
+        source,
+        download_file,
+        max_workers=8,
+        recursive=True,
+        small_file_size=1024 * 1024,
+        chunk_size=1024 * 1024,
+        compression=zipfile.ZIP_DEFLATED,
+        file_downloaded=None,
+    ):
+        # type: (ClientRuntimeContext, T, IO, int, bool, int, int, int, Optional[Callable[[Any], None]]) -> None
+        """
+        :param ClientRuntimeContext context: Client context
+        :param T source: The remote folder
+        :param typing.IO download_file: File object the archive is written into, opened in binary mode,
+            it does not have to be seekable
+        :param int max_workers: Number of files requested at the same time, the pool size of the transport
+            should be at least twice as large, since up to 2 * max_workers responses are kept open
+        :param bool recursive: Determines whether to export sub folders
+        :param int small_file_size: Files larger than that are streamed into the archive
+        :param int chunk_size: Number of bytes read into memory at once
+        :param int compression: Compression method of archive entries, e.g. zipfile.ZIP_STORED
+        :param (Any)->None file_downloaded: Called with the remote file once it has been written
+        """
+        if max_workers < 1:
+            raise ValueError("Number of workers must be positive")
+        self._context = context
+        self._source = source
+        self._download_file = download_file
+        self._max_workers = max_workers
+        self._recursive = recursive
+        self._small_file_size = small_file_size
+        self._chunk_size = chunk_size
+        self._compression = compression
+        self._file_downloaded = file_downloaded
+
+    def execute(self):
+        # type: () -> List[str]
+        """Exports the folder, the export is executed immediately. Returns the paths of exported files"""
+        files = self._list()
+        with zipfile.ZipFile(self._download_file, "w", self._compression) as zf:
+            self._write_files(zf, files)
+        return [f.path for f in files]
+
+    def _list(self):
+        # type: () -> List[ExportedFile]
+        """Lists the remote tree, returns the files in the order they are written into the archive"""
+        files = []  # type: List[ExportedFile]
+        level = [("", self._source)]  # type: List[Tuple[str, T]]
+        while level:
+            listed = [
+                (path, folder, self._list_children(folder)) for path, folder in level
+            ]
+            self._context.execute_query(max_workers=self._max_workers)
+            level = []
+            for path, folder, collections in listed:
+                for collection in collections:
+                    for entity in collection:
+                        name, remote_file = self._get_remote_entry(entity)
+                        relative_path = "/".join(p for p in (path, name) if p)
+                        if remote_file is None:
+                            if self._recursive:
+                                level.append(
+                                    (relative_path, self._get_folder(folder, entity))
+                                )
+                            continue
+                        files.append(
+                            ExportedFile(relative_path, folder, entity, remote_file)
+                        )
+        return files
+
+    def _write_files(self, zf, files):
+        # type: (zipfile.ZipFile, List[ExportedFile]) -> None
+        pending = deque()  # type: Deque[Tuple[ExportedFile, Future]]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            try:
+                for exported_file in files:
+                    qry = self._get_content_query(
+                        exported_file.folder, exported_file.entity
+                    )
+                    request = self._context.build_request(qry)
+                    request.stream = True
+                    future = executor.submit(self._send, exported_file, request)
+                    pending.append((exported_file, future))
+                    if len(pending) >= self._max_workers * 2:
+                        self._write_file(zf, *pending.popleft())
+                while pending:
+                    self._write_file(zf, *pending.popleft())
+            finally:
+                for _, future in pending:
+                    future.cancel()
+                for _, future in pending:
+                    if not future.cancelled() and future.exception() is None:
+                        future.result().close()
+
+    def _send(self, exported_file, request):
+        # type: (ExportedFile, RequestOptions) -> requests.Response
+        """Requests the content of a file, runs in the pool. Content of a small file is read at once"""
+        response = self._context.pending_request().send(request)
+        size = exported_file.remote_file.size
+        if size is not None and size <= self._small_file_size:
+            # reads the body, so that the connection is released before the file is written
+            response.content
+        return response
+
+    def _write_file(self, zf, exported_file, future):
+        # type: (zipfile.ZipFile, ExportedFile, Future) -> None
+        """Writes the content of a file into its archive entry on the calling thread"""
+        try:
+            response = future.result()  # type: requests.Response
+        except HTTPError as e:
+            raise ClientRequestException(*e.args, response=e.response)
+        remote_file = exported_file.remote_file
+        modified = remote_file.modified or datetime.now()
+        if modified.year < 1980:
+            modified = datetime(1980, 1, 1)
+        zinfo = zipfile.ZipInfo(exported_file.path, modified.timetuple()[:6])
+        zinfo.compress_type = self._compression
+        # determines whether the entry requires ZIP64 extensions
+        zinfo.file_size = remote_file.size or 0
+        try:
+            with zf.open(zinfo, "w", force_zip64=remote_file.size is None) as entry:
+                for chunk in response.iter_content(chunk_size=self._chunk_size):
+                    entry.write(chunk)
+        finally:
+            response.close()
+        if callable(self._file_downloaded):
+            self._file_downloaded(exported_file.entity)
+
+    def _list_children(self, folder):
+        # type: (T) -> List[ClientObjectCollection]
+        """Queues the retrieval of the files and folders of a remote folder"""
+        raise NotImplementedError("_list_children")
+
+    def _get_remote_entry(self, entity):
+        # type: (Any) -> Tuple[str, Optional[RemoteFile]]
+        """Returns the name of a listed entity and its metadata, None for folders"""
+        raise NotImplementedError("_get_remote_entry")
+
+    def _get_folder(self, parent, entity):
+        # type: (T, Any) -> T
+        """Addresses a listed sub folder"""
+        raise NotImplementedError("_get_folder")
+
+    def _get_content_query(self, parent, entity):
+        # type: (T, Any) -> ClientQuery
+        """Returns the query of the content of a listed file"""
+        raise NotImplementedError("_get_content_query")
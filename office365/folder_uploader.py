@@ -0,0 +1,326 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import requests
+from requests import HTTPError
+
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.queries.client_query import ClientQuery
+
+if TYPE_CHECKING:
+    from office365.runtime.client_object_collection import ClientObjectCollection
+    from office365.runtime.client_runtime_context import ClientRuntimeContext
+
+T = TypeVar("T")
+
+
+class LocalFile(object):
+    """A file of the local folder"""
+
+    def __init__(self, path, folder, name):
+        # type: (str, str, str) -> None
+        """
+        :param str path: Local path
+        :param str folder: Path of the containing folder relative to the uploaded folder, "" for the root
+        :param str name: File name
+        """
+        stat = os.stat(path)
+        self.path = path
+        self.folder = folder
+        self.name = name
+        self.size = stat.st_size
+        self.modified = stat.st_mtime
+
+    @property
+    def relative_path(self):
+        # type: () -> str
+        return "/".join(p for p in (self.folder, self.name) if p)
+
+
+class RemoteFile(object):
+    """Metadata of an already uploaded file which determines whether it is up to date"""
+
+    def __init__(self, size, modified=None, hashes=None):
+        # type: (Optional[int], Optional[datetime], Any) -> None
+        """
+        :param int size: Size of the file
+        :param datetime or None modified: When the file was last modified
+        :param Any hashes: Hashes of the content as reported by the service
+        """
+        self.size = size
+        self.modified = modified
+        self.hashes = hashes
+
+
+class FolderUploadResult(object):
+    """Relative paths of the files and folders processed by an upload"""
+
+    def __init__(self):
+        self.created_folders = []  # type: List[str]
+        self.uploaded = []  # type: List[str]
+        self.skipped = []  # type: List[str]
+
+    def __repr__(self):
+        return "uploaded: {0}, skipped: {1}, created folders: {2}".format(
+            len(self.uploaded), len(self.skipped), len(self.created_folders)
+        )
+
+
+class BaseFolderUploader(Generic[T]):
+    """
+    Uploads a local folder tree into a remote folder:
+
+        - the local tree is scanned and the remote tree is listed level by level, folders of a level are
+          listed concurrently
+        - missing folders are created breadth-first, the folders of a level within batch requests
+        - files are uploaded by a bounded pool of threads. Requests are built and responses are processed
+          on the calling thread, the pool sends them. Small files are uploaded with a single request,
+          larger ones through an upload session
+        - files which are up to date remotely are skipped, so an interrupted upload is resumed by
+          running it once again
+
+    Subclasses bind the steps to a service, T is the type of a remote folder
+    """
+
+    def __init__(
+        self,
+        context,
+        target,
+        source_path,
+        max_workers=8,
+        large_file_size=4 * 1024 * 1024,
+        chunk_size=10 * 327680,
+        skip_unchanged=True,
+        batch_size=20,
+        file_uploaded=None,
+    ):
+        # type: (ClientRuntimeContext, T, str, int, int, int, bool, int, Optional[Callable[[Any], None]]) -> None
+        """
+        :param ClientRuntimeContext context: Client context
+        :param T target: The remote folder
+        :param str source_path: Path of the local folder
+        :param int max_workers: Number of files uploaded at the same time
+        :param int large_file_size: Files larger than that are uploaded through an upload session
+        :param int chunk_size: Size of a chunk uploaded into an upload session
+        :param bool skip_unchanged: Skips files which are up to date remotely
+        :param int batch_size: Number of folders created per batch request
+        :param (Any)->None file_uploaded: Called with the remote file once a file has been uploaded
+        """
+        if max_workers < 1:
+            raise ValueError("Number of workers must be positive")
+        self._context = context
+        self._target = target
+        self._source_path = source_path
+        self._max_workers = max_workers
+        self._large_file_size = large_file_size
+        self._chunk_size = chunk_size
+        self._skip_unchanged = skip_unchanged
+        self._batch_size = batch_size
+        self._file_uploaded = file_uploaded
+        self._folders = {"": target}  # type: Dict[str, T]
+
+    def execute(self):
+        # type: () -> FolderUploadResult
+        """Uploads the folder, the upload is executed immediately"""
+        result = FolderUploadResult()
+        levels, files = self._scan()
+        remote_files = {}  # type: Dict[str, RemoteFile]
+        existing = {""}
+        for level in levels:
+            self._create_folders([p for p in level if p not in existing], result)
+            existing = self._list_level(
+                [p for p in level if p in existing], remote_files
+            )
+        if not self._skip_unchanged:
+            remote_files.clear()
+        self._upload_files(files, remote_files, result)
+        return result
+
+    def _scan(self):
+        # type: () -> Tuple[List[List[str]], List[LocalFile]]
+        """Returns relative paths of local folders grouped by depth along with local files"""
+        levels = [[""]]  # type: List[List[str]]
+        files = []  # type: List[LocalFile]
+        queue = deque([("", self._source_path)])  # type: Deque[Tuple[str, str]]
+        while queue:
+            folder, path = queue.popleft()
+            depth = folder.count("/") + 1 if folder else 0
+            for entry in sorted(os.scandir(path), key=lambda e: e.name):
+                relative_path = "/".join(p for p in (folder, entry.name) if p)
+                if entry.is_dir():
+                    if len(levels) <= depth + 1:
+                        levels.append([])
+                    levels[depth + 1].append(relative_path)
+                    queue.append((relative_path, entry.path))
+                elif entry.is_file():
+                    files.append(LocalFile(entry.path, folder, entry.name))
+        return levels, files
+
+    def _list_level(self, paths, remote_files):
+        # type: (List[str], Dict[str, RemoteFile]) -> set
+        """
+        Lists remote folders which existed before the upload, returns the relative paths of
+        their sub folders. Remote files are collected into remote_files
+        """
+        existing = set()
+        listed = [(path, self._list_children(self._folders[path])) for path in paths]
+        if not listed:
+            return existing
+        self._context.execute_query(max_workers=self._max_workers)
+        for path, collections in listed:
+            for collection in collections:
+                for entity in collection:
+                    name, remote_file = self._get_remote_entry(entity)
+                    relative_path = "/".join(p for p in (path, name) if p)
+                    if remote_file is None:
+                        existing.add(relative_path)
+                        self._folders[relative_path] = self._get_folder(
+                            self._folders[path], name
+                        )
+                    else:
+                        remote_files[relative_path] = remote_file
+        return existing
+
+    def _create_folders(self, paths, result):
+        # type: (List[str], FolderUploadResult) -> None
+        if not paths:
+            return
+        for path in paths:
+            parent_path, _, name = path.rpartition("/")
+            self._folders[path] = self._create_folder(self._folders[parent_path], name)
+        self._execute_batch()
+        result.created_folders.extend(paths)
+
+    def _upload_files(self, files, remote_files, result):
+        # type: (List[LocalFile], Dict[str, RemoteFile], FolderUploadResult) -> None
+        pending = []  # type: List[Tuple[LocalFile, ClientQuery, Future]]
+        deferred = []  # type: List[LocalFile]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for local_file in files:
+                remote_file = remote_files.get(local_file.relative_path, None)
+                if remote_file is not None and remote_file.size != local_file.size:
+                    remote_file = None
+                folder = self._folders[local_file.folder]
+                upload = self._prepare_upload(folder, local_file)
+                if upload is None:
+                    deferred.append(local_file)
+                    continue
+                qry, request, send = upload
+                future = executor.submit(
+                    self._send_upload, local_file, remote_file, request, send
+                )
+                pending.append((local_file, qry, future))
+                if len(pending) >= self._max_workers * 2:
+                    pending = self._process_uploads(pending, result)
+            while pending:
+                pending = self._process_uploads(pending, result)
+        for local_file in deferred:
+            remote_file = remote_files.get(local_file.relative_path, None)
+            if remote_file is not None and self._is_unchanged(local_file, remote_file):
+                result.skipped.append(local_file.relative_path)
+                continue
+            uploaded = self._upload_large_file(
+                self._folders[local_file.folder], local_file
+            )
+            self._notify(uploaded, local_file, result)
+
+    def _send_upload(self, local_file, remote_file, request, send):
+        # type: (LocalFile, Optional[RemoteFile], RequestOptions, Callable[[RequestOptions, LocalFile], requests.Response]) -> Optional[requests.Response]
+        """Runs in the pool, returns None if the file is up to date"""
+        if remote_file is not None and self._is_unchanged(local_file, remote_file):
+            return None
+        return send(request, local_file)
+
+    def _process_uploads(self, pending, result):
+        # type: (List[Tuple[LocalFile, ClientQuery, Future]], FolderUploadResult, bool) -> List[Tuple[LocalFile, ClientQuery, Future]]
+        """Processes completed uploads on the calling thread and returns the ones still in progress"""
+        done, _ = wait([f for _, _, f in pending], return_when=FIRST_COMPLETED)
+        client_request = self._context.pending_request()
+        remaining = []
+        for local_file, qry, future in pending:
+            if future not in done:
+                remaining.append((local_file, qry, future))
+                continue
+            try:
+                response = future.result()  # type: Optional[requests.Response]
+                if response is None:
+                    result.skipped.append(local_file.relative_path)
+                    continue
+                self._context._current_query = qry
+                client_request.process_response(response, qry)
+                client_request.afterExecute.notify(response)
+            except HTTPError as e:
+                raise ClientRequestException(*e.args, response=e.response)
+            self._notify(qry.return_type, local_file, result)
+        return remaining
+
+    def _notify(self, uploaded, local_file, result):
+        # type: (Any, LocalFile, FolderUploadResult) -> None
+        result.uploaded.append(local_file.relative_path)
+        if callable(self._file_uploaded):
+            self._file_uploaded(uploaded)
+
+    def _send_content(self, request, local_file):
+        # type: (RequestOptions, LocalFile) -> requests.Response
+        """Sends a request whose body is the content of a file, runs in the pool"""
+        with open(local_file.path, "rb") as f:
+            request.data = f
+            return self._context.pending_request().send(request)
+
+    def _execute_batch(self):
+        # type: () -> None
+        """Submits the queued folders"""
+        self._context.execute_batch(self._batch_size)
+
+    def _list_children(self, folder):
+        # type: (T) -> List[ClientObjectCollection]
+        """Queues the retrieval of the files and folders of a remote folder"""
+        raise NotImplementedError("_list_children")
+
+    def _get_remote_entry(self, entity):
+        # type: (Any) -> Tuple[str, Optional[RemoteFile]]
+        """Returns the name of a listed entity and its metadata, None for folders"""
+        raise NotImplementedError("_get_remote_entry")
+
+    def _get_folder(self, parent, name):
+        # type: (T, str) -> T
+        """Addresses an existing remote folder"""
+        raise NotImplementedError("_get_folder")
+
+    def _create_folder(self, parent, name):
+        # type: (T, str) -> T
+        """Queues the creation of a remote folder"""
+        raise NotImplementedError("_create_folder")
+
+    def _prepare_upload(self, folder, local_file):
+        # type: (T, LocalFile) -> Optional[Tuple[ClientQuery, RequestOptions, Callable[[RequestOptions, LocalFile], requests.Response]]]
+        """
+        Builds the upload of a file on the calling thread, returns the query, its request and a function
+        sending the request from the pool. None defers the file to _upload_large_file
+        """
+        raise NotImplementedError("_prepare_upload")
+
+    def _upload_large_file(self, folder, local_file):
+        # type: (T, LocalFile) -> Any
+        """Uploads a file deferred by _prepare_upload on the calling thread"""
+        raise NotImplementedError("_upload_large_file")
+
+    def _is_unchanged(self, local_file, remote_file):
+        # type: (LocalFile, RemoteFile) -> bool
+        """Determines whether a remote file of the same size is up to date, runs in the pool"""
+        raise NotImplementedError("_is_unchanged")
@@ -251,19 +251,37 @@ class GraphClient(ClientRuntimeContext):
 
         :param int items_per_batch: Maximum to be selected for bulk operation
         """
-        batch_request = ODataV4BatchRequest(V4JsonFormat())
-        batch_request.beforeExecute += self._authenticate_request
+        batch_request = self._create_batch_request()
         while self.has_pending_request:
             qry = self._get_next_query(items_per_batch)
             batch_request.execute_query(qry)
         return self
 
+    async def execute_batch_async(self, items_per_batch=100):
+        """Constructs and submit a batch request without blocking the event loop
+
+        :param int items_per_batch: Maximum to be selected for bulk operation
+        """
+        batch_request = self._create_batch_request()
+        while self.has_pending_request:
+            qry = self._get_next_query(items_per_batch)
+            await self._execute_async(batch_request, [qry])
+        return self
+
+    def _create_batch_request(self):
+        # type: () -> ODataV4BatchRequest
+        batch_request = ODataV4BatchRequest(V4JsonFormat(), self.transport)
+        batch_request.beforeExecute += self._authenticate_request
+        batch_request.unauthorized += self._reauthenticate_request
+        return batch_request
+
     def pending_request(self):
         # type: () -> ODataRequest
         if self._pending_request is None:
-            self._pending_request = ODataRequest(V4JsonFormat())
+            self._pending_request = ODataRequest(V4JsonFormat(), self.transport)
             self._pending_request.beforeExecute += self._authenticate_request
             self._pending_request.beforeExecute += self._build_specific_query
+            self._pending_request.unauthorized += self._reauthenticate_request
         return self._pending_request
 
     def service_root_url(self):
@@ -285,6 +303,13 @@ class GraphClient(ClientRuntimeContext):
         token = TokenResponse.from_json(token_json)
         request.ensure_header("Authorization", "Bearer {0}".format(token.accessToken))
 
+    def _reauthenticate_request(self, request):
+        # type: (RequestOptions) -> None
+        """Acquires the token once again after it has been rejected"""
+        token_json = self._acquire_token_callback()
+        token = TokenResponse.from_json(token_json)
+        request.set_header("Authorization", "Bearer {0}".format(token.accessToken))
+
     @property
     def admin(self):
         """A container for administrator functionality for SharePoint and OneDrive."""
@@ -10,8 +10,10 @@ import requests
 from typing_extensions import Self
 
 from office365.base_item import BaseItem
+from office365.delta_collection import DeltaCollection
 from office365.delta_path import DeltaPath
 from office365.entity_collection import EntityCollection
+from office365.folder_uploader import FolderUploadResult
 from office365.onedrive.analytics.item_activity_stat import ItemActivityStat
 from office365.onedrive.analytics.item_analytics import ItemAnalytics
 from office365.onedrive.driveitems.audio import Audio
@@ -49,11 +51,14 @@ from office365.runtime.client_result import ClientResult
 from office365.runtime.client_value_collection import ClientValueCollection
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.segmented_download import SegmentedDownload
 from office365.runtime.odata.v4.upload_session import UploadSession
 from office365.runtime.odata.v4.upload_session_request import UploadSessionRequest
 from office365.runtime.paths.resource_path import ResourcePath
+from office365.runtime.queries.client_query import ClientQuery
 from office365.runtime.queries.create_entity import CreateEntityQuery
 from office365.runtime.queries.function import FunctionQuery
+from office365.runtime.queries.read_entity import ReadEntityQuery
 from office365.runtime.queries.service_operation import ServiceOperationQuery
 from office365.runtime.queries.upload_session import UploadSessionQuery
 from office365.subscriptions.collection import SubscriptionCollection
@@ -230,8 +235,15 @@ class DriveItem(BaseItem):
         self.context.add_query(qry)
         return self
 
-    def resumable_upload(self, source_path, chunk_size=2000000, chunk_uploaded=None):
-        # type: (str, int, Optional[Callable[[int], None]]) -> "DriveItem"
+    def resumable_upload(
+        self,
+        source_path,
+        chunk_size=3276800,
+        chunk_uploaded=None,
+        upload_url=None,
+        session_created=None,
+    ):
+        # type: (str, int, Optional[Callable[[int], None]], Optional[str], Optional[Callable[[str], None]]) -> "DriveItem"
         """
         Create an upload session to allow your app to upload files up to the maximum file size.
         An upload session allows your app to upload ranges of the file in sequential API requests,
@@ -243,24 +255,59 @@ class DriveItem(BaseItem):
 
         :param chunk_uploaded:
         :param str source_path: File path
-        :param int chunk_size: chunk size
+        :param int chunk_size: chunk size, a multiple of 320 KiB (327,680 bytes)
+        :param str or None upload_url: The url of an existing upload session, the upload resumes from the ranges
+            the session is missing instead of creating a new one
+        :param (str)->None session_created: Called with the url of a created session before the upload starts,
+            persist it in order to resume an interrupted upload
         """
+        UploadSessionRequest.validate_chunk_size(chunk_size)
 
-        def _start_upload(result):
-            # type: (ClientResult[UploadSession]) -> None
+        def _upload(url, start):
+            # type: (str, Optional[int]) -> None
             with open(source_path, "rb") as local_file:
                 session_request = UploadSessionRequest(
-                    local_file, chunk_size, chunk_uploaded
+                    local_file, chunk_size, chunk_uploaded, self.context.transport
                 )
-                session_request.execute_query(qry)
+                session_request.upload(url, start)
+
+        def _start_upload(result):
+            # type: (ClientResult[UploadSession]) -> None
+            if callable(session_created):
+                session_created(result.value.uploadUrl)
+            _upload(result.value.uploadUrl, 0)
+
+        def _resume_upload(result):
+            # type: (ClientResult[UploadSession]) -> None
+            ranges = [r.split("-")[0] for r in result.value.nextExpectedRanges]
+            if ranges:
+                _upload(upload_url, min(int(r) for r in ranges))
+
+        def _construct_status_request(request):
+            # type: (RequestOptions) -> None
+            # the session url is pre-authenticated
+            request.url = upload_url
+            request.headers.pop("Authorization", None)
 
         file_name = os.path.basename(source_path)
         return_type = DriveItem(self.context, UrlPath(file_name, self.resource_path))
 
-        qry = UploadSessionQuery(
-            return_type, {"item": DriveItemUploadableProperties(name=file_name)}
-        )
-        self.context.add_query(qry).after_query_execute(_start_upload)
+        if upload_url is None:
+            qry = UploadSessionQuery(
+                return_type, {"item": DriveItemUploadableProperties(name=file_name)}
+            )
+            self.context.add_query(qry).after_query_execute(_start_upload)
+        else:
+            qry = ClientQuery(
+                self.context,
+                return_type,
+                None,
+                None,
+                ClientResult(self.context, UploadSession()),
+            )
+            self.context.add_query(qry).before_query_execute(
+                _construct_status_request
+            ).after_query_execute(_resume_upload)
         return return_type
 
     def create_upload_session(self, item):
@@ -333,6 +380,29 @@ class DriveItem(BaseItem):
         _upload_folder(path, self)
         return self
 
+    def bulk_upload_folder(
+        self, source_path, max_workers=8, skip_unchanged=True, file_uploaded=None
+    ):
+        # type: (str, int, bool, Optional[Callable[["DriveItem"], None]]) -> FolderUploadResult
+        """
+        Uploads a local folder tree into the folder with a pool of workers, files which are up to date
+        (the same size and content hash) are skipped. Unlike upload_folder, the upload is executed immediately
+
+        :param str source_path: Path of the local folder
+        :param int max_workers: Number of files uploaded at the same time
+        :param bool skip_unchanged: Skips files which are up to date
+        :param (DriveItem)->None file_uploaded: Called once a file has been uploaded
+        """
+        from office365.onedrive.driveitems.folder_uploader import DriveFolderUploader
+
+        return DriveFolderUploader(
+            self,
+            source_path,
+            max_workers=max_workers,
+            skip_unchanged=skip_unchanged,
+            file_uploaded=file_uploaded,
+        ).execute()
+
     def get_content(self, format_name=None):
         # type: (Optional[str]) -> ClientResult[AnyStr]
         """
@@ -364,49 +434,27 @@ class DriveItem(BaseItem):
         return self
 
     def download_folder(
-        self, download_file, after_file_downloaded=None, recursive=True
+        self, download_file, after_file_downloaded=None, recursive=True, max_workers=8
     ):
-        # type: (IO, Callable[[File], None], bool) -> "DriveItem"
+        # type: (IO, Callable[["DriveItem"], None], bool, int) -> "DriveItem"
         """
-        Download the folder content
-        """
-        import zipfile
-
-        def _after_file_downloaded(drive_item, base_path, result):
-            # type: ("DriveItem", str, ClientResult[AnyStr]) -> None
-            with zipfile.ZipFile(download_file.name, "a", zipfile.ZIP_DEFLATED) as zf:
-                zip_path = (
-                    "/".join([base_path, drive_item.name])
-                    if base_path is not None
-                    else drive_item.name
-                )
-                zf.writestr(zip_path, result.value)
-                if callable(after_file_downloaded):
-                    after_file_downloaded(drive_item)
-
-        def _after_folder_downloaded(parent_item, base_path=None):
-            # type: ("DriveItem", str) -> None
-            for drive_item in parent_item.children:
-                if drive_item.is_file:
-                    drive_item.get_content().after_execute(
-                        partial(_after_file_downloaded, drive_item, base_path)
-                    )
-                else:
-                    if recursive:
-                        if base_path is None:
-                            next_base_path = str(drive_item.name)
-                        else:
-                            next_base_path = "/".join([base_path, drive_item.name])
-                        _download_folder(drive_item, next_base_path)
-
-        def _download_folder(drive_item, prev_result=None):
-            # type: ("DriveItem", str) -> None
-            drive_item.ensure_properties(
-                ["children", "name"],
-                partial(_after_folder_downloaded, drive_item, prev_result),
-            )
+        Downloads the folder content into a zip archive, see DriveFolderExporter.
+        The download is executed immediately
 
-        _download_folder(self)
+        :param typing.IO download_file: File object the archive is written into
+        :param (DriveItem)->None after_file_downloaded: Called once a file has been written
+        :param bool recursive: Determines whether to traverse folders recursively
+        :param int max_workers: Number of files downloaded at the same time
+        """
+        from office365.onedrive.driveitems.folder_exporter import DriveFolderExporter
+
+        DriveFolderExporter(
+            self,
+            download_file,
+            max_workers=max_workers,
+            recursive=recursive,
+            file_downloaded=after_file_downloaded,
+        ).execute()
         return self
 
     def download_session(
@@ -441,6 +489,46 @@ class DriveItem(BaseItem):
         self.context.after_execute(_process_response)
         return self
 
+    def download_segmented(
+        self,
+        path,
+        max_workers=4,
+        segment_size=8 * 1024 * 1024,
+        chunk_downloaded=None,
+        verify=True,
+    ):
+        # type: (str, int, int, Optional[Callable[[int], None]], bool) -> Self
+        """
+        Downloads the content into a local file as concurrent range requests, see SegmentedDownload.
+        An interrupted download is resumed once started again, as long as the content has not changed.
+
+        :param str path: Path of the local file
+        :param int max_workers: Number of ranges downloaded at the same time
+        :param int segment_size: Size of a range requested at once
+        :param (int)->None or None chunk_downloaded: Called with the number of bytes downloaded
+        :param bool verify: Compares the downloaded file against the hash the drive reports
+        """
+
+        def _download(return_type):
+            # type: (DriveItem) -> None
+            current_query = self.context.current_query
+            request = self.context.build_request(FunctionQuery(self, "content"))
+            self.context._current_query = current_query
+            download = SegmentedDownload(
+                self.context.pending_request(),
+                request,
+                self.properties.get("size", 0),
+                self.properties.get("cTag", self.etag),
+                segment_size,
+                max_workers,
+                chunk_downloaded=chunk_downloaded,
+            )
+            download.download(path, self.file.hashes.matches if verify else None)
+
+        qry = ReadEntityQuery(self, ["size", "file", "cTag", "eTag"])
+        self.context.add_query(qry).after_query_execute(_download)
+        return self
+
     def create_folder(self, name, conflict_behavior=ConflictBehavior.Rename):
         # type: (str, Optional[ConflictBehavior]) -> "DriveItem"
         """Create a new folder or DriveItem in a Drive with a specified parent item or path.
@@ -779,27 +867,33 @@ class DriveItem(BaseItem):
         """Collection containing Item objects for the immediate children of Item. Only items representing folders
         have children.
         """
-        return self.properties.get(
+        return self._get_navigation_property(
             "children",
-            EntityCollection(self.context, DriveItem, ChildrenPath(self.resource_path)),
+            lambda: EntityCollection(
+                self.context, DriveItem, ChildrenPath(self.resource_path)
+            ),
         )
 
     @property
     def listItem(self):
         # type: () -> ListItem
         """For drives in SharePoint, the associated document library list item."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "listItem",
-            ListItem(self.context, ResourcePath("listItem", self.resource_path)),
+            lambda: ListItem(
+                self.context, ResourcePath("listItem", self.resource_path)
+            ),
         )
 
     @property
     def workbook(self):
         # type: () -> Workbook
         """For files that are Excel spreadsheets, accesses the workbook API to work with the spreadsheet's contents."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "workbook",
-            Workbook(self.context, ResourcePath("workbook", self.resource_path)),
+            lambda: Workbook(
+                self.context, ResourcePath("workbook", self.resource_path)
+            ),
         )
 
     @property
@@ -813,9 +907,9 @@ class DriveItem(BaseItem):
     def permissions(self):
         # type: () -> PermissionCollection
         """The set of permissions for the item. Read-only. Nullable."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "permissions",
-            PermissionCollection(
+            lambda: PermissionCollection(
                 self.context, ResourcePath("permissions", self.resource_path)
             ),
         )
@@ -824,9 +918,9 @@ class DriveItem(BaseItem):
     def retention_label(self):
         # type: () -> ItemRetentionLabel
         """Information about retention label and settings enforced on the driveItem."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "retentionLabel",
-            ItemRetentionLabel(
+            lambda: ItemRetentionLabel(
                 self.context, ResourcePath("retentionLabel", self.resource_path)
             ),
         )
@@ -856,9 +950,9 @@ class DriveItem(BaseItem):
         # type: () -> EntityCollection[DriveItemVersion]
         """The list of previous versions of the item. For more info, see getting previous versions.
         Read-only. Nullable."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "versions",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context,
                 DriveItemVersion,
                 ResourcePath("versions", self.resource_path),
@@ -870,9 +964,9 @@ class DriveItem(BaseItem):
         # type: () -> EntityCollection[ThumbnailSet]
         """Collection containing ThumbnailSet objects associated with the item. For more info, see getting thumbnails.
         Read-only. Nullable."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "thumbnails",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context,
                 ThumbnailSet,
                 ResourcePath("thumbnails", self.resource_path),
@@ -883,27 +977,31 @@ class DriveItem(BaseItem):
     def analytics(self):
         # type: () -> ItemAnalytics
         """Analytics about the view activities that took place on this item."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "analytics",
-            ItemAnalytics(self.context, ResourcePath("analytics", self.resource_path)),
+            lambda: ItemAnalytics(
+                self.context, ResourcePath("analytics", self.resource_path)
+            ),
         )
 
     @property
     def delta(self):
-        # type: () -> EntityCollection[DriveItem]
+        # type: () -> DeltaCollection[DriveItem]
         """This method allows your app to track changes to a drive item and its children over time."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "delta",
-            EntityCollection(self.context, DriveItem, DeltaPath(self.resource_path)),
+            lambda: DeltaCollection(
+                self.context, DriveItem, DeltaPath(self.resource_path)
+            ),
         )
 
     @property
     def subscriptions(self):
         # type: () -> SubscriptionCollection
         """The set of subscriptions on the driveItem."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "subscriptions",
-            SubscriptionCollection(
+            lambda: SubscriptionCollection(
                 self.context, ResourcePath("subscriptions", self.resource_path)
             ),
         )
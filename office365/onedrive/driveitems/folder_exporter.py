@@ -0,0 +1,62 @@
+from typing import IO, TYPE_CHECKING, Callable, List, Optional, Tuple
+
+from office365.folder_exporter import BaseFolderExporter
+from office365.folder_uploader import RemoteFile
+from office365.runtime.client_object_collection import ClientObjectCollection
+from office365.runtime.queries.client_query import ClientQuery
+from office365.runtime.queries.function import FunctionQuery
+
+if TYPE_CHECKING:
+    from office365.onedrive.driveitems.driveItem import DriveItem
+
+
+class DriveFolderExporter(BaseFolderExporter["DriveItem"]):
+    """
+    Exports a drive folder tree into a zip archive, see BaseFolderExporter.
+    Listed files and folders are addressed by their ids
+    """
+
+    def __init__(
+        self,
+        source,
+        download_file,
+        max_workers=8,
+        recursive=True,
+        small_file_size=1024 * 1024,
+        chunk_size=1024 * 1024,
+        file_downloaded=None,
+    ):
+        # type: (DriveItem, IO, int, bool, int, int, Optional[Callable[[DriveItem], None]]) -> None
+        super(DriveFolderExporter, self).__init__(
+            source.context,
+            source,
+            download_file,
+            max_workers,
+            recursive,
+            small_file_size,
+            chunk_size,
+            file_downloaded=file_downloaded,
+        )
+
+    def _list_children(self, folder):
+        # type: (DriveItem) -> List[ClientObjectCollection]
+        children = folder.children.select(
+            ["id", "name", "size", "file", "folder", "lastModifiedDateTime"]
+        )
+        return [children.get_all()]
+
+    def _get_remote_entry(self, entity):
+        # type: (DriveItem) -> Tuple[str, Optional[RemoteFile]]
+        if not entity.is_file:
+            return entity.name, None
+        return entity.name, RemoteFile(
+            entity.properties.get("size", None), entity.last_modified_datetime
+        )
+
+    def _get_folder(self, parent, entity):
+        # type: (DriveItem, DriveItem) -> DriveItem
+        return entity
+
+    def _get_content_query(self, parent, entity):
+        # type: (DriveItem, DriveItem) -> ClientQuery
+        return FunctionQuery(entity, "content")
@@ -0,0 +1,115 @@
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import requests
+
+from office365.folder_uploader import BaseFolderUploader, LocalFile, RemoteFile
+from office365.onedrive.driveitems.conflict_behavior import ConflictBehavior
+from office365.onedrive.driveitems.uploadable_properties import (
+    DriveItemUploadableProperties,
+)
+from office365.onedrive.files.hashes import Hashes
+from office365.onedrive.internal.paths.url import UrlPath
+from office365.runtime.client_object_collection import ClientObjectCollection
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.odata.v4.upload_session_request import UploadSessionRequest
+from office365.runtime.queries.client_query import ClientQuery
+from office365.runtime.queries.service_operation import ServiceOperationQuery
+from office365.runtime.queries.upload_session import UploadSessionQuery
+
+if TYPE_CHECKING:
+    from office365.onedrive.driveitems.driveItem import DriveItem
+
+
+class DriveFolderUploader(BaseFolderUploader["DriveItem"]):
+    """
+    Uploads a local folder tree into a drive folder, see BaseFolderUploader.
+
+    Files up to large_file_size (the simple upload API accepts up to 4MB) are uploaded with a single request,
+    larger ones through an upload session. A remote file is considered up to date when its size and content
+    hash (quickXorHash, sha256Hash or sha1Hash, whichever the drive reports) match the local file.
+    """
+
+    def __init__(
+        self,
+        target,
+        source_path,
+        max_workers=8,
+        large_file_size=4 * 1024 * 1024,
+        chunk_size=10 * 327680,
+        skip_unchanged=True,
+        batch_size=20,
+        file_uploaded=None,
+    ):
+        UploadSessionRequest.validate_chunk_size(chunk_size)
+        super(DriveFolderUploader, self).__init__(
+            target.context,
+            target,
+            source_path,
+            max_workers,
+            large_file_size,
+            chunk_size,
+            skip_unchanged,
+            batch_size,
+            file_uploaded,
+        )
+
+    def _list_children(self, folder):
+        # type: (DriveItem) -> List[ClientObjectCollection]
+        children = folder.children.select(["id", "name", "size", "file", "folder"])
+        return [children.get_all()]
+
+    def _get_remote_entry(self, entity):
+        # type: (DriveItem) -> Tuple[str, Optional[RemoteFile]]
+        if entity.is_folder:
+            return entity.name, None
+        return entity.name, RemoteFile(
+            entity.properties.get("size", None), hashes=entity.file.hashes
+        )
+
+    def _get_folder(self, parent, name):
+        # type: (DriveItem, str) -> DriveItem
+        return parent.get_by_path(name)
+
+    def _create_folder(self, parent, name):
+        # type: (DriveItem, str) -> DriveItem
+        return parent.create_folder(name, ConflictBehavior.Fail)
+
+    def _prepare_upload(self, folder, local_file):
+        # type: (DriveItem, LocalFile) -> Tuple[ClientQuery, RequestOptions, callable]
+        from office365.onedrive.driveitems.driveItem import DriveItem
+
+        return_type = DriveItem(
+            self._context, UrlPath(local_file.name, folder.resource_path)
+        )
+        if local_file.size <= self._large_file_size:
+            qry = ServiceOperationQuery(
+                return_type, "content", None, None, None, return_type
+            )
+            request = self._context.build_request(qry)
+            request.method = HttpMethod.Put
+            return qry, request, self._send_content
+
+        session_qry = UploadSessionQuery(
+            return_type,
+            {"item": DriveItemUploadableProperties(name=local_file.name)},
+        )
+        request = self._context.build_request(session_qry)
+        # the response to the last range is the uploaded drive item
+        qry = ClientQuery(self._context, return_type, None, None, return_type)
+        return qry, request, self._send_session
+
+    def _send_session(self, request, local_file):
+        # type: (RequestOptions, LocalFile) -> requests.Response
+        response = self._context.pending_request().send(request)
+        upload_url = response.json()["uploadUrl"]
+        with open(local_file.path, "rb") as f:
+            session_request = UploadSessionRequest(
+                f, self._chunk_size, None, self._context.transport
+            )
+            return session_request.upload(upload_url, 0)
+
+    def _is_unchanged(self, local_file, remote_file):
+        # type: (LocalFile, RemoteFile) -> bool
+        hashes = remote_file.hashes  # type: Hashes
+        return bool(hashes.matches(local_file.path, self._chunk_size))
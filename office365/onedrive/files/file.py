@@ -1,3 +1,4 @@
+from office365.onedrive.files.hashes import Hashes
 from office365.runtime.client_value import ClientValue
 
 
@@ -13,9 +14,9 @@ class File(ClientValue):
         """
         :param str mime_type: The MIME type for the file. This is determined by logic on the server and might not be
             the value provided when the file was uploaded. Read-only.
-        :param str hashes: Hashes of the file's binary content, if available. Read-only.
+        :param Hashes hashes: Hashes of the file's binary content, if available. Read-only.
         """
         super(File, self).__init__()
-        self.hashes = hashes
+        self.hashes = hashes if hashes is not None else Hashes()
         self.mimeType = mime_type
         self.processingMetadata = None
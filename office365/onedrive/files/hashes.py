@@ -1,5 +1,52 @@
+import hashlib
+from typing import Optional
+
+from office365.onedrive.files.quick_xor_hash import QuickXorHash
 from office365.runtime.client_value import ClientValue
 
+HASH_FUNCTIONS = (
+    ("quickXorHash", QuickXorHash, lambda h: h.base64digest()),
+    ("sha256Hash", hashlib.sha256, lambda h: h.hexdigest().upper()),
+    ("sha1Hash", hashlib.sha1, lambda h: h.hexdigest().upper()),
+)
+"""Hashes a drive reports, in the order of preference"""
+
 
 class Hashes(ClientValue):
     """The Hashes resource groups available hashes into a single structure for an item."""
+
+    def __init__(
+        self, crc32_hash=None, quick_xor_hash=None, sha1_hash=None, sha256_hash=None
+    ):
+        """
+        :param str crc32_hash: The CRC32 value of the file in little endian (if available).
+        :param str quick_xor_hash: A proprietary hash of the file that can be used to determine if the contents
+            of the file have changed (if available).
+        :param str sha1_hash: SHA1 hash for the contents of the file (if available).
+        :param str sha256_hash: SHA256 hash for the contents of the file (if available).
+        """
+        super(Hashes, self).__init__()
+        self.crc32Hash = crc32_hash
+        self.quickXorHash = quick_xor_hash
+        self.sha1Hash = sha1_hash
+        self.sha256Hash = sha256_hash
+
+    def matches(self, path, chunk_size=1024 * 1024):
+        # type: (str, int) -> Optional[bool]
+        """
+        Compares the content of a local file against the first available hash of HASH_FUNCTIONS,
+        returns None if no hash is available
+
+        :param str path: Path of the local file
+        :param int chunk_size: Number of bytes read into memory at once
+        """
+        for name, hash_type, digest in HASH_FUNCTIONS:
+            expected = getattr(self, name, None)
+            if not expected:
+                continue
+            h = hash_type()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(chunk_size), b""):
+                    h.update(chunk)
+            return digest(h) == expected
+        return None
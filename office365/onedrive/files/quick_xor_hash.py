@@ -0,0 +1,64 @@
+import base64
+from typing import Optional
+
+_WIDTH_IN_BITS = 160
+_SHIFT = 11
+_MASK = (1 << _WIDTH_IN_BITS) - 1
+_COLUMNS_MASK = (1 << (_WIDTH_IN_BITS * 8)) - 1
+_BLOCK_SIZE = _WIDTH_IN_BITS * 4096
+"""Data is folded in blocks whose size is a multiple of the hash width"""
+
+
+class QuickXorHash(object):
+    """
+    The hash of file content OneDrive for Business and SharePoint report as quickXorHash, with hashlib-like
+    interface.
+
+    Every byte is XORed into a 160-bit register at a position advanced by 11 bits per byte, hence bytes
+    whose offsets are congruent modulo 160 land on the same position. Those are XORed together first, as
+    integers spanning whole blocks, and placed into the register at once.
+    """
+
+    name = "quickxorhash"
+    digest_size = _WIDTH_IN_BITS // 8
+
+    def __init__(self, data=None):
+        # type: (Optional[bytes]) -> None
+        self._columns = 0
+        self._length = 0
+        self._pending = b""
+        if data:
+            self.update(data)
+
+    def update(self, data):
+        # type: (bytes) -> None
+        """Hashes more data, offsets are tracked across calls"""
+        if not data:
+            return
+        self._length += len(data)
+        data = self._pending + bytes(data)
+        aligned = len(data) - len(data) % _WIDTH_IN_BITS
+        self._pending = data[aligned:]
+        for i in range(0, aligned, _BLOCK_SIZE):
+            self._columns ^= int.from_bytes(
+                data[i : min(i + _BLOCK_SIZE, aligned)], "little"
+            )
+
+    def digest(self):
+        # type: () -> bytes
+        columns = self._columns ^ int.from_bytes(self._pending, "little")
+        folded = 0
+        while columns:
+            folded ^= columns & _COLUMNS_MASK
+            columns >>= _WIDTH_IN_BITS * 8
+        register = 0
+        for i in range(_WIDTH_IN_BITS):
+            value = ((folded >> (8 * i)) & 0xFF) << (_SHIFT * i % _WIDTH_IN_BITS)
+            register ^= (value & _MASK) ^ (value >> _WIDTH_IN_BITS)
+        register ^= (self._length & 0xFFFFFFFFFFFFFFFF) << (_WIDTH_IN_BITS - 64)
+        return register.to_bytes(self.digest_size, "little")
+
+    def base64digest(self):
+        # type: () -> str
+        """The digest in the format of quickXorHash property"""
+        return base64.b64encode(self.digest()).decode("ascii")
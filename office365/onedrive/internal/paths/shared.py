@@ -20,6 +20,7 @@ class SharedPath(EntityPath):
         self._key = "items"
         self._parent = ResourcePath(key, ResourcePath("drives"))
         self.__class__ = ResourcePath
+        self._invalidate()
         return self
 
     @property
@@ -5,6 +5,17 @@ from office365.runtime.client_value import ClientValue
 class ItemReference(ClientValue):
     """The ItemReference resource provides information necessary to address a DriveItem via the API."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "path",
+        "driveId",
+        "driveType",
+        "siteId",
+        "sharepointIds",
+        "shareId",
+    )
+
     def __init__(
         self,
         _id=None,
@@ -4,6 +4,8 @@ from office365.runtime.client_value import ClientValue
 class EmailAddress(ClientValue):
     """The name and email address of a contact or message recipient."""
 
+    __slots__ = ("address", "name")
+
     def __init__(self, address=None, name=None):
         """
         :param str address: The email address of the person or entity.
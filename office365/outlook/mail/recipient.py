@@ -5,6 +5,8 @@ from office365.runtime.client_value import ClientValue
 class Recipient(ClientValue):
     """Represents information about a user in the sending or receiving end of an event, message or group post."""
 
+    __slots__ = ("emailAddress",)
+
     def __init__(self, email_address=None):
         """
         :param EmailAddress email_address: The recipient's email address.
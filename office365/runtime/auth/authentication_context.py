@@ -1,10 +1,12 @@
 import json
 import sys
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from typing_extensions import Required, TypedDict
 
+from office365.runtime.auth.cached_credential import CachedCredential
 from office365.runtime.auth.client_credential import ClientCredential
+from office365.runtime.auth.credential_store import CredentialStore
 from office365.runtime.auth.providers.acs_token_provider import ACSTokenProvider
 from office365.runtime.auth.providers.saml_token_provider import SamlTokenProvider
 from office365.runtime.auth.token_response import TokenResponse
@@ -37,7 +39,9 @@ class AuthenticationContext(object):
         """
         self.url = url.rstrip("/")
         self._authenticate = None
-        self._cached_token = None
+        self._reauthenticate = None
+        self._credential = None  # type: Optional[CachedCredential]
+        self._credential_store = None  # type: Optional[CredentialStore]
 
     def with_client_certificate(
         self,
@@ -87,7 +91,10 @@ class AuthenticationContext(object):
             result = app.acquire_token_for_client(scopes)
             return TokenResponse.from_json(result)
 
-        self.with_access_token(_acquire_token)
+        self.with_access_token(
+            _acquire_token,
+            "msal:certificate:{0}:{1}:{2}".format(tenant, client_id, " ".join(scopes)),
+        )
         return self
 
     def with_interactive(self, tenant, client_id, scopes=None):
@@ -116,7 +123,10 @@ class AuthenticationContext(object):
             result = app.acquire_token_interactive(scopes=scopes)
             return TokenResponse.from_json(result)
 
-        self.with_access_token(_acquire_token)
+        self.with_access_token(
+            _acquire_token,
+            "msal:interactive:{0}:{1}:{2}".format(tenant, client_id, " ".join(scopes)),
+        )
         return self
 
     def with_device_flow(self, tenant, client_id, scopes=None):
@@ -152,25 +162,55 @@ class AuthenticationContext(object):
             result = app.acquire_token_by_device_flow(flow)
             return TokenResponse.from_json(result)
 
-        self.with_access_token(_acquire_token)
+        self.with_access_token(
+            _acquire_token,
+            "msal:device_flow:{0}:{1}:{2}".format(tenant, client_id, " ".join(scopes)),
+        )
         return self
 
-    def with_access_token(self, token_func):
-        # type: (Callable[[], JSONToken]) -> None
+    def with_credential_store(self, store):
+        # type: (CredentialStore) -> "AuthenticationContext"
         """
-        Initializes a client to acquire a token from a callback
+        Shares acquired tokens and authentication cookies with other processes via a persistent store,
+        so that a process loads a valid credential instead of acquiring it once again
+
+        :param CredentialStore store: Credential store, e.g. FileCredentialStore
+        """
+        self._credential_store = store
+        if self._credential is not None:
+            self._credential.store = store
+        return self
+
+    def with_access_token(self, token_func, cache_key=None):
+        # type: (Callable[[], JSONToken], Optional[str]) -> None
+        """
+        Initializes a client to acquire a token from a callback.
+        The token is renewed once it is about to expire (see TokenResponse.expiresOn) or gets rejected
 
         :param () -> dict token_func: A token callback
+        :param str or None cache_key: Identifies the token in a credential store, e.g. tenant, client and resource.
+             Tokens without a key are not persisted
         """
+        token_cache = CachedCredential(
+            token_func, key=cache_key, value_type=TokenResponse
+        )
+        self._set_credential(token_cache)
 
         def _authenticate(request):
-            if self._cached_token is None:
-                self._cached_token = token_func()
             request.set_header(
-                "Authorization", _get_authorization_header(self._cached_token)
+                "Authorization", _get_authorization_header(token_cache.get())
             )
 
+        def _reauthenticate(request):
+            token = token_cache.value
+            if token is not None and request.headers.get(
+                "Authorization"
+            ) == _get_authorization_header(token):
+                token_cache.invalidate(token)
+            _authenticate(request)
+
         self._authenticate = _authenticate
+        self._reauthenticate = _reauthenticate
 
     def with_credentials(self, credentials, **kwargs):
         """
@@ -201,11 +241,16 @@ class AuthenticationContext(object):
                 )
         else:
             raise ValueError("Unknown credential type")
+        self._set_credential(getattr(provider, "credential", None))
 
         def _authenticate(request):
             provider.authenticate_request(request)
 
+        def _reauthenticate(request):
+            provider.reauthenticate_request(request)
+
         self._authenticate = _authenticate
+        self._reauthenticate = _reauthenticate
 
     def acquire_token_for_user(self, username, password, browser_mode=False):
         """
@@ -217,11 +262,16 @@ class AuthenticationContext(object):
         :param bool browser_mode:
         """
         provider = SamlTokenProvider(self.url, username, password, browser_mode)
+        self._set_credential(provider.credential)
 
         def _authenticate(request):
             provider.authenticate_request(request)
 
+        def _reauthenticate(request):
+            provider.reauthenticate_request(request)
+
         self._authenticate = _authenticate
+        self._reauthenticate = _reauthenticate
         return self
 
     def acquire_token_for_app(self, client_id, client_secret):
@@ -234,16 +284,36 @@ class AuthenticationContext(object):
         :param str client_secret: Secret string that the application uses to prove its identity when requesting a token
         """
         provider = ACSTokenProvider(self.url, client_id, client_secret)
+        self._set_credential(provider.credential)
 
         def _authenticate(request):
             provider.authenticate_request(request)
 
+        def _reauthenticate(request):
+            provider.reauthenticate_request(request)
+
         self._authenticate = _authenticate
+        self._reauthenticate = _reauthenticate
         return self
 
+    def _set_credential(self, credential):
+        # type: (Optional[CachedCredential]) -> None
+        self._credential = credential
+        if credential is not None:
+            credential.store = self._credential_store
+
     def authenticate_request(self, request):
         # type: (RequestOptions) -> None
         """Authenticate request"""
         if self._authenticate is None:
             raise ValueError("Authentication credentials are missing or invalid")
         self._authenticate(request)
+
+    def reauthenticate_request(self, request):
+        # type: (RequestOptions) -> None
+        """
+        Renews credentials which have been rejected by the server (HTTP 401) and authenticates the request again.
+        When credentials could not be renewed the request is left as is
+        """
+        if self._reauthenticate is not None:
+            self._reauthenticate(request)
@@ -13,3 +13,12 @@ class AuthenticationProvider(object):
         :type request: office365.runtime.http.request_options.RequestOptions
         """
         pass
+
+    def reauthenticate_request(self, request):
+        """
+        Renews credentials which have been rejected by the server and authenticates the request again.
+        Providers which are unable to renew credentials leave the request as is
+
+        :type request: office365.runtime.http.request_options.RequestOptions
+        """
+        pass
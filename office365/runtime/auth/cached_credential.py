@@ -0,0 +1,153 @@
+import threading
+import time
+from typing import Any, Callable, Generic, Optional, Type, TypeVar
+
+import office365.logger
+from office365.runtime.auth.credential_store import CredentialStore
+
+T = TypeVar("T")
+
+
+def get_expires_on(value):
+    # type: (Any) -> Optional[float]
+    """Returns the absolute expiry (POSIX timestamp) of an access token or authentication cookies"""
+    return getattr(value, "expiresOn", None)
+
+
+class CachedCredential(Generic[T], office365.logger.LoggerContext):
+    """
+    Keeps an acquired credential (an access token or authentication cookies) and renews it ahead of expiry.
+
+    Once the credential enters the refresh window it is renewed in a background thread while callers keep on
+    using the current one. Only when it is about to expire callers wait for the renewal. At most a single
+    acquisition is in flight at a time no matter how many threads share the credential.
+
+    When a credential store is assigned, credentials are shared with other processes as well: a credential
+    acquired by one process is loaded by the rest instead of being acquired again.
+    """
+
+    def __init__(
+        self,
+        acquire_func,
+        refresh_margin=300,
+        expiry_margin=30,
+        key=None,
+        value_type=None,
+    ):
+        # type: (Callable[[], T], float, float, Optional[str], Optional[Type[T]]) -> None
+        """
+        :param () -> T acquire_func: Acquires a new credential
+        :param float refresh_margin: Number of seconds before expiry when the credential is renewed in background
+        :param float expiry_margin: Number of seconds before expiry when the credential is no longer handed out
+        :param str or None key: Identifies the credential in a credential store,
+             credentials without a key are never persisted
+        :param type or None value_type: Type of credential which provides to_json and from_json methods
+        """
+        self._acquire_func = acquire_func
+        self._refresh_margin = refresh_margin
+        self._expiry_margin = expiry_margin
+        self._key = key
+        self._value_type = value_type
+        self.store = None  # type: Optional[CredentialStore]
+        self._value = None  # type: Optional[T]
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    @property
+    def value(self):
+        # type: () -> Optional[T]
+        """The current credential, if any, without renewing it"""
+        return self._value
+
+    def get(self):
+        # type: () -> T
+        """Returns a valid credential, acquiring or renewing it if needed"""
+        value = self._value
+        ttl = self._get_ttl(value)
+        if value is None or (ttl is not None and ttl <= self._expiry_margin):
+            with self._lock:
+                value = self._value
+                ttl = self._get_ttl(value)
+                if value is None or (ttl is not None and ttl <= self._expiry_margin):
+                    value = self._value = self._acquire(self._expiry_margin)
+        elif ttl is not None and ttl <= self._refresh_margin:
+            self._refresh_in_background()
+        return value
+
+    def invalidate(self, value):
+        # type: (T) -> None
+        """
+        Drops the credential once it has been rejected by the server. Nothing is dropped if it has been
+        renewed already, e.g. by another thread
+
+        :param T value: The rejected credential
+        """
+        with self._lock:
+            if self._value is value:
+                self._value = None
+            if self._is_persisted:
+                with self.store.lock(self._key):
+                    if self.store.get(self._key) == value.to_json():
+                        self.store.remove(self._key)
+
+    def _refresh_in_background(self):
+        # type: () -> None
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        thread = threading.Thread(target=self._refresh)
+        thread.daemon = True
+        thread.start()
+
+    def _refresh(self):
+        # type: () -> None
+        try:
+            with self._lock:
+                ttl = self._get_ttl(self._value)
+                if ttl is not None and ttl <= self._refresh_margin:
+                    self._value = self._acquire(self._refresh_margin)
+        except Exception as e:
+            # the credential is still valid, it is acquired synchronously once it is about to expire
+            self.logger(self._refresh.__name__).warning(
+                "Failed to renew credential: %s", e
+            )
+        finally:
+            self._refreshing = False
+
+    @property
+    def _is_persisted(self):
+        # type: () -> bool
+        return self.store is not None and self._key is not None
+
+    def _acquire(self, margin):
+        # type: (float) -> T
+        """
+        Loads the credential from the store unless it expires within the margin, otherwise acquires a new one.
+        The store stays locked meanwhile, so that other processes wait for the credential instead of acquiring it
+        """
+        if not self._is_persisted:
+            return self._acquire_func()
+        with self.store.lock(self._key):
+            json = self.store.get(self._key)
+            if json is not None:
+                value = self._value_type.from_json(json)
+                ttl = self._get_ttl(value)
+                if ttl is None or ttl > margin:
+                    return value
+            value = self._acquire_func()
+            self.store.set(self._key, value.to_json(), get_expires_on(value))
+            return value
+
+    @staticmethod
+    def _get_ttl(value):
+        # type: (Optional[T]) -> Optional[float]
+        """Returns the number of seconds the credential remains valid, None if unknown"""
+        expires_on = get_expires_on(value)
+        if expires_on is None:
+            return None
+        return expires_on - time.time()
+
+    def __deepcopy__(self, memo):
+        """Copies of a context keep on sharing the credential"""
+        return self
@@ -0,0 +1,233 @@
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+
+class CredentialStore(object):
+    """
+    Persistent store of acquired credentials (access tokens and authentication cookies)
+    which is shared between processes, e.g. workers of a pool
+    """
+
+    def get(self, key):
+        # type: (str) -> Optional[Dict[str, Any]]
+        """
+        Returns the credential stored under the key or None if it is missing or has expired
+
+        :param str key: Identifies the credential, e.g. the flow along with tenant, client and resource
+        """
+        raise NotImplementedError("get")
+
+    def set(self, key, value, expires_on=None):
+        # type: (str, Dict[str, Any], Optional[float]) -> None
+        """
+        Stores the credential
+
+        :param str key: Identifies the credential
+        :param dict value: JSON representation of the credential
+        :param float or None expires_on: The time (in seconds since epoch) when the credential expires
+        """
+        raise NotImplementedError("set")
+
+    def remove(self, key):
+        # type: (str) -> None
+        """Removes the credential stored under the key"""
+        raise NotImplementedError("remove")
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        # type: (str) -> Iterator[None]
+        """
+        Exclusive access to the credential across processes, so that only one of them acquires it
+        while others wait for the result
+        """
+        yield
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class FileCredentialStore(CredentialStore):
+    """
+    Stores credentials in a local file encrypted with Fernet (AES-128-CBC with HMAC-SHA256).
+    Concurrent access from multiple processes is serialized by means of an OS-level file lock.
+
+    Unless an encryption key is provided, a key is generated once and saved next to the store with permissions
+    granted to the owner only. For stronger protection pass a key kept in a secret store instead.
+    """
+
+    def __init__(self, path=None, encryption_key=None):
+        # type: (Optional[str], Optional[bytes]) -> None
+        """
+        :param str or None path: Path to the store file, defaults to ~/.office365/credentials.bin
+        :param bytes or None encryption_key: URL-safe base64-encoded 32-byte key,
+             see FileCredentialStore.generate_key
+        """
+        if path is None:
+            path = os.path.join(
+                os.path.expanduser("~"), ".office365", "credentials.bin"
+            )
+        self._path = path
+        self._encryption_key = encryption_key
+        self._fernet = None
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+
+    @staticmethod
+    def generate_key():
+        # type: () -> bytes
+        """Generates a new encryption key"""
+        return _get_fernet_type().generate_key()
+
+    @property
+    def path(self):
+        # type: () -> str
+        return self._path
+
+    def get(self, key):
+        # type: (str) -> Optional[Dict[str, Any]]
+        entry = self._read().get(self._hash_key(key), None)
+        if entry is None or self._is_expired(entry):
+            return None
+        from cryptography.fernet import InvalidToken
+
+        try:
+            return json.loads(self.fernet.decrypt(entry["data"].encode("ascii")))
+        except InvalidToken:
+            # encrypted with another key
+            return None
+
+    def set(self, key, value, expires_on=None):
+        # type: (str, Dict[str, Any], Optional[float]) -> None
+        with self.lock(key):
+            entries = {k: v for k, v in self._read().items() if not self._is_expired(v)}
+            data = self.fernet.encrypt(json.dumps(value).encode("utf-8"))
+            entries[self._hash_key(key)] = {
+                "expiresOn": expires_on,
+                "data": data.decode("ascii"),
+            }
+            self._write(entries)
+
+    def remove(self, key):
+        # type: (str) -> None
+        with self.lock(key):
+            entries = self._read()
+            if entries.pop(self._hash_key(key), None) is not None:
+                self._write(entries)
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        # type: (str) -> Iterator[None]
+        """
+        Locks the whole store, the lock is reentrant within a process
+        """
+        with self._thread_lock:
+            if self._lock_depth > 0:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            self._ensure_dir()
+            with open(self._path + ".lock", "a+b") as f:
+                _lock_file(f)
+                self._lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth = 0
+                    _unlock_file(f)
+
+    @property
+    def fernet(self):
+        if self._fernet is None:
+            if self._encryption_key is None:
+                self._encryption_key = self._load_or_create_key()
+            self._fernet = _get_fernet_type()(self._encryption_key)
+        return self._fernet
+
+    def _load_or_create_key(self):
+        # type: () -> bytes
+        key_path = self._path + ".key"
+        self._ensure_dir()
+        try:
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except OSError:
+            # the key has been created already, possibly by another process
+            with open(key_path, "rb") as f:
+                return f.read().strip()
+        key = self.generate_key()
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        return key
+
+    def _read(self):
+        # type: () -> Dict[str, Dict[str, Any]]
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _write(self, entries):
+        # type: (Dict[str, Dict[str, Any]]) -> None
+        """Replaces the file atomically, so that readers never observe a partially written store"""
+        tmp_path = "{0}.{1}.tmp".format(self._path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self._path)
+
+    def _ensure_dir(self):
+        # type: () -> None
+        folder = os.path.dirname(os.path.abspath(self._path))
+        if not os.path.isdir(folder):
+            os.makedirs(folder, mode=0o700, exist_ok=True)
+
+    @staticmethod
+    def _hash_key(key):
+        # type: (str) -> str
+        """Keys contain user and client names, only their digests are written to disk"""
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _is_expired(entry):
+        # type: (Dict[str, Any]) -> bool
+        expires_on = entry.get("expiresOn", None)
+        return expires_on is not None and expires_on <= time.time()
+
+
+def _get_fernet_type():
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        raise ImportError(
+            "To use encrypted credential store the package 'cryptography' needs to be installed."
+        )
+    return Fernet
+
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -4,6 +4,7 @@ import requests
 
 import office365.logger
 from office365.runtime.auth.authentication_provider import AuthenticationProvider
+from office365.runtime.auth.cached_credential import CachedCredential
 from office365.runtime.auth.token_response import TokenResponse
 from office365.runtime.compat import urlparse
 from office365.runtime.http.request_options import RequestOptions
@@ -26,18 +27,38 @@ class ACSTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
         self.SharePointPrincipal = "00000003-0000-0ff1-ce00-000000000000"
         self._client_id = client_id
         self._client_secret = client_secret
-        self._cached_token = None
         self._environment = environment
+        self._token_cache = CachedCredential(
+            self.get_app_only_access_token,
+            key="acs:{0}:{1}:{2}".format(
+                environment, urlparse(url).hostname, client_id
+            ),
+            value_type=TokenResponse,
+        )  # type: CachedCredential[TokenResponse]
+
+    @property
+    def credential(self):
+        # type: () -> CachedCredential[TokenResponse]
+        """Cached access token"""
+        return self._token_cache
 
     def authenticate_request(self, request):
         # type: (RequestOptions) -> None
-        self.ensure_app_only_access_token()
-        request.set_header("Authorization", self._get_authorization_header())
+        token = self._token_cache.get()
+        request.set_header("Authorization", self._get_authorization_header(token))
+
+    def reauthenticate_request(self, request):
+        # type: (RequestOptions) -> None
+        token = self._token_cache.value
+        if token is not None and request.headers.get(
+            "Authorization"
+        ) == self._get_authorization_header(token):
+            self._token_cache.invalidate(token)
+        self.authenticate_request(request)
 
     def ensure_app_only_access_token(self):
-        if self._cached_token is None:
-            self._cached_token = self.get_app_only_access_token()
-        return self._cached_token and self._cached_token.is_valid
+        token = self._token_cache.get()
+        return token is not None and token.is_valid
 
     def get_app_only_access_token(self):
         """Retrieves an app-only access token from ACS"""
@@ -117,8 +138,11 @@ class ACSTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
                 )
             )
 
-    def _get_authorization_header(self):
-        return "Bearer {0}".format(self._cached_token.accessToken)
+    def _get_authorization_header(self, token=None):
+        # type: (Optional[TokenResponse]) -> str
+        if token is None:
+            token = self._token_cache.get()
+        return "Bearer {0}".format(token.accessToken)
 
     def get_last_error(self):
         return self.error
@@ -8,6 +8,7 @@ import requests.utils
 
 import office365.logger
 from office365.runtime.auth.authentication_provider import AuthenticationProvider
+from office365.runtime.auth.cached_credential import CachedCredential
 from office365.runtime.auth.sts_profile import STSProfile
 from office365.runtime.auth.user_realm_info import UserRealmInfo
 
@@ -39,6 +40,27 @@ def is_valid_auth_cookies(values):
     )
 
 
+class AuthCookies(dict):
+    """Authentication cookies along with the time they expire"""
+
+    def __init__(self, values, expires_on=None):
+        """
+        :param dict values: Cookie names and values
+        :param float or None expires_on: The time (in seconds since epoch) when the first of the cookies expires
+        """
+        super(AuthCookies, self).__init__(values)
+        self.expiresOn = expires_on
+
+    def to_json(self):
+        # type: () -> dict
+        return {"values": dict(self), "expiresOn": self.expiresOn}
+
+    @staticmethod
+    def from_json(value):
+        # type: (dict) -> AuthCookies
+        return AuthCookies(value["values"], value.get("expiresOn", None))
+
+
 class SamlTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
     def __init__(self, url, username, password, browser_mode, environment="commercial"):
         """
@@ -60,7 +82,13 @@ class SamlTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
         self.error = ""
         self._username = username
         self._password = password
-        self._cached_auth_cookies = None
+        self._cookies_cache = CachedCredential(
+            self.get_authentication_cookie,
+            key="saml:{0}:{1}:{2}".format(
+                environment, self._sts_profile.tenant, username.lower()
+            ),
+            value_type=AuthCookies,
+        )  # type: CachedCredential[AuthCookies]
         self.__ns_prefixes = {
             "S": "{http://www.w3.org/2003/05/soap-envelope}",
             "s": "{http://www.w3.org/2003/05/soap-envelope}",
@@ -77,30 +105,49 @@ class SamlTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
         for key in self.__ns_prefixes.keys():
             ElementTree.register_namespace(key, self.__ns_prefixes[key][1:-1])
 
+    @property
+    def credential(self):
+        # type: () -> CachedCredential[AuthCookies]
+        """Cached authentication cookies"""
+        return self._cookies_cache
+
     def authenticate_request(self, request):
         """
         Authenticate request handler
         """
         logger = self.logger(self.authenticate_request.__name__)
-        self.ensure_authentication_cookie()
-        logger.debug_secrets(self._cached_auth_cookies)
-        cookie_header_value = "; ".join(
-            [
-                "=".join([key, str(val)])
-                for key, val in self._cached_auth_cookies.items()
-            ]
-        )
-        request.set_header("Cookie", cookie_header_value)
+        cookies = self._cookies_cache.get()
+        logger.debug_secrets(cookies)
+        request.set_header("Cookie", self._get_cookie_header(cookies))
+
+    def reauthenticate_request(self, request):
+        """
+        Acquires new authentication cookies once the current ones have been rejected
+        """
+        cookies = self._cookies_cache.value
+        if cookies is not None and request.headers.get(
+            "Cookie"
+        ) == self._get_cookie_header(cookies):
+            self._cookies_cache.invalidate(cookies)
+        self.authenticate_request(request)
 
     def ensure_authentication_cookie(self):
-        if self._cached_auth_cookies is None:
-            self._cached_auth_cookies = self.get_authentication_cookie()
+        self._cookies_cache.get()
         return True
 
+    @staticmethod
+    def _get_cookie_header(cookies):
+        # type: (dict) -> str
+        return "; ".join(["=".join([key, str(val)]) for key, val in cookies.items()])
+
     def get_authentication_cookie(self):
         """Acquire authentication cookie"""
         logger = self.logger(self.ensure_authentication_cookie.__name__)
         logger.debug("get_authentication_cookie called")
+        # the security token request is valid for a short period only, renewals need fresh timestamps
+        self._sts_profile = STSProfile(
+            self._sts_profile.authorityUrl, self._environment
+        )
 
         try:
             logger.debug("Acquiring Access Token..")
@@ -310,7 +357,12 @@ class SamlTokenProvider(AuthenticationProvider, office365.logger.LoggerContext):
             )
             logger.error(self.error)
             raise ValueError(self.error)
-        return cookies
+        expiry_times = [
+            c.expires
+            for c in session.cookies
+            if c.name in ("FedAuth", "rtFa", "SPOIDCRL") and c.expires is not None
+        ]
+        return AuthCookies(cookies, min(expiry_times) if expiry_times else None)
 
     @staticmethod
     def _prepare_request_from_template(template_name, params):
@@ -1,14 +1,51 @@
+import time
+
+
 class TokenResponse(object):
     def __init__(self, access_token=None, token_type=None, **kwargs):
         self.accessToken = access_token
         self.tokenType = token_type
         for key, value in kwargs.items():
             setattr(self, key, value)
+        self.expiresOn = self._resolve_expires_on(
+            kwargs.get("expiresOn", None), kwargs.get("expiresIn", None)
+        )
 
     @property
     def is_valid(self):
         return self.accessToken is not None and self.tokenType == "Bearer"
 
+    @property
+    def is_expired(self):
+        # type: () -> bool
+        """Determines whether the token has expired, a token without expiry never does"""
+        return self.expiresOn is not None and self.expiresOn <= time.time()
+
+    @staticmethod
+    def _resolve_expires_on(expires_on, expires_in):
+        """
+        Resolves the absolute expiry (POSIX timestamp) of a token
+
+        :param str or int or float or None expires_on: The time when the token expires in seconds since epoch
+        :param str or int or float or None expires_in: The number of seconds the token is valid for
+        """
+        if expires_on is not None:
+            try:
+                return float(expires_on)
+            except (TypeError, ValueError):
+                pass
+        if expires_in is not None:
+            try:
+                return time.time() + float(expires_in)
+            except (TypeError, ValueError):
+                pass
+        return None
+
+    def to_json(self):
+        # type: () -> dict
+        """Serializes the token, the result is accepted by from_json"""
+        return dict(vars(self))
+
     @staticmethod
     def from_json(value):
         error = value.get("error", None)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING, Any, Callable, Generic, List, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Optional, TypeVar
 
 from requests import Response
 from typing_extensions import Self
@@ -23,6 +23,9 @@ T = TypeVar("T")
 P_T = TypeVar("P_T")
 """Property Type."""
 
+_PLAIN_PROPERTY, _DATETIME_PROPERTY, _TYPED_PROPERTY = range(3)
+"""Kinds of entity properties, see ClientObject._resolve_property_kind"""
+
 
 class ClientObject(Generic[T]):
     def __init__(self, context, resource_path=None, parent_collection=None):
@@ -30,7 +33,7 @@ class ClientObject(Generic[T]):
         """Base client object which define named properties and relationships of an entity."""
         self._properties = {}
         self._ser_property_names = []
-        self._query_options = QueryOptions()
+        self._query_options = None  # type: Optional[QueryOptions]
         self._parent_collection = parent_collection
         self._context = context
         self._entity_type_name = None
@@ -45,7 +48,7 @@ class ClientObject(Generic[T]):
             if k not in self._ser_property_names
         }
         self._ser_property_names = []
-        self._query_options = QueryOptions()
+        self._query_options = None
         return self
 
     def execute_query(self):
@@ -54,6 +57,12 @@ class ClientObject(Generic[T]):
         self.context.execute_query()
         return self
 
+    async def execute_query_async(self):
+        # type: () -> Self
+        """Submit request(s) to the server without blocking the event loop."""
+        await self.context.execute_query_async()
+        return self
+
     def execute_query_retry(
         self, max_retry=5, timeout_secs=5, success_callback=None, failure_callback=None
     ):
@@ -143,13 +152,39 @@ class ClientObject(Generic[T]):
             default_value = getattr(self, normalized_name, None)
         return self._properties.get(name, default_value)
 
+    def _get_navigation_property(self, name, factory):
+        # type: (str, Callable[[], P_T]) -> P_T
+        """
+        Gets navigation property value. Unlike properties.get(name, default) the default object
+        (along with its resource path) is constructed only when the property has not been retrieved or set
+
+        :param str name: A property name
+        :param () -> P_T factory: Constructs the default object
+        """
+        if name in self._properties:
+            return self._properties[name]
+        return factory()
+
     def set_property(self, name, value, persist_changes=True):
         # type: (str|int, P_T, bool) -> Self
         """Sets property value"""
         if persist_changes:
             self._ser_property_names.append(name)
 
-        typed_value = self.get_property(name)
+        if name not in self._properties:
+            kind = type(self)._get_property_kinds().get(name, None)
+            if kind is None:
+                typed_value = self.get_property(name)
+                self._resolve_property_kind(name, typed_value)
+            elif kind == _PLAIN_PROPERTY or not isinstance(value, (list, dict)):
+                if kind == _DATETIME_PROPERTY:
+                    value = ODataType.try_parse_datetime(value)
+                self._properties[name] = value
+                return self
+            else:
+                typed_value = self.get_property(name)
+        else:
+            typed_value = self.get_property(name)
         if isinstance(typed_value, (ClientObject, ClientValue)):
             if isinstance(value, list):
                 [
@@ -172,6 +207,30 @@ class ClientObject(Generic[T]):
                 self._properties[name] = value
         return self
 
+    @classmethod
+    def _get_property_kinds(cls):
+        # type: () -> Dict[str, int]
+        """Returns the registry of property kinds which is built up once per entity type"""
+        kinds = cls.__dict__.get("_property_kinds", None)
+        if kinds is None:
+            kinds = {}
+            setattr(cls, "_property_kinds", kinds)
+        return kinds
+
+    def _resolve_property_kind(self, name, default_value):
+        # type: (str|int, Any) -> None
+        """
+        Registers the kind of property by its default value, so that once known, scalar values are assigned
+        without instantiating defaults (e.g. navigation properties) per every object and property
+        """
+        if isinstance(default_value, (ClientObject, ClientValue)):
+            kind = _TYPED_PROPERTY
+        elif isinstance(default_value, datetime.datetime):
+            kind = _DATETIME_PROPERTY
+        else:
+            kind = _PLAIN_PROPERTY
+        type(self)._get_property_kinds()[name] = kind
+
     def ensure_property(self, name, action, *args, **kwargs):
         # type: (str, Callable[..., None], Optional[Any], Optional[Any]) -> Self
         """Ensures if property is loaded"""
@@ -228,6 +287,10 @@ class ClientObject(Generic[T]):
 
     @property
     def query_options(self):
+        # type: () -> QueryOptions
+        """Query options are created once requested, most of materialized objects never use them"""
+        if self._query_options is None:
+            self._query_options = QueryOptions()
         return self._query_options
 
     @property
@@ -1,12 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Generic, Iterator, List, Optional, Type, TypeVar
 
+from requests import HTTPError
 from typing_extensions import Self
 
 from office365.runtime.client_object import ClientObject
+from office365.runtime.client_request_exception import ClientRequestException
 from office365.runtime.client_runtime_context import ClientRuntimeContext
 from office365.runtime.http.request_options import RequestOptions
 from office365.runtime.odata.json_format import ODataJsonFormat
 from office365.runtime.paths.resource_path import ResourcePath
+from office365.runtime.queries.read_entity import ReadEntityQuery
 from office365.runtime.types.event_handler import EventHandler
 
 T = TypeVar("T")
@@ -21,8 +25,11 @@ class ClientObjectCollection(ClientObject, Generic[T]):
         self._item_type = item_type
         self._page_loaded = EventHandler(False)
         self._paged_mode = False
+        self._streamed_mode = False
+        self._item_loaded = EventHandler(False)
         self._current_pos = None
         self._next_request_url = None
+        self._delta_request_url = None
         self._parent = parent
 
     def clear_state(self):
@@ -30,6 +37,7 @@ class ClientObjectCollection(ClientObject, Generic[T]):
         if not self._paged_mode:
             self._data = []
         self._next_request_url = None
+        self._delta_request_url = None
         self._current_pos = len(self._data)
         return self
 
@@ -57,13 +65,21 @@ class ClientObjectCollection(ClientObject, Generic[T]):
         # type: (str | int, dict, bool) -> Self
         if key == "__nextLinkUrl":
             self._next_request_url = value
+        elif key == "__deltaLinkUrl":
+            self._delta_request_url = value
         else:
             client_object = self.create_typed_object()
-            self.add_child(client_object)
+            notify = len(self._item_loaded) > 0
+            if notify:
+                client_object._parent_collection = self
+            else:
+                self.add_child(client_object)
             [
                 client_object.set_property(k, v, persist_changes)
                 for k, v in value.items()
             ]
+            if notify:
+                self._item_loaded.notify(client_object)
         return self
 
     def add_child(self, client_object):
@@ -147,6 +163,20 @@ class ClientObjectCollection(ClientObject, Generic[T]):
             self.top(page_size)
         return self
 
+    def streamed(self, item_loaded=None):
+        # type: (Callable[[T], None]) -> Self
+        """
+        Materializes entities one at a time while the response is being received
+        instead of parsing the whole response first
+
+        :param (T) -> None item_loaded: When specified, every entity is passed to the callback instead of being
+            added into the collection, hence only a single entity is kept in memory at a time
+        """
+        self._streamed_mode = True
+        if callable(item_loaded):
+            self._item_loaded += item_loaded
+        return self
+
     def get(self):
         # type: () -> Self
 
@@ -169,6 +199,78 @@ class ClientObjectCollection(ClientObject, Generic[T]):
         self.paged(page_size, page_loaded).get().after_execute(_page_loaded)
         return self
 
+    def iter_pages(self, page_size=None, prefetch=True):
+        # type: (Optional[int], bool) -> Iterator[List[T]]
+        """
+        Retrieves the collection via server-driven paging and yields entities page by page.
+        Earlier pages are not kept in the collection, hence only a page of entities is kept in memory
+        unless the caller holds on to them
+
+        :param int or None page_size: Number of entities per page
+        :param bool prefetch: Requests the next page in a background thread while the current one is processed
+        """
+        return self._iter_pages(page_size, prefetch, False)
+
+    def iter_items(self, page_size=None, keep=False, prefetch=True):
+        # type: (Optional[int], bool, bool) -> Iterator[T]
+        """
+        Retrieves the collection via server-driven paging and yields entities one by one, see iter_pages
+
+        :param int or None page_size: Number of entities per page
+        :param bool keep: Adds retrieved entities into the collection as get_all does
+        :param bool prefetch: Requests the next page in a background thread while the current one is processed
+        """
+        for page in self._iter_pages(page_size, prefetch, keep):
+            for item in page:
+                yield item
+
+    def _iter_pages(self, page_size, prefetch, keep, start_url=None):
+        # type: (Optional[int], bool, bool, Optional[str]) -> Iterator[List[T]]
+        if page_size:
+            self.top(page_size)
+        client_request = self.context.pending_request()
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        paged_mode = self._paged_mode
+        self._paged_mode = keep
+        if keep:
+            self._data = []
+
+        def _send(url=None):
+            # type: (Optional[str]) -> tuple
+            qry = ReadEntityQuery(self)
+            request = self.context.build_request(qry)
+            if url is not None:
+                request.url = url
+            if executor is None:
+                return qry, client_request.send(request)
+            # the body is received by the background thread as well
+            request.stream = False
+            return qry, executor.submit(client_request.send, request)
+
+        try:
+            qry, response = _send(start_url)
+            while True:
+                try:
+                    if executor is not None:
+                        response = response.result()
+                    client_request.process_response(response, qry)
+                    client_request.afterExecute.notify(response)
+                except HTTPError as e:
+                    raise ClientRequestException(*e.args, response=e.response)
+                next_url = self._next_request_url
+                page = self.current_page
+                if not keep:
+                    self._data = []
+                if next_url is not None:
+                    qry, response = _send(next_url)
+                yield page
+                if next_url is None:
+                    break
+        finally:
+            self._paged_mode = paged_mode
+            if executor is not None:
+                executor.shutdown(wait=False)
+
     def _get_next(self):
         # type: () -> Self
         """Submit a request to retrieve next collection of items"""
@@ -231,12 +333,24 @@ class ClientObjectCollection(ClientObject, Generic[T]):
         # type: () -> ClientObject
         return self._parent
 
+    @property
+    def streamed_mode(self):
+        # type: () -> bool
+        """Determines whether entities are materialized while the response is being received"""
+        return self._streamed_mode
+
     @property
     def has_next(self):
         # type: () -> bool
         """"""
         return self._next_request_url is not None
 
+    @property
+    def delta_link(self):
+        # type: () -> Optional[str]
+        """The link to retrieve changes made since the last page of a delta query, if any"""
+        return self._delta_request_url
+
     @property
     def current_page(self):
         # type: () -> List[T]
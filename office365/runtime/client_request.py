@@ -1,22 +1,42 @@
 from abc import abstractmethod
+from typing import Optional
 
 import requests
 from requests import HTTPError
 
 from office365.runtime.client_request_exception import ClientRequestException
-from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.transport import HttpTransport, RequestsTransport
 from office365.runtime.queries.client_query import ClientQuery
 from office365.runtime.types.event_handler import EventHandler
 
 
 class ClientRequest(object):
-    def __init__(self):
+    def __init__(self, transport=None):
+        # type: (Optional[HttpTransport]) -> None
         """
         Abstract request client
+
+        :param HttpTransport or None transport: HTTP transport used to send requests
         """
         self.beforeExecute = EventHandler()
         self.afterExecute = EventHandler()
+        # notified once credentials of a request are rejected (HTTP 401), listeners renew them on the request
+        self.unauthorized = EventHandler()
+        self._transport = transport
+
+    @property
+    def transport(self):
+        # type: () -> HttpTransport
+        """HTTP transport used to send requests"""
+        if self._transport is None:
+            self._transport = RequestsTransport()
+        return self._transport
+
+    @transport.setter
+    def transport(self, value):
+        # type: (HttpTransport) -> None
+        self._transport = value
 
     @abstractmethod
     def build_request(self, query):
@@ -44,59 +64,33 @@ class ClientRequest(object):
         # type: (RequestOptions) -> requests.Response
         """Execute the client request"""
         self.beforeExecute.notify(request)
-        if request.method == HttpMethod.Post:
-            if request.is_bytes or request.is_file:
-                response = requests.post(
-                    url=request.url,
-                    headers=request.headers,
-                    data=request.data,
-                    auth=request.auth,
-                    verify=request.verify,
-                    proxies=request.proxies,
-                )
-            else:
-                response = requests.post(
-                    url=request.url,
-                    headers=request.headers,
-                    json=request.data,
-                    auth=request.auth,
-                    verify=request.verify,
-                    proxies=request.proxies,
-                )
-        elif request.method == HttpMethod.Patch:
-            response = requests.patch(
-                url=request.url,
-                headers=request.headers,
-                json=request.data,
-                auth=request.auth,
-                verify=request.verify,
-                proxies=request.proxies,
-            )
-        elif request.method == HttpMethod.Delete:
-            response = requests.delete(
-                url=request.url,
-                headers=request.headers,
-                auth=request.auth,
-                verify=request.verify,
-                proxies=request.proxies,
-            )
-        elif request.method == HttpMethod.Put:
-            response = requests.put(
-                url=request.url,
-                data=request.data,
-                headers=request.headers,
-                auth=request.auth,
-                verify=request.verify,
-                proxies=request.proxies,
-            )
-        else:
-            response = requests.get(
-                url=request.url,
-                headers=request.headers,
-                auth=request.auth,
-                verify=request.verify,
-                stream=request.stream,
-                proxies=request.proxies,
-            )
+        return self.send(request)
+
+    def send(self, request):
+        # type: (RequestOptions) -> requests.Response
+        """
+        Sends an already prepared request, the method is safe to be called from multiple threads.
+
+        Once the credentials are rejected the request is sent once more if listeners of unauthorized event
+        have renewed them
+        """
+        response = self.transport.send(request)
+        if self.should_reauthenticate(request, response):
+            response.close()
+            response = self.transport.send(request)
         response.raise_for_status()
         return response
+
+    def should_reauthenticate(self, request, response):
+        # type: (RequestOptions, requests.Response) -> bool
+        """
+        Notifies unauthorized listeners if the credentials of the request were rejected and
+        determines whether the request has to be sent again
+        """
+        if response.status_code != 401 or len(self.unauthorized) == 0:
+            return False
+        if request.is_file:
+            return False
+        headers = dict(request.headers)
+        self.unauthorized.notify(request)
+        return request.headers != headers
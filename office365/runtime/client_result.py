@@ -53,6 +53,12 @@ class ClientResult(Generic[T]):
         self._context.execute_query()
         return self
 
+    async def execute_query_async(self):
+        # type: () -> Self
+        """Submit request(s) to the server without blocking the event loop."""
+        await self._context.execute_query_async()
+        return self
+
     def execute_query_retry(
         self, max_retry=5, timeout_secs=5, success_callback=None, failure_callback=None
     ):
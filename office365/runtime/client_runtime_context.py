@@ -1,16 +1,23 @@
 import abc
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
-from typing import TYPE_CHECKING, AnyStr, Callable, List
+from typing import TYPE_CHECKING, AnyStr, Callable, List, Optional
 
 import requests
-from requests import Response
+from requests import HTTPError, Response
 from typing_extensions import Self
 
 from office365.runtime.client_request import ClientRequest
 from office365.runtime.client_request_exception import ClientRequestException
 from office365.runtime.client_result import ClientResult
+from office365.runtime.http.async_transport import (
+    AsyncHttpTransport,
+    HttpxAsyncTransport,
+)
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.transport import HttpTransport, RequestsTransport
 from office365.runtime.queries.client_query import ClientQuery
 from office365.runtime.queries.read_entity import ReadEntityQuery
 
@@ -22,6 +29,65 @@ class ClientRuntimeContext(object):
     def __init__(self):
         self._queries = []
         self._current_query = None
+        self._transport = None  # type: Optional[HttpTransport]
+        self._async_transport = None  # type: Optional[AsyncHttpTransport]
+        self._auto_batch_size = None  # type: Optional[int]
+        self._auto_batch_max_retry = 3
+
+    @property
+    def transport(self):
+        # type: () -> HttpTransport
+        """HTTP transport shared by all the requests submitted via this context"""
+        if self._transport is None:
+            self._transport = RequestsTransport()
+        return self._transport
+
+    @property
+    def async_transport(self):
+        # type: () -> AsyncHttpTransport
+        """HTTP transport used by execute_query_async"""
+        if self._async_transport is None:
+            self._async_transport = HttpxAsyncTransport()
+        return self._async_transport
+
+    def with_async_transport(self, transport):
+        # type: (AsyncHttpTransport) -> Self
+        """
+        Specifies HTTP transport used to submit requests from execute_query_async
+
+        :param AsyncHttpTransport transport: HTTP transport
+        """
+        self._async_transport = transport
+        return self
+
+    def with_transport(self, transport):
+        # type: (HttpTransport) -> Self
+        """
+        Specifies HTTP transport used to submit requests, for example a connection pool sized for a number of
+        worker threads: ctx.with_transport(RequestsTransport(pool_maxsize=32, timeout=(5, 60)))
+
+        :param HttpTransport transport: HTTP transport
+        """
+        self._transport = transport
+        request = self.pending_request()
+        if request is not None:
+            request.transport = transport
+        return self
+
+    def with_auto_batch(self, items_per_batch, max_retry=3):
+        # type: (int, int) -> Self
+        """
+        Enables automatic batching mode: execute_query groups pending queries into $batch requests of up to
+        items_per_batch queries without any changes to the calling code. A group is sent once it is full
+        or once the queue runs out of queries which could be batched. Callbacks are invoked per query in the order
+        queries were added, a throttled query is processed once its retry succeeds. Throttled sub-requests (429/503 inside a successful batch) are retried individually.
+
+        :param int items_per_batch: Maximum number of queries per batch, Microsoft Graph allows up to 20
+        :param int max_retry: Number of times a throttled query is retried
+        """
+        self._auto_batch_size = items_per_batch
+        self._auto_batch_max_retry = max_retry
+        return self
 
     @property
     def current_query(self):
@@ -166,13 +232,52 @@ class ClientRuntimeContext(object):
         request = RequestOptions(full_url)
         return self.pending_request().execute_request_direct(request)
 
-    def execute_query(self):
-        """Submit request(s) to the server"""
+    def execute_query(self, max_workers=None):
+        # type: (Optional[int]) -> Self
+        """
+        Submit request(s) to the server
+
+        :param int or None max_workers: Enables concurrent mode, where independent read queries are sent
+            at the same time using up to max_workers threads. Responses are still processed one by one in the
+            order the queries were added, so callbacks and current_query behave as in sequential mode.
+            The pool size of the transport should be at least max_workers
+        """
+        if self._auto_batch_size is not None:
+            return self._execute_auto_batch()
+
+        if max_workers is not None and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while self.has_pending_request:
+                    self._execute_concurrently(
+                        self._get_independent_queries(), executor
+                    )
+            return self
+
         while self.has_pending_request:
             qry = self._get_next_query()
             self.pending_request().execute_query(qry)
         return self
 
+    async def execute_query_async(self, max_concurrency=None):
+        # type: (Optional[int]) -> Self
+        """
+        Submit request(s) to the server without blocking the event loop. Queries, callbacks and entities
+        are the same as for execute_query, only the network round-trips are awaited.
+
+        Note: authentication handlers (token acquisition) still run synchronously
+
+        :param int or None max_concurrency: Enables concurrent mode, where up to max_concurrency
+            independent read queries are awaited at the same time, see execute_query
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or 1)
+        while self.has_pending_request:
+            if max_concurrency is not None and max_concurrency > 1:
+                queries = self._get_independent_queries()
+            else:
+                queries = [self._get_next_query()]
+            await self._execute_async(self.pending_request(), queries, semaphore)
+        return self
+
     def add_query(self, query):
         # type: (ClientQuery) ->Self
         self._queries.append(query)
@@ -204,6 +309,220 @@ class ClientRuntimeContext(object):
         )
         return return_type
 
+    @staticmethod
+    def _is_resolved(query):
+        # type: (ClientQuery) -> bool
+        """Determines whether the query addresses a resource which does not depend on a pending response"""
+        if query.binding_type is None:
+            return True
+        path = query.binding_type.resource_path
+        if path is None:
+            return False
+        segments = list(path)
+        # a root segment without delimiter (key or url addressing) has lost its parent
+        return segments[-1].delimiter is not None and all(
+            p._key is not None for p in segments
+        )
+
+    def _get_independent_queries(self):
+        # type: () -> List[ClientQuery]
+        """
+        Pops the queries which could be sent at the same time. Those are the leading read queries
+        addressing a resolved resource. Any other query (modifications, or reads of an entity whose path gets
+        resolved by the response of a previous query) is returned on its own, once everything added before it
+        has been processed. Queries added by callbacks land in the queue after the current ones.
+        """
+        from office365.runtime.queries.function import FunctionQuery
+
+        def _is_independent(query):
+            # type: (ClientQuery) -> bool
+            return type(query) in (
+                ReadEntityQuery,
+                FunctionQuery,
+            ) and self._is_resolved(query)
+
+        queries = [self._queries.pop(0)]
+        if _is_independent(queries[0]):
+            while self.has_pending_request and _is_independent(self._queries[0]):
+                queries.append(self._queries.pop(0))
+        return queries
+
+    def _get_batch_queries(self, count):
+        # type: (int) -> List[ClientQuery]
+        """
+        Pops up to count leading queries which could be submitted within a single batch. OData v4 batches keep
+        the order of queries by means of dependsOn, while OData v3 batches execute change sets first, hence
+        an OData v3 batch consists either of reads or of modifications only. A query addressing an entity
+        which is resolved by a response of a preceding query is held back for a later batch.
+        """
+        from office365.runtime.odata.v3.json_light_format import JsonLightFormat
+        from office365.runtime.queries.create_entity import CreateEntityQuery
+        from office365.runtime.queries.delete_entity import DeleteEntityQuery
+        from office365.runtime.queries.function import FunctionQuery
+        from office365.runtime.queries.service_operation import ServiceOperationQuery
+        from office365.runtime.queries.update_entity import UpdateEntityQuery
+
+        reads = (ReadEntityQuery, FunctionQuery)
+        changes = (CreateEntityQuery, UpdateEntityQuery, DeleteEntityQuery)
+        if isinstance(self.pending_request().json_format, JsonLightFormat):
+            kinds = [reads, changes]
+        else:
+            kinds = [reads + changes + (ServiceOperationQuery,)]
+
+        def _get_kind(query):
+            # type: (ClientQuery) -> Optional[int]
+            payload = query.parameters_type
+            if not self._is_resolved(query) or isinstance(payload, (bytes, str)):
+                return None
+            if hasattr(payload, "read"):
+                return None
+            return next((i for i, k in enumerate(kinds) if type(query) in k), None)
+
+        queries = [self._queries.pop(0)]
+        kind = _get_kind(queries[0])
+        if kind is not None:
+            while (
+                self.has_pending_request
+                and len(queries) < count
+                and _get_kind(self._queries[0]) == kind
+            ):
+                queries.append(self._queries.pop(0))
+        return queries
+
+    def _create_batch_request(self):
+        # type: () -> ClientRequest
+        """Creates a request which submits a BatchQuery"""
+        raise NotImplementedError("Batch requests are not supported")
+
+    def _execute_auto_batch(self):
+        # type: () -> Self
+        """Submits pending queries grouped into batches, see with_auto_batch"""
+        from office365.runtime.queries.batch import BatchQuery
+
+        client_request = self.pending_request()
+        batch_request = self._create_batch_request()
+        attempts = {}
+
+        def _can_retry(query, response):
+            # type: (ClientQuery, Response) -> bool
+            if response is None or response.status_code not in (429, 503):
+                return False
+            attempts[query.id] = attempts.get(query.id, 0) + 1
+            return attempts[query.id] <= self._auto_batch_max_retry
+
+        while self.has_pending_request:
+            queries = self._get_batch_queries(self._auto_batch_size)
+            if len(queries) == 1:
+                self._current_query = queries[0]
+                client_request.execute_query(queries[0])
+                continue
+
+            batch_qry = BatchQuery(self, queries)
+            self._current_query = batch_qry
+            try:
+                request = batch_request.build_request(batch_qry)
+                response = batch_request.execute_request_direct(request)
+            except HTTPError as e:
+                self._queries[0:0] = queries
+                if _can_retry(queries[0], e.response):
+                    sleep(int(e.response.headers.get("Retry-After", 1)))
+                    continue
+                raise ClientRequestException(*e.args, response=e.response)
+
+            sub_responses = batch_request._extract_response(response, batch_qry)
+            received = {}
+            throttled = []
+            retry_after = 0
+            for index, qry in enumerate(queries):
+                self._current_query = qry
+                try:
+                    # sub-responses are parsed as they arrive, only out of order ones are kept
+                    while qry.id not in received:
+                        sub_qry, sub_resp = next(sub_responses, (None, None))
+                        if sub_qry is None:
+                            raise ValueError("Batch response is missing a sub-response")
+                        received[sub_qry.id] = sub_resp
+                    sub_resp = received.pop(qry.id)
+                    if _can_retry(qry, sub_resp):
+                        throttled.append(qry)
+                        retry_after = max(
+                            retry_after, int(sub_resp.headers.get("Retry-After", 1))
+                        )
+                        continue
+                    sub_resp.raise_for_status()
+                    client_request.process_response(sub_resp, qry)
+                    client_request.afterExecute.notify(sub_resp)
+                except Exception as e:
+                    self._queries[0:0] = throttled + queries[index + 1 :]
+                    if isinstance(e, HTTPError):
+                        raise ClientRequestException(*e.args, response=e.response)
+                    raise
+            if throttled:
+                self._queries[0:0] = throttled
+                sleep(retry_after)
+        return self
+
+    def _execute_concurrently(self, queries, executor):
+        # type: (List[ClientQuery], ThreadPoolExecutor) -> None
+        """
+        Builds the requests in queue order, sends them concurrently and processes responses in queue order
+        """
+        client_request = self.pending_request()
+        futures = [
+            executor.submit(client_request.send, self.build_request(qry))
+            for qry in queries
+        ]
+        for index, qry in enumerate(queries):
+            self._current_query = qry
+            try:
+                response = futures[index].result()
+                client_request.process_response(response, qry)
+                client_request.afterExecute.notify(response)
+            except Exception as e:
+                # keep the queue in the same state as sequential execution would leave it
+                self._queries[0:0] = queries[index + 1 :]
+                if isinstance(e, HTTPError):
+                    raise ClientRequestException(*e.args, response=e.response)
+                raise
+
+    async def _execute_async(self, client_request, queries, semaphore=None):
+        # type: (ClientRequest, List[ClientQuery], Optional[asyncio.Semaphore]) -> None
+        """
+        Builds the requests in queue order, awaits them concurrently and processes responses in queue order
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(1)
+
+        async def _send(request):
+            # type: (RequestOptions) -> Response
+            async with semaphore:
+                response = await self.async_transport.send(request)
+                if client_request.should_reauthenticate(request, response):
+                    response = await self.async_transport.send(request)
+            response.raise_for_status()
+            return response
+
+        tasks = []
+        for qry in queries:
+            self._current_query = qry
+            request = client_request.build_request(qry)
+            client_request.beforeExecute.notify(request)
+            tasks.append(asyncio.ensure_future(_send(request)))
+
+        for index, qry in enumerate(queries):
+            self._current_query = qry
+            try:
+                response = await tasks[index]
+                client_request.process_response(response, qry)
+                client_request.afterExecute.notify(response)
+            except Exception as e:
+                for task in tasks[index + 1 :]:
+                    task.cancel()
+                self._queries[0:0] = queries[index + 1 :]
+                if isinstance(e, HTTPError):
+                    raise ClientRequestException(*e.args, response=e.response)
+                raise
+
     def _get_next_query(self, count=1):
         # type: (int) -> ClientQuery
         if count == 1:
@@ -213,6 +532,8 @@ class ClientRuntimeContext(object):
 
             qry = BatchQuery(self)
             while self.has_pending_request and count > 0:
+                if qry.queries and not self._is_resolved(self._queries[0]):
+                    break
                 qry.add(self._queries.pop(0))
                 count = count - 1
         self._current_query = qry
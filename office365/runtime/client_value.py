@@ -12,8 +12,13 @@ class ClientValue(object):
     """Represent complex type.
     Complex types consist of a list of properties with no key, and can therefore only exist as properties of a
     containing entity or as a temporary value
+
+    High-volume values might declare their properties via __slots__ for a compact representation,
+    such values keep declared properties only
     """
 
+    __slots__ = ()
+
     def set_property(self, k, v, persist_changes=True):
         # type: (str, Any, bool) -> Self
         prop_type = getattr(self, k, None)
@@ -29,7 +34,7 @@ class ClientValue(object):
                     for k, p_v in v.items()
                 ]
             setattr(self, k, prop_type)
-        else:
+        elif hasattr(self, "__dict__") or k in self._get_slot_names():
             setattr(self, k, v)
         return self
 
@@ -39,8 +44,27 @@ class ClientValue(object):
 
     def __iter__(self):
         # type: () -> Iterator[Tuple[str, P_T]]
-        for n, v in vars(self).items():
-            yield n, v
+        for n in self._get_slot_names():
+            if hasattr(self, n):
+                yield n, getattr(self, n)
+        if hasattr(self, "__dict__"):
+            for n, v in vars(self).items():
+                yield n, v
+
+    @classmethod
+    def _get_slot_names(cls):
+        # type: () -> Tuple[str, ...]
+        """Returns names of properties declared via __slots__ along the class hierarchy"""
+        names = cls.__dict__.get("_slot_names", None)
+        if names is None:
+            names = tuple(
+                n
+                for c in reversed(cls.__mro__)
+                for n in c.__dict__.get("__slots__", ())
+                if not n.startswith("_")
+            )
+            setattr(cls, "_slot_names", names)
+        return names
 
     def to_json(self, json_format=None):
         # type: (Optional[ODataJsonFormat]) -> Dict
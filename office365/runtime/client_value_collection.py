@@ -1,3 +1,4 @@
+import array
 import uuid
 from typing import Any, Dict, Generic, Iterator, List, Optional, Type, TypeVar
 
@@ -12,16 +13,36 @@ T = TypeVar("T")
 
 
 class ClientValueCollection(ClientValue, Generic[T]):
+    __slots__ = ("_data", "_item_type")
+
     def __init__(self, item_type, initial_values=None):
         # type: (Type[T], Optional[List | Dict]) -> None
+        """
+        :param item_type: Type of collection items. Integers are kept in a compact array, e.g. lookup ids
+        :param initial_values: Initial collection items
+        """
         super(ClientValueCollection, self).__init__()
         if initial_values is None:
             initial_values = []
+        if item_type is int and isinstance(initial_values, list):
+            if all(type(v) is int for v in initial_values):
+                try:
+                    initial_values = array.array("q", initial_values)
+                except OverflowError:
+                    pass
         self._data = initial_values  # type: list[T]
         self._item_type = item_type
 
     def add(self, value):
         # type: (T) -> Self
+        if isinstance(self._data, array.array):
+            try:
+                if type(value) is int:
+                    self._data.append(value)
+                    return self
+            except OverflowError:
+                pass
+            self._data = list(self._data)
         self._data.append(value)
         return self
 
@@ -37,7 +58,7 @@ class ClientValueCollection(ClientValue, Generic[T]):
         return len(self._data)
 
     def __repr__(self):
-        return repr(self._data)
+        return repr(list(self._data))
 
     def to_json(self, json_format=None):
         # type: (ODataJsonFormat) -> list
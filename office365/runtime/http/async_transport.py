@@ -0,0 +1,105 @@
+import asyncio
+import weakref
+from typing import Optional
+
+import requests
+
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.transport import Timeout
+
+
+class AsyncHttpTransport(object):
+    """Base HTTP transport which sends a request without blocking the event loop"""
+
+    async def send(self, request):
+        # type: (RequestOptions) -> requests.Response
+        """Sends a request and returns the response"""
+        raise NotImplementedError("send")
+
+    async def close(self):
+        # type: () -> None
+        """Releases pooled connections"""
+        pass
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class HttpxAsyncTransport(AsyncHttpTransport):
+    """Asynchronous transport built on httpx.AsyncClient"""
+
+    def __init__(
+        self, max_connections=100, timeout=None, verify=True, proxy=None, http2=False
+    ):
+        # type: (int, Timeout, bool, Optional[str], bool) -> None
+        """
+        :param int max_connections: The maximum number of concurrent connections
+        :param float or (float, float) or None timeout: Default (connect, read) timeout in seconds
+        :param bool verify: Whether to verify TLS certificates
+        :param str or None proxy: Proxy url
+        :param bool http2: Whether to negotiate HTTP/2
+        """
+        self._max_connections = max_connections
+        self._verify = verify
+        self._proxy = proxy
+        self._http2 = http2
+        self.timeout = timeout
+        self._clients = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self):
+        """
+        Lazily creates the underlying client of the running event loop. Connections of a client are bound
+        to the loop they were opened in, hence every loop gets its own client, e.g. when asyncio.run
+        is called more than once
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            from office365.runtime.http.http2_transport import httpx
+
+            limits = httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections,
+            )
+            client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=limits,
+                verify=self._verify,
+                proxy=self._proxy,
+            )
+            self._clients[loop] = client
+        return client
+
+    async def send(self, request):
+        # type: (RequestOptions) -> requests.Response
+        from office365.runtime.http.http2_transport import (
+            httpx,
+            prepare_content,
+            to_requests_response,
+        )
+
+        if request.auth is not None:
+            raise ValueError("Custom request auth is not supported by async transport")
+        timeout = request.timeout if request.timeout is not None else self.timeout
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        headers, content = prepare_content(request)
+        if request.is_file:
+            content = content.read()
+        http_request = self.client.build_request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=content,
+            timeout=timeout,
+        )
+        http_response = await self.client.send(http_request)
+        return to_requests_response(http_response)
+
+    async def close(self):
+        # type: () -> None
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
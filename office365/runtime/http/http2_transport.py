@@ -0,0 +1,144 @@
+import json
+import threading
+from typing import Any, Iterator, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.transport import HttpTransport, Timeout
+
+try:
+    import httpx
+except ImportError:
+    raise ImportError(
+        "To use HTTP/2 or async transport the package 'httpx' needs to be installed."
+    )
+
+
+def prepare_content(request):
+    # type: (RequestOptions) -> Tuple[dict, Any]
+    """Returns headers and body of the request in a form accepted by httpx"""
+    headers = dict(request.headers)
+    content = None
+    if request.method in (HttpMethod.Post, HttpMethod.Patch, HttpMethod.Put):
+        if request.is_bytes or request.is_file or request.method == HttpMethod.Put:
+            content = request.data
+        elif request.data is not None:
+            content = json.dumps(request.data).encode("utf-8")
+            headers.setdefault("Content-Type", "application/json")
+    return headers, content
+
+
+def to_requests_response(http_response, stream=False):
+    # type: (httpx.Response, bool) -> requests.Response
+    """Converts httpx response into requests.Response the rest of the library operates on"""
+    response = requests.Response()
+    response.status_code = http_response.status_code
+    response.headers = CaseInsensitiveDict(http_response.headers)
+    response.url = str(http_response.url)
+    response.reason = http_response.reason_phrase
+    response.encoding = http_response.charset_encoding
+    if stream:
+        response.raw = _StreamReader(http_response)
+    else:
+        response._content = http_response.content
+        response._content_consumed = True
+    return response
+
+
+class _StreamReader(object):
+    """File-like adapter over a streamed httpx response consumed by requests.Response.iter_content"""
+
+    def __init__(self, response):
+        # type: (httpx.Response) -> None
+        self._response = response
+        self._chunks = response.iter_bytes()  # type: Iterator[bytes]
+        self._buffer = b""
+
+    def read(self, amt=None):
+        # type: (Optional[int]) -> bytes
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            amt = len(self._buffer)
+        data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        if not data:
+            self._response.close()
+        return data
+
+    def close(self):
+        self._response.close()
+
+
+class Http2Transport(HttpTransport):
+    """
+    Transport which multiplexes requests over HTTP/2 connections by means of httpx
+
+    Note: requests.auth handlers (e.g. NTLM) are not supported, proxies and TLS verification
+    are configured per transport instead of per request
+    """
+
+    def __init__(self, max_connections=10, timeout=None, verify=True, proxy=None):
+        # type: (int, Timeout, bool, Optional[str]) -> None
+        """
+        :param int max_connections: The maximum number of connections to keep per transport
+        :param float or (float, float) or None timeout: Default (connect, read) timeout in seconds
+        :param bool verify: Whether to verify TLS certificates
+        :param str or None proxy: Proxy url
+        """
+        self._max_connections = max_connections
+        self._verify = verify
+        self._proxy = proxy
+        self.timeout = timeout
+        self._client = None  # type: Optional[httpx.Client]
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        # type: () -> httpx.Client
+        """Lazily creates the underlying client"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    limits = httpx.Limits(
+                        max_connections=self._max_connections,
+                        max_keepalive_connections=self._max_connections,
+                    )
+                    self._client = httpx.Client(
+                        http2=True,
+                        limits=limits,
+                        verify=self._verify,
+                        proxy=self._proxy,
+                    )
+        return self._client
+
+    def send(self, request):
+        # type: (RequestOptions) -> requests.Response
+        if request.auth is not None:
+            raise ValueError("Custom request auth is not supported by HTTP/2 transport")
+        timeout = request.timeout if request.timeout is not None else self.timeout
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        headers, content = prepare_content(request)
+        http_request = self.client.build_request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=content,
+            timeout=timeout,
+        )
+        http_response = self.client.send(http_request, stream=request.stream)
+        return to_requests_response(http_response, request.stream)
+
+    def close(self):
+        # type: () -> None
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
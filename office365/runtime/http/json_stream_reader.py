@@ -0,0 +1,133 @@
+import codecs
+import json
+import re
+from typing import Any, Collection, Iterable, Iterator, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamReader(object):
+    """
+    Incremental reader of a JSON document which contains a (potentially large) collection.
+
+    The reader walks the root object and the objects nested under container names, e.g. {"d": {...}},
+    and yields elements of the collection array one at a time while the body is being received,
+    so that the document as a whole is never kept in memory.
+
+    Events:
+      - ("collection", name, None) once the collection array starts
+      - ("item", index, value) for every element of the collection
+      - ("member", name, value) for any other member of the walked objects
+    """
+
+    def __init__(self, chunks, collection_name, container_names=()):
+        # type: (Iterable[bytes], str, Collection[str]) -> None
+        """
+        :param chunks: Body chunks, e.g. response.iter_content(chunk_size)
+        :param str collection_name: Name of collection array, e.g. value
+        :param container_names: Names of objects to walk into, e.g. d
+        """
+        self._chunks = iter(chunks)
+        self._collection_name = collection_name
+        self._container_names = container_names
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        # type: () -> Iterator[Tuple[str, Any, Any]]
+        if self._peek() != "{":
+            # not an object, nothing to walk through
+            yield "member", None, self._decode_value()
+            return
+        for event in self._read_object():
+            yield event
+
+    def _read_object(self):
+        # type: () -> Iterator[Tuple[str, Any, Any]]
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            name = self._decode_value()
+            self._expect(":")
+            next_char = self._peek()
+            if name == self._collection_name and next_char == "[":
+                yield "collection", name, None
+                for index, item in enumerate(self._read_array()):
+                    yield "item", index, item
+            elif name in self._container_names and next_char == "{":
+                for event in self._read_object():
+                    yield event
+            else:
+                yield "member", name, self._decode_value()
+            delimiter = self._peek()
+            self._pos += 1
+            if delimiter == "}":
+                return
+            elif delimiter != ",":
+                raise ValueError("Expecting ',' delimiter at {0}".format(self._pos))
+
+    def _read_array(self):
+        # type: () -> Iterator[Any]
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            delimiter = self._peek()
+            self._pos += 1
+            if delimiter == "]":
+                return
+            elif delimiter != ",":
+                raise ValueError("Expecting ',' delimiter at {0}".format(self._pos))
+
+    def _decode_value(self):
+        # type: () -> Any
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # a number at the very end of the buffer might continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except ValueError:
+                if self._eof:
+                    raise
+            self._fill(2 * (len(self._buffer) - self._pos) + 1)
+
+    def _expect(self, char):
+        # type: (str) -> None
+        if self._peek() != char:
+            raise ValueError("Expecting '{0}' at {1}".format(char, self._pos))
+        self._pos += 1
+
+    def _peek(self):
+        # type: () -> str
+        """Skips whitespaces and returns the next character, an empty string at the end of the document"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(1):
+                return ""
+
+    def _fill(self, size):
+        # type: (int) -> bool
+        """Reads chunks until the buffer holds at least size unread characters"""
+        if self._pos > 0:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        while len(self._buffer) < size and not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                self._buffer += self._text_decoder.decode(b"", final=True)
+            else:
+                self._buffer += self._text_decoder.decode(chunk)
+        return len(self._buffer) >= size
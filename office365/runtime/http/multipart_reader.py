@@ -0,0 +1,104 @@
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from requests.structures import CaseInsensitiveDict
+
+
+def parse_headers(lines):
+    # type: (List[str]) -> CaseInsensitiveDict
+    """Parses header lines of a MIME part or of an HTTP message"""
+    headers = {}
+    for header_line in lines:
+        if ":" not in header_line:
+            continue
+        k, v = header_line.split(":", 1)
+        headers[k.title()] = v.strip()
+    return CaseInsensitiveDict(headers)
+
+
+def get_boundary(content_type):
+    # type: (str) -> Optional[str]
+    """Extracts boundary parameter from a multipart Content-Type header value"""
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "boundary":
+            return value.strip('"')
+    return None
+
+
+class MultipartReader(object):
+    """
+    Incremental reader of a multipart/mixed body. The body is consumed chunk by chunk and parts are yielded
+    as soon as the closing boundary is found, so that at most a single part is kept in memory.
+    Nested multipart parts (e.g. change sets) are flattened.
+    """
+
+    def __init__(self, chunks, boundary):
+        # type: (Iterable[bytes], str) -> None
+        """
+        :param chunks: Body chunks, e.g. response.iter_content(chunk_size)
+        :param str boundary: Multipart boundary
+        """
+        self._chunks = iter(chunks)
+        self._boundary = boundary.encode("ascii")
+        self._buffer = bytearray()
+
+    def __iter__(self):
+        # type: () -> Iterator[Tuple[CaseInsensitiveDict, bytes]]
+        """Yields headers and content of every part"""
+        for headers, content in self._read_parts():
+            boundary = get_boundary(headers.get("Content-Type", ""))
+            if boundary is not None:
+                for nested in MultipartReader([content], boundary):
+                    yield nested
+            else:
+                yield headers, content
+
+    def _read_parts(self):
+        # type: () -> Iterator[Tuple[CaseInsensitiveDict, bytes]]
+        delimiter = b"--" + self._boundary
+        # skip the preamble
+        pos = self._find(delimiter, 0)
+        if pos == -1:
+            return
+        pos += len(delimiter)
+        while True:
+            if not self._ensure(pos + 2):
+                return
+            if self._buffer[pos : pos + 2] == b"--":
+                return  # closing delimiter
+            eol = self._find(b"\r\n", pos)
+            if eol == -1:
+                return
+            start = eol + 2
+            end = self._find(b"\r\n" + delimiter, start)
+            if end == -1:
+                raise ValueError("Multipart body is truncated")
+            part = bytes(self._buffer[start:end])
+            del self._buffer[:end]
+            pos = len(delimiter) + 2
+            head, _, content = part.partition(b"\r\n\r\n")
+            yield parse_headers(head.decode("utf-8").split("\r\n")), content
+
+    def _ensure(self, size):
+        # type: (int) -> bool
+        """Reads chunks until the buffer holds at least size bytes"""
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return False
+            self._buffer += chunk
+        return True
+
+    def _find(self, value, start):
+        # type: (bytes, int) -> int
+        """Finds value in the buffer reading more chunks if needed"""
+        while True:
+            index = self._buffer.find(value, start)
+            if index != -1:
+                return index
+            # the value might be split between the current and the next chunk
+            start = max(start, len(self._buffer) - len(value) + 1)
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return -1
+            self._buffer += chunk
@@ -0,0 +1,272 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, Set, Tuple
+
+import requests
+from requests import HTTPError
+from requests.exceptions import ChunkedEncodingError
+
+from office365.runtime.client_request import ClientRequest
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.request_options import RequestOptions
+
+_TRANSIENT_STATUS_CODES = (429, 500, 502, 503, 504)
+
+PROGRESS_FILE_SUFFIX = ".download"
+"""Suffix of the file which tracks the downloaded segments next to a partially downloaded file"""
+
+
+class SegmentedDownload(object):
+    """
+    Downloads a file as concurrent HTTP range requests.
+
+    The local file is preallocated to the size of the remote one and every segment is written at its offset
+    (os.pwrite) while it is being received, hence memory usage is bounded by chunk_size per worker whatever
+    the size of the file. Segments which have been written are recorded in a progress file next to the local
+    one, so that an interrupted download resumes with the missing segments once started again.
+    """
+
+    def __init__(
+        self,
+        client_request,
+        request,
+        file_size,
+        version=None,
+        segment_size=8 * 1024 * 1024,
+        max_workers=4,
+        chunk_size=1024 * 1024,
+        chunk_downloaded=None,
+        max_retries=3,
+        retry_delay=1.0,
+    ):
+        # type: (ClientRequest, RequestOptions, int, Optional[str], int, int, int, Optional[Callable[[int], None]], int, float) -> None
+        """
+        :param ClientRequest client_request: Sends the range requests
+        :param RequestOptions request: Request of the content, including its credentials
+        :param int file_size: Size of the remote file
+        :param str or None version: Version of the remote file, e.g. its ETag. A partial download of another
+            version of the file is discarded
+        :param int segment_size: Size of a range requested at once
+        :param int max_workers: Number of ranges downloaded at the same time
+        :param int chunk_size: Number of bytes read into memory at once
+        :param (int)->None or None chunk_downloaded: Called with the number of bytes downloaded once
+            a segment has been written
+        :param int max_retries: Number of times a segment is requested once more after a connection error,
+            a throttled (HTTP 429) or a failed (HTTP 5xx) request. The request continues from the last byte
+            which has been written
+        :param float retry_delay: Number of seconds to wait before the first retry, doubled on every next one
+            unless the service specifies Retry-After
+        """
+        if segment_size <= 0:
+            raise ValueError("Segment size must be positive")
+        if max_workers < 1:
+            raise ValueError("Number of workers must be positive")
+        self._client_request = client_request
+        self._request = request
+        self._file_size = file_size
+        self._version = version
+        self._segment_size = segment_size
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._chunk_downloaded = chunk_downloaded
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._file_lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    def download(self, path, verify=None):
+        # type: (str, Optional[Callable[[str], Optional[bool]]]) -> None
+        """
+        Downloads the file, the download is executed immediately
+
+        :param str path: Path of the local file
+        :param (str)->bool or None verify: Compares the downloaded file against the remote one, returns False
+            on mismatch or None if there is nothing to compare against. A mismatching file is downloaded from
+            scratch once started again
+        """
+        progress_path = path + PROGRESS_FILE_SUFFIX
+        completed = self._load_progress(path, progress_path)
+        segments = [
+            (start, min(start + self._segment_size, self._file_size) - 1)
+            for start in range(0, self._file_size, self._segment_size)
+            if start not in completed
+        ]
+        downloaded = self._file_size - sum(end - start + 1 for start, end in segments)
+        if downloaded:
+            self._notify(downloaded)
+        self._cancelled.clear()
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            os.ftruncate(fd, self._file_size)
+            self._save_progress(progress_path, completed)
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                pending = {
+                    executor.submit(self._download_segment, fd, start, end): (
+                        start,
+                        end,
+                    )
+                    for start, end in segments
+                }  # type: Dict[Future, Tuple[int, int]]
+                try:
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            start, end = pending.pop(future)
+                            whole_file = future.result()
+                            if whole_file:
+                                # the server ignored the range, the body has been the whole file
+                                self._cancelled.set()
+                                completed.update(
+                                    range(0, self._file_size, self._segment_size)
+                                )
+                                downloaded = self._file_size
+                            else:
+                                completed.add(start)
+                                downloaded += end - start + 1
+                            self._save_progress(progress_path, completed)
+                            self._notify(downloaded)
+                        if self._cancelled.is_set():
+                            break
+                finally:
+                    self._cancelled.set()
+                    for future in pending:
+                        future.cancel()
+        finally:
+            os.close(fd)
+        if verify is not None and verify(path) is False:
+            os.remove(progress_path)
+            raise ValueError(
+                "The content of {0} does not match the hash of the remote file".format(
+                    path
+                )
+            )
+        os.remove(progress_path)
+
+    def _download_segment(self, fd, start, end):
+        # type: (int, int, int) -> bool
+        """
+        Requests a range and writes it at its offset while it is being received, runs in the pool.
+        Returns True if the server has sent the whole file instead
+        """
+        offset = start
+        attempt = 0
+        while offset <= end and not self._cancelled.is_set():
+            resumed_at = offset
+            try:
+                response = self._client_request.send(
+                    self._build_range_request(offset, end)
+                )
+                try:
+                    whole_file = response.status_code != 206
+                    if whole_file:
+                        offset, end = 0, self._file_size - 1
+                    for chunk in response.iter_content(chunk_size=self._chunk_size):
+                        if self._cancelled.is_set():
+                            return False
+                        chunk = chunk[: end - offset + 1]
+                        self._write(fd, chunk, offset)
+                        offset += len(chunk)
+                        if offset > end:
+                            break
+                finally:
+                    response.close()
+                if offset <= end:
+                    raise requests.ConnectionError(
+                        "Connection closed before the end of range {0}-{1}".format(
+                            start, end
+                        )
+                    )
+                return whole_file
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                ChunkedEncodingError,
+                HTTPError,
+            ) as e:
+                failed_response = getattr(e, "response", None)
+                transient = (
+                    failed_response is None
+                    or failed_response.status_code in _TRANSIENT_STATUS_CODES
+                )
+                if offset > resumed_at:
+                    attempt = 0
+                if not transient or attempt >= self._max_retries:
+                    if isinstance(e, HTTPError):
+                        raise ClientRequestException(*e.args, response=e.response)
+                    raise
+                time.sleep(self._get_retry_delay(failed_response, attempt))
+                attempt += 1
+        return False
+
+    def _write(self, fd, data, offset):
+        # type: (int, bytes, int) -> None
+        """Writes at an offset, so that the file position is not shared between threads"""
+        view = memoryview(data)
+        while view:
+            if hasattr(os, "pwrite"):
+                written = os.pwrite(fd, view, offset)
+            else:
+                with self._file_lock:
+                    os.lseek(fd, offset, os.SEEK_SET)
+                    written = os.write(fd, view)
+            view = view[written:]
+            offset += written
+
+    def _build_range_request(self, start, end):
+        # type: (int, int) -> RequestOptions
+        request = RequestOptions(self._request.url)
+        request.method = HttpMethod.Get
+        request.headers = dict(self._request.headers)
+        request.auth = self._request.auth
+        request.verify = self._request.verify
+        request.proxies = self._request.proxies
+        request.timeout = self._request.timeout
+        request.stream = True
+        request.set_header("Range", "bytes={0}-{1}".format(start, end))
+        return request
+
+    def _get_retry_delay(self, response, attempt):
+        # type: (Optional[requests.Response], int) -> float
+        retry_after = response.headers.get("Retry-After") if response else None
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return self._retry_delay * (2**attempt)
+
+    def _load_progress(self, path, progress_path):
+        # type: (str, str) -> Set[int]
+        """Returns the offsets of the segments which have been downloaded already"""
+        if not os.path.isfile(path) or not os.path.isfile(progress_path):
+            return set()
+        try:
+            with open(progress_path) as f:
+                progress = json.load(f)
+            if (
+                progress["size"] != self._file_size
+                or progress["version"] != self._version
+                or progress["segmentSize"] != self._segment_size
+                or os.path.getsize(path) != self._file_size
+            ):
+                return set()
+            return set(int(start) for start in progress["completed"])
+        except (ValueError, KeyError, TypeError):
+            return set()
+
+    def _save_progress(self, progress_path, completed):
+        # type: (str, Set[int]) -> None
+        progress = {
+            "size": self._file_size,
+            "version": self._version,
+            "segmentSize": self._segment_size,
+            "completed": sorted(completed),
+        }  # type: Dict[str, object]
+        with open(progress_path, "w") as f:
+            json.dump(progress, f)
+
+    def _notify(self, downloaded_bytes):
+        # type: (int) -> None
+        if callable(self._chunk_downloaded):
+            self._chunk_downloaded(downloaded_bytes)
@@ -0,0 +1,117 @@
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.request_options import RequestOptions
+
+Timeout = Union[float, Tuple[float, float], None]
+
+
+class HttpTransport(object):
+    """Base HTTP transport which sends a request over the wire on behalf of a client request"""
+
+    def send(self, request):
+        # type: (RequestOptions) -> requests.Response
+        """Sends a request and returns the raw response"""
+        raise NotImplementedError("send")
+
+    def close(self):
+        # type: () -> None
+        """Releases pooled connections"""
+        pass
+
+    def __deepcopy__(self, memo):
+        """Transports hold sockets and locks, hence copies of a context share the same transport"""
+        return self
+
+
+class RequestsTransport(HttpTransport):
+    """
+    Transport which keeps a persistent keep-alive requests.Session, so that connections to a host are reused
+    across queries instead of paying for a new TCP and TLS handshake per call
+    """
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=0,
+        timeout=None,
+        pool_block=False,
+    ):
+        # type: (int, int, int, Timeout, bool) -> None
+        """
+        :param int pool_connections: The number of host pools to cache
+        :param int pool_maxsize: The maximum number of connections to keep per host. Set it to at least the number
+             of threads which share the transport
+        :param int max_retries: The maximum number of retries for failed connections
+        :param float or (float, float) or None timeout: Default (connect, read) timeout in seconds applied
+             to requests which do not specify their own
+        :param bool pool_block: Whether the pool should block when no free connections are available
+        """
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._max_retries = max_retries
+        self._pool_block = pool_block
+        self.timeout = timeout
+        self._session = None  # type: Optional[requests.Session]
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        # type: () -> requests.Session
+        """Lazily creates the underlying session"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def send(self, request):
+        # type: (RequestOptions) -> requests.Response
+        timeout = request.timeout if request.timeout is not None else self.timeout
+        kwargs = {
+            "headers": request.headers,
+            "auth": request.auth,
+            "verify": request.verify,
+            "proxies": request.proxies,
+            "stream": request.stream,
+            "timeout": timeout,
+        }
+        if request.method == HttpMethod.Post:
+            if request.is_bytes or request.is_file:
+                kwargs["data"] = request.data
+            else:
+                kwargs["json"] = request.data
+        elif request.method == HttpMethod.Patch:
+            kwargs["json"] = request.data
+        elif request.method == HttpMethod.Put:
+            kwargs["data"] = request.data
+        return self.session.request(request.method, request.url, **kwargs)
+
+    def close(self):
+        # type: () -> None
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _create_session(self):
+        # type: () -> requests.Session
+        session = requests.Session()
+        # every request carries its own credentials, cookies returned by the server must not leak into
+        # subsequent requests
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            max_retries=self._max_retries,
+            pool_block=self._pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
@@ -23,6 +23,12 @@ class ODataJsonFormat(object):
     def collection_next(self):
         raise NotImplementedError
 
+    @property
+    def collection_delta(self):
+        # type: () -> str | None
+        """Name of the annotation which contains the link to retrieve changes since the current response"""
+        return None
+
     @property
     def media_type(self):
         # type: () -> str
@@ -77,8 +77,7 @@ class QueryOptions(object):
 
     @property
     def is_empty(self):
-        result = {k: v for (k, v) in self}
-        return not result
+        return next(iter(self), None) is None
 
     def reset(self):
         self.select = []
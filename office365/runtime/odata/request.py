@@ -4,11 +4,14 @@ from typing import Any, Iterator, Optional, Tuple
 import requests
 
 from office365.runtime.client_object import ClientObject
+from office365.runtime.client_object_collection import ClientObjectCollection
 from office365.runtime.client_request import ClientRequest
 from office365.runtime.client_result import ClientResult
 from office365.runtime.client_value import ClientValue
 from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.json_stream_reader import JsonStreamReader
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.transport import HttpTransport
 from office365.runtime.odata.json_format import ODataJsonFormat
 from office365.runtime.odata.v3.json_light_format import JsonLightFormat
 from office365.runtime.queries.client_query import ClientQuery
@@ -20,10 +23,10 @@ from office365.runtime.queries.update_entity import UpdateEntityQuery
 
 
 class ODataRequest(ClientRequest):
-    def __init__(self, json_format):
-        # type: (ODataJsonFormat) -> None
+    def __init__(self, json_format, transport=None):
+        # type: (ODataJsonFormat, Optional[HttpTransport]) -> None
         """Creates OData request"""
-        super(ODataRequest, self).__init__()
+        super(ODataRequest, self).__init__(transport)
         self._default_json_format = json_format
         self.beforeExecute += self._ensure_http_headers
 
@@ -44,11 +47,16 @@ class ODataRequest(ClientRequest):
             request.method = HttpMethod.Post
             if query.parameters_type is not None:
                 request.data = self._build_payload(query)
+        if (
+            isinstance(query.return_type, ClientObjectCollection)
+            and query.return_type.streamed_mode
+        ):
+            request.stream = True
         return request
 
     def process_response(self, response, query):
         # type: (requests.Response, ClientQuery) -> None
-        json_format = copy.deepcopy(self.json_format)
+        json_format = self.json_format
         return_type = query.return_type
         if return_type is None:
             return
@@ -65,9 +73,14 @@ class ODataRequest(ClientRequest):
         else:
             if isinstance(json_format, JsonLightFormat):
                 if isinstance(query, (ServiceOperationQuery, FunctionQuery)):
+                    json_format = copy.deepcopy(json_format)
                     json_format.function = query.name
 
-            self.map_json(response.json(), return_type, json_format)
+            if self._is_stream(response):
+                for k, v in self._next_streamed_property(response, json_format):
+                    return_type.set_property(k, v, False)
+            else:
+                self.map_json(response.json(), return_type, json_format)
 
     def map_json(self, json, return_type, json_format=None):
         # type: (Any, ClientValue | ClientResult | ClientObject, Optional[ODataJsonFormat]) -> None
@@ -87,9 +100,12 @@ class ODataRequest(ClientRequest):
         if isinstance(json, dict):
             if isinstance(json.get(json_format.collection, None), list):
                 next_link_url = json.get(json_format.collection_next, None)
+                delta_link_url = json.get(json_format.collection_delta, None)
                 json = json.get(json_format.collection, json)
                 if next_link_url:
                     yield "__nextLinkUrl", next_link_url
+                if delta_link_url:
+                    yield "__deltaLinkUrl", delta_link_url
 
             if isinstance(json, list):
                 for index, item in enumerate(json):
@@ -118,6 +134,54 @@ class ODataRequest(ClientRequest):
         elif json is not None:
             yield "__value", json
 
+    def _next_streamed_property(self, response, json_format):
+        # type: (requests.Response, ODataJsonFormat) -> Iterator[Tuple[str, Any]]
+        """
+        Same as _next_property, except collection items are parsed and yielded one at a time
+        while the response body is being received
+        """
+        container_names = ()
+        if isinstance(json_format, JsonLightFormat):
+            container_names = (json_format.security, json_format.function)
+        reader = JsonStreamReader(
+            response.iter_content(65536), json_format.collection, container_names
+        )
+        json = {}
+        is_collection = False
+        try:
+            for kind, name, value in reader:
+                if kind == "item":
+                    if isinstance(value, dict):
+                        value = {
+                            k: v for k, v in self._next_property(value, json_format)
+                        }
+                    yield name, value
+                elif kind == "collection":
+                    is_collection = True
+                elif name is None:
+                    json = value
+                else:
+                    json[name] = value
+        finally:
+            response.close()
+
+        if is_collection:
+            next_link_url = json.get(json_format.collection_next, None)
+            if next_link_url:
+                yield "__nextLinkUrl", next_link_url
+            delta_link_url = json.get(json_format.collection_delta, None)
+            if delta_link_url:
+                yield "__deltaLinkUrl", delta_link_url
+        else:
+            for k, v in self._next_property(json, json_format):
+                yield k, v
+
+    @staticmethod
+    def _is_stream(response):
+        # type: (requests.Response) -> bool
+        """Determines whether the response body has not been read yet"""
+        return response.raw is not None and not response._content_consumed
+
     def _build_payload(self, query):
         # type: (ClientQuery) -> dict|list
         """Normalizes OData request payload"""
@@ -1,7 +1,56 @@
 import datetime
 import inspect
+import re
 import uuid
-from typing import Type
+from typing import Iterable, List, Optional, Type
+
+_ISO_DATETIME_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:\d{2})?$"
+)
+
+
+def _parse_iso_datetime(value):
+    # type: (str) -> datetime.datetime
+    """Parses ISO 8601 date and time, any number of fractional digits (e.g. .NET's 7 digits) is accepted"""
+    match = _ISO_DATETIME_PATTERN.match(value)
+    if match is None:
+        raise ValueError("Invalid isoformat string: {0!r}".format(value))
+    year, month, day, hour, minute, second, fraction, zone = match.groups()
+    if zone is None:
+        tz = None
+    elif zone == "Z":
+        tz = datetime.timezone.utc
+    else:
+        offset = datetime.timedelta(hours=int(zone[1:3]), minutes=int(zone[4:6]))
+        tz = datetime.timezone(-offset if zone[0] == "-" else offset)
+    return datetime.datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        int(fraction[:6].ljust(6, "0")) if fraction else 0,
+        tz,
+    )
+
+
+def _to_naive_utc(value):
+    # type: (datetime.datetime) -> datetime.datetime
+    if value.tzinfo is not datetime.timezone.utc:
+        try:
+            value = value.astimezone(datetime.timezone.utc)
+        except OverflowError:
+            pass
+    return value.replace(tzinfo=None)
+
+
+if hasattr(datetime.datetime, "fromisoformat"):
+    # handles 'Z' suffix and 7 fractional digits since Python 3.11
+    _datetime_parsers = [datetime.datetime.fromisoformat, _parse_iso_datetime]
+else:
+    _datetime_parsers = [_parse_iso_datetime]
+"""Parsers of Edm.DateTime and Edm.DateTimeOffset values, the one which succeeded last is tried first"""
 
 
 class ODataType(object):
@@ -54,33 +103,64 @@ class ODataType(object):
             result[key] = value
         return result
 
+    _datetime_parser_index = 0
+
     @staticmethod
-    def try_parse_datetime(value):
+    def try_parse_datetime(value, tz_aware=False):
+        # type: (Optional[str|datetime.datetime], bool) -> Optional[datetime.datetime]
         """
         Converts the specified string representation of an Edm.DateTime or Edm.DateTimeOffset to its datetime equivalent
 
         :param str value: Represents date and time with values ranging from 12:00:00 midnight, January 1, 1753 A.D.
             through 11:59:59 P.M, December 9999 A.D.
+        :param bool tz_aware: Return values with a time zone offset as timezone-aware datetime, by default
+            such values are converted to UTC and returned as naive datetime
         """
         if value is None:
             return None
         elif isinstance(value, datetime.datetime):
             return value
 
-        known_formats = [
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S.%f",
-        ]
+        index = ODataType._datetime_parser_index
+        try:
+            result = _datetime_parsers[index](value)
+        except ValueError:
+            result = None
+            for index, parser in enumerate(_datetime_parsers):
+                if index == ODataType._datetime_parser_index:
+                    continue
+                try:
+                    result = parser(value)
+                except ValueError:
+                    continue
+                ODataType._datetime_parser_index = index
+                break
+            if result is None:
+                return None
+        if result.tzinfo is not None and not tz_aware:
+            return _to_naive_utc(result)
+        return result
 
-        result = None
-        for cur_format in known_formats:
+    @staticmethod
+    def try_parse_datetimes(values, tz_aware=False):
+        # type: (Iterable[Optional[str|datetime.datetime]], bool) -> List[Optional[datetime.datetime]]
+        """
+        Converts a column of Edm.DateTime or Edm.DateTimeOffset values, e.g. Modified of list items
+
+        :param values: String representations of date and time
+        :param bool tz_aware: Return values with a time zone offset as timezone-aware datetime
+        """
+        parse = _datetime_parsers[ODataType._datetime_parser_index]
+        result = []
+        for value in values:
             try:
-                result = datetime.datetime.strptime(value, cur_format)
-                break
-            except ValueError:
-                pass
+                value = parse(value)
+            except (TypeError, ValueError):
+                value = ODataType.try_parse_datetime(value, tz_aware)
+            else:
+                if value.tzinfo is not None and not tz_aware:
+                    value = _to_naive_utc(value)
+            result.append(value)
         return result
 
     @staticmethod
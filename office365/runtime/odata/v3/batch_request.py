@@ -1,17 +1,18 @@
 import json
 import re
 from email.message import Message
-from typing import AnyStr, Iterator, List, Tuple
+from typing import AnyStr, Iterator, Tuple
 
 import requests
 from requests import Response
-from requests.structures import CaseInsensitiveDict
 
-from office365.runtime.compat import (
-    message_as_bytes_or_string,
-    message_from_bytes_or_string,
-)
+from office365.runtime.compat import message_as_bytes_or_string
 from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.multipart_reader import (
+    MultipartReader,
+    get_boundary,
+    parse_headers,
+)
 from office365.runtime.http.request_options import RequestOptions
 from office365.runtime.odata.request import ODataRequest
 from office365.runtime.queries.batch import BatchQuery, create_boundary
@@ -30,6 +31,7 @@ class ODataBatchV3Request(ODataRequest):
         )
         request.ensure_header("Content-Type", content_type)
         request.data = self._prepare_payload(query)
+        request.stream = True
         return request
 
     def process_response(self, response, query):
@@ -41,18 +43,23 @@ class ODataBatchV3Request(ODataRequest):
 
     def _extract_response(self, response, query):
         # type: (Response, BatchQuery) -> Iterator[Tuple[ClientQuery, Response]]
-        """Parses a multipart/mixed response body from the position defined by the context."""
-        content_type = response.headers["Content-Type"].encode("ascii")
-        http_body = b"Content-Type: " + content_type + b"\r\n\r\n" + response.content
-
-        message = message_from_bytes_or_string(http_body)  # type: Message
-
+        """
+        Parses a multipart/mixed response body while it is being received and yields every sub-response
+        as soon as its part is complete
+        """
+        boundary = get_boundary(response.headers["Content-Type"])
+        reader = MultipartReader(response.iter_content(chunk_size=65536), boundary)
+        ordered_queries = query.ordered_queries
         query_id = 0
-        for raw_response in message.get_payload():
-            if raw_response.get_content_type() == "application/http":
-                qry = query.ordered_queries[query_id]
-                query_id += 1
-                yield qry, self._deserialize_response(raw_response)
+        try:
+            for headers, content in reader:
+                content_type = headers.get("Content-Type", "").split(";")[0]
+                if content_type.strip().lower() == "application/http":
+                    qry = ordered_queries[query_id]
+                    query_id += 1
+                    yield qry, self._deserialize_response(content)
+        finally:
+            response.close()
 
     def _prepare_payload(self, query):
         # type: (BatchQuery) -> AnyStr
@@ -81,31 +88,19 @@ class ODataBatchV3Request(ODataRequest):
         return message_as_bytes_or_string(main_message)
 
     @staticmethod
-    def _normalize_headers(headers_raw):
-        # type: (List[str]) -> CaseInsensitiveDict
-        """ """
-        headers = {}
-        for header_line in headers_raw:
-            k, v = header_line.split(":", 1)
-            headers[k.title()] = v.strip()
-        return CaseInsensitiveDict(headers)
-
-    def _deserialize_response(self, raw_response):
-        # type: (Message) -> Response
-        response = raw_response.get_payload(decode=True)
-        lines = list(filter(None, response.decode("utf-8").split("\r\n")))
-        response_status_regex = "^HTTP/1\\.\\d (\\d{3}) (.*)$"
-        status_result = re.match(response_status_regex, lines[0])
+    def _deserialize_response(content):
+        # type: (bytes) -> Response
+        """Deserializes HTTP message embedded into a part of a batch response"""
+        head, _, body = content.partition(b"\r\n\r\n")
+        lines = head.decode("utf-8").split("\r\n")
+        status_result = re.match("^HTTP/1\\.\\d (\\d{3}) ?(.*)$", lines[0])
         status_info = status_result.groups()
 
         resp = requests.Response()
         resp.status_code = int(status_info[0])
-        if status_info[1] == "No Content" or len(lines) < 3:
-            resp.headers = self._normalize_headers(lines[1:])
-            resp._content = bytes(str("").encode("utf-8"))
-        else:
-            resp._content = bytes(str(lines[-1]).encode("utf-8"))
-            resp.headers = self._normalize_headers(lines[1:-1])
+        resp.reason = status_info[1]
+        resp.headers = parse_headers(lines[1:])
+        resp._content = body.rstrip(b"\r\n")
         return resp
 
     @staticmethod
@@ -11,6 +11,32 @@ from office365.runtime.queries.batch import BatchQuery
 from office365.runtime.queries.client_query import ClientQuery
 
 
+class _SubResponse(Response):
+    """
+    Response of a single request of a JSON batch. The body is already parsed as a part of the batch response,
+    hence json() returns it as is while the content is serialized on demand only
+    """
+
+    def __init__(self, status_code, headers, body):
+        # type: (int, dict, Any) -> None
+        super(_SubResponse, self).__init__()
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self._json = body
+        self._content_consumed = True
+
+    @property
+    def content(self):
+        # type: () -> bytes
+        if self._content is False:
+            self._content = json.dumps(self._json).encode("utf-8")
+        return self._content
+
+    def json(self, **kwargs):
+        # type: (Any) -> Any
+        return self._json
+
+
 class ODataV4BatchRequest(ODataRequest):
     """JSON batch request"""
 
@@ -34,27 +60,31 @@ class ODataV4BatchRequest(ODataRequest):
     @staticmethod
     def _extract_response(response, query):
         # type: (Response, BatchQuery) -> Iterator[Tuple[ClientQuery, Response]]
-        """ """
-        json_responses = response.json()
-        for json_resp in json_responses["responses"]:
-            resp = Response()
-            resp.status_code = int(json_resp["status"])
-            resp.headers = CaseInsensitiveDict(json_resp["headers"])
-            resp._content = json.dumps(json_resp["body"]).encode("utf-8")
-            qry_id = int(json_resp["id"])
-            qry = query.ordered_queries[qry_id]
-            yield qry, resp
+        """
+        Maps every sub-response onto its query. Request ids are the positions of the queries in the batch,
+        so the lookup is a plain list index
+        """
+        queries = query.queries
+        for json_resp in response.json()["responses"]:
+            resp = _SubResponse(
+                int(json_resp["status"]),
+                json_resp.get("headers", {}),
+                json_resp.get("body", None),
+            )
+            yield queries[int(json_resp["id"])], resp
 
     def _prepare_payload(self, query):
+        # type: (BatchQuery) -> Dict[str, Any]
         """
         Serializes a batch request body.
 
-        :type query: office365.runtime.queries.batch.BatchQuery
+        Microsoft Graph executes the requests of a batch in any order and accepts a single dependsOn id only,
+        hence every request depends on the request preceding it in the queue
         """
         requests_json = []
-        for qry in query.queries:
-            qry_id = str(len(requests_json))
-            requests_json.append(self._normalize_request(qry, qry_id))
+        for index, qry in enumerate(query.queries):
+            depends_on = [str(index - 1)] if index > 0 else None
+            requests_json.append(self._normalize_request(qry, str(index), depends_on))
 
         return {"requests": requests_json}
 
@@ -69,6 +99,8 @@ class ODataV4BatchRequest(ODataRequest):
             for k, v in vars(request).items()
             if v is not None and k in allowed_props
         )
+        if request.data is not None:
+            request_json["body"] = request.data
         request_json["id"] = query_id
         if depends_on is not None:
             request_json["dependsOn"] = depends_on
@@ -24,6 +24,10 @@ class V4JsonFormat(ODataJsonFormat):
     def collection_next(self):
         return "@odata.nextLink"
 
+    @property
+    def collection_delta(self):
+        return "@odata.deltaLink"
+
     @property
     def media_type(self):
         return "application/json;odata.metadata={0};odata.streaming={1};IEEE754Compatible={2}".format(
@@ -1,39 +1,79 @@
+import io
 import os
+import threading
+import time
 import typing
-from typing import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
 
 import requests
-from typing_extensions import Self
+from requests import HTTPError
 
 from office365.runtime.client_request import ClientRequest
+from office365.runtime.client_request_exception import ClientRequestException
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.transport import HttpTransport
 from office365.runtime.queries.upload_session import UploadSessionQuery
 
+RANGE_ALIGNMENT = 327680
+"""Size of byte ranges uploaded into a drive item session has to be a multiple of 320 KiB"""
+
+_TRANSIENT_STATUS_CODES = (429, 500, 502, 503, 504)
+
 
 class UploadSessionRequest(ClientRequest):
-    def __init__(self, file_object, chunk_size, chunk_uploaded=None):
-        # type: (typing.IO, int, Callable[[int], None]) -> None
-        super(UploadSessionRequest, self).__init__()
+    def __init__(
+        self,
+        file_object,
+        chunk_size,
+        chunk_uploaded=None,
+        transport=None,
+        max_retries=3,
+        retry_delay=1.0,
+    ):
+        # type: (typing.IO, int, Callable[[int], None], Optional[HttpTransport], int, float) -> None
+        """
+        Uploads a file into an upload session range by range.
+
+        The service accepts ranges in sequential order only, hence a single range is in flight, while the next
+        one is read from the file in a background thread. Ranges are read at their offsets (os.pread),
+        the position of the file object is not relied upon.
+
+        :param typing.IO file_object: File opened in binary mode
+        :param int chunk_size: Size of a range
+        :param (int)->None chunk_uploaded: Called with the number of bytes uploaded once a range is accepted
+        :param HttpTransport or None transport: HTTP transport used to send requests
+        :param int max_retries: Number of times a range is sent once more after a connection error,
+            a throttled (HTTP 429) or a failed (HTTP 5xx) request
+        :param float retry_delay: Number of seconds to wait before the first retry, doubled on every next one
+            unless the service specifies Retry-After
+        """
+        super(UploadSessionRequest, self).__init__(transport)
         self._file_object = file_object
         self._chunk_size = chunk_size
         self._chunk_uploaded = chunk_uploaded
-        self._range_data = None
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._file_lock = threading.Lock()
+        self._file_size = None  # type: Optional[int]
+        self._range_start = 0
+        self._range_data = b""
+
+    @staticmethod
+    def validate_chunk_size(chunk_size):
+        # type: (int) -> None
+        """Ensures ranges of a drive item upload session are aligned on 320 KiB"""
+        if chunk_size <= 0 or chunk_size % RANGE_ALIGNMENT != 0:
+            raise ValueError(
+                "Chunk size must be a multiple of 320 KiB ({0} bytes), got {1}".format(
+                    RANGE_ALIGNMENT, chunk_size
+                )
+            )
 
     def build_request(self, query):
-        # type: (UploadSessionQuery) -> Self
-        request = RequestOptions(query.upload_session_url)
-        request.method = HttpMethod.Put
-        request.set_header("Content-Length", str(len(self._range_data)))
-        request.set_header(
-            "Content-Range",
-            "bytes {0}-{1}/{2}".format(
-                self.range_start, self.range_end - 1, self.file_size
-            ),
-        )
-        request.set_header("Accept", "*/*")
-        request.data = self._range_data
-        return request
+        # type: (UploadSessionQuery) -> RequestOptions
+        return self._build_range_request(query.upload_session_url)
 
     def process_response(self, response, query):
         # type: (requests.Response, UploadSessionQuery) -> None
@@ -43,26 +83,179 @@ class UploadSessionRequest(ClientRequest):
 
     def execute_query(self, query):
         # type: (UploadSessionQuery) -> None
-        for self._range_data in self._read_next():
-            super(UploadSessionRequest, self).execute_query(query)
+        """Uploads the file into a session which has just been created"""
+        self.upload(query.upload_session_url, 0)
 
-    def _read_next(self):
-        while True:
-            content = self._file_object.read(self._chunk_size)
-            if not content:
-                break
-            yield content
+    def upload(self, upload_url, start=None):
+        # type: (str, Optional[int]) -> Optional[requests.Response]
+        """
+        Uploads the ranges the session is expecting and returns the response to the last one
+
+        :param str upload_url: The URL endpoint that accepts PUT requests for byte ranges of the file
+        :param int or None start: Position the upload starts from, by default the session is requested for
+            its nextExpectedRanges, which allows to resume an interrupted upload
+        """
+        if start is None:
+            start = self.get_next_expected_start(upload_url)
+        response = None
+        read_ahead = None  # type: Optional[Tuple[int, Future]]
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            while start is not None and start < self.file_size:
+                if read_ahead is None or read_ahead[0] != start:
+                    read_ahead = (start, reader.submit(self._read_range, start))
+                self._range_start = start
+                self._range_data = read_ahead[1].result()
+                if self.range_end < self.file_size:
+                    read_ahead = (
+                        self.range_end,
+                        reader.submit(self._read_range, self.range_end),
+                    )
+                try:
+                    response = self._send_range(upload_url)
+                except ClientRequestException as e:
+                    # the range has been received already, e.g. the response to it was lost
+                    if e.response is None or e.response.status_code != 416:
+                        raise
+                    start = self.get_next_expected_start(upload_url)
+                    continue
+                if callable(self._chunk_uploaded):
+                    self._chunk_uploaded(self.range_end)
+                start = self._get_next_start(response)
+        return response
+
+    def get_next_expected_start(self, upload_url):
+        # type: (str) -> Optional[int]
+        """
+        Requests the status of the session and returns the position of the first range the service is missing,
+        None once all the ranges have been received
+
+        :param str upload_url: The URL endpoint that accepts PUT requests for byte ranges of the file
+        """
+        request = RequestOptions(upload_url)
+        request.method = HttpMethod.Get
+        try:
+            response = self.execute_request_direct(request)
+        except HTTPError as e:
+            raise ClientRequestException(*e.args, response=e.response)
+        return _get_ranges_start(_parse_next_expected_ranges(response))
 
     @property
     def file_size(self):
-        return os.fstat(self._file_object.fileno()).st_size
+        # type: () -> int
+        if self._file_size is None:
+            try:
+                self._file_size = os.fstat(self._file_object.fileno()).st_size
+            except (AttributeError, io.UnsupportedOperation):
+                with self._file_lock:
+                    self._file_size = self._file_object.seek(0, os.SEEK_END)
+        return self._file_size
 
     @property
     def range_start(self):
-        if self.range_end == 0:
-            return 0
-        return self.range_end - len(self._range_data)
+        # type: () -> int
+        return self._range_start
 
     @property
     def range_end(self):
-        return self._file_object.tell()
+        # type: () -> int
+        return self._range_start + len(self._range_data)
+
+    def _build_range_request(self, upload_url):
+        # type: (str) -> RequestOptions
+        request = RequestOptions(upload_url)
+        request.method = HttpMethod.Put
+        request.set_header("Content-Length", str(len(self._range_data)))
+        request.set_header(
+            "Content-Range",
+            "bytes {0}-{1}/{2}".format(
+                self.range_start, self.range_end - 1, self.file_size
+            ),
+        )
+        request.set_header("Accept", "*/*")
+        request.data = self._range_data
+        return request
+
+    def _send_range(self, upload_url):
+        # type: (str) -> requests.Response
+        """Sends the current range, a range which failed transiently is sent once more"""
+        attempt = 0
+        while True:
+            try:
+                response = self.execute_request_direct(
+                    self._build_range_request(upload_url)
+                )
+                self.afterExecute.notify(response)
+                return response
+            except (requests.ConnectionError, requests.Timeout, HTTPError) as e:
+                failed_response = getattr(e, "response", None)
+                transient = (
+                    failed_response is None
+                    or failed_response.status_code in _TRANSIENT_STATUS_CODES
+                )
+                if not transient or attempt >= self._max_retries:
+                    if isinstance(e, HTTPError):
+                        raise ClientRequestException(*e.args, response=e.response)
+                    raise
+                time.sleep(self._get_retry_delay(failed_response, attempt))
+                attempt += 1
+
+    def _get_retry_delay(self, response, attempt):
+        # type: (Optional[requests.Response], int) -> float
+        retry_after = response.headers.get("Retry-After") if response else None
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return self._retry_delay * (2**attempt)
+
+    def _get_next_start(self, response):
+        # type: (requests.Response) -> Optional[int]
+        """Determines the position of the next range, the ranges reported by the service take precedence"""
+        start = _get_ranges_start(_parse_next_expected_ranges(response))
+        if start is not None:
+            return start
+        if response.status_code in (200, 201) or self.range_end >= self.file_size:
+            return None
+        return self.range_end
+
+    def _read_range(self, start):
+        # type: (int) -> bytes
+        """Reads a range at its offset, so that the file position is not shared between threads"""
+        size = min(self._chunk_size, self.file_size - start)
+        fileno = None
+        if hasattr(os, "pread"):
+            try:
+                fileno = self._file_object.fileno()
+            except (AttributeError, io.UnsupportedOperation):
+                pass
+        if fileno is None:
+            with self._file_lock:
+                self._file_object.seek(start)
+                return self._file_object.read(size)
+        chunks = []  # type: List[bytes]
+        while size > 0:
+            chunk = os.pread(fileno, size, start)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            start += len(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+
+def _parse_next_expected_ranges(response):
+    # type: (requests.Response) -> List[str]
+    if not response.content:
+        return []
+    try:
+        payload = response.json()
+    except ValueError:
+        return []
+    if not isinstance(payload, dict):
+        return []
+    return payload.get("nextExpectedRanges", None) or []
+
+
+def _get_ranges_start(ranges):
+    # type: (List[str]) -> Optional[int]
+    """Ranges are either of the format "start-end", "start-" or "{start}" (Outlook attachments)"""
+    starts = [int(r.split("-")[0]) for r in ranges if r.split("-")[0].isdigit()]
+    return min(starts) if starts else None
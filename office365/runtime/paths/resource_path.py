@@ -1,8 +1,19 @@
-from typing import Iterator
+import itertools
+from typing import Iterator, Optional, Tuple
+
+_versions = itertools.count(1)
 
 
 class ResourcePath(object):
-    """OData resource path"""
+    """OData resource path
+
+    Rendered urls are cached per path. Since any path might get patched (e.g. once the key of a new entity
+    becomes known), which changes urls of all the paths beneath it, cached urls are tagged with a global version
+    which is incremented whenever a path gets patched
+    """
+
+    _version = 0
+    _url = None  # type: Optional[Tuple[int, str]]
 
     def __init__(self, key=None, parent=None):
         # type: (int|str, "ResourcePath") -> None
@@ -12,8 +23,15 @@ class ResourcePath(object):
     def patch(self, key):
         if self._key is None:
             self._key = key
+            self._invalidate()
         return self
 
+    @staticmethod
+    def _invalidate():
+        # type: () -> None
+        """Invalidates rendered urls of all paths"""
+        ResourcePath._version = next(_versions)
+
     def __iter__(self):
         # type: () -> Iterator["ResourcePath"]
         current = self
@@ -28,22 +46,45 @@ class ResourcePath(object):
         return self.to_url()
 
     def __eq__(self, other):
+        if not isinstance(other, ResourcePath):
+            return NotImplemented
         return self.to_url() == other.to_url()
 
+    def __hash__(self):
+        return hash(self.to_url())
+
     def to_url(self):
         # type: () -> str
         """Builds url"""
-        segments = []
-        for path in self:
-            segments.insert(0, path.segment)
-            if path.delimiter:
-                segments.insert(0, path.delimiter)
-        return "".join(segments)
+        return self._render(ResourcePath._version)[0]
+
+    def _render(self, version):
+        # type: (int) -> Tuple[str, bool]
+        """Renders url along with a flag whether it might be cached, the urls of parent paths get cached as well"""
+        cached = self._url
+        if cached is not None and cached[0] == version:
+            return cached[1], True
+        parent = self.parent
+        if parent:
+            url, cacheable = parent._render(version)
+        else:
+            url, cacheable = "", True
+        url += (self.delimiter or "") + self.segment
+        cacheable = cacheable and self._is_cacheable
+        if cacheable:
+            self._url = (version, url)
+        return url, cacheable
 
     @property
     def parent(self):
         return self._parent
 
+    @property
+    def _is_cacheable(self):
+        # type: () -> bool
+        """Determines whether the segment depends on the key only"""
+        return True
+
     @property
     def segment(self):
         return str(self._key)
@@ -15,6 +15,12 @@ class ServiceOperationPath(ResourcePath):
     def segment(self):
         return ODataPathBuilder.build_segment(self)
 
+    @property
+    def _is_cacheable(self):
+        # type: () -> bool
+        """Complex type parameters might be modified after the path has been built"""
+        return not isinstance(self._parameters, ClientValue)
+
     @property
     def name(self):
         return self._key
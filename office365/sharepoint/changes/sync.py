@@ -0,0 +1,202 @@
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.sharepoint.changes.item import ChangeItem
+from office365.sharepoint.changes.query import ChangeQuery
+from office365.sharepoint.changes.token import ChangeToken
+from office365.sharepoint.changes.token_store import ChangeTokenStore
+from office365.sharepoint.changes.type import ChangeType
+from office365.sharepoint.listitems.collection import ListItemCollection
+from office365.sharepoint.listitems.listitem import ListItem
+
+if TYPE_CHECKING:
+    from office365.sharepoint.changes.collection import ChangeCollection
+    from office365.sharepoint.lists.list import List as SPList
+
+
+class ChangeSyncEventType:
+    """Types of events produced by a synchronization"""
+
+    Reset = "reset"
+    """The change token is missing or has expired, events of all the items follow"""
+
+    Add = "add"
+
+    Update = "update"
+
+    Delete = "delete"
+
+
+_EVENT_TYPES = {
+    ChangeType.Add: ChangeSyncEventType.Add,
+    ChangeType.Restore: ChangeSyncEventType.Add,
+    ChangeType.MoveInto: ChangeSyncEventType.Add,
+    ChangeType.Update: ChangeSyncEventType.Update,
+    ChangeType.SystemUpdate: ChangeSyncEventType.Update,
+    ChangeType.Rename: ChangeSyncEventType.Update,
+    ChangeType.DeleteObject: ChangeSyncEventType.Delete,
+    ChangeType.MoveAway: ChangeSyncEventType.Delete,
+}
+
+
+class ChangeSyncEvent(object):
+    """A change of a list item"""
+
+    def __init__(self, event_type, item_id=None, item=None):
+        # type: (str, Optional[int], Optional[ListItem]) -> None
+        """
+        :param str event_type: See ChangeSyncEventType
+        :param int or None item_id: Identifies the changed item
+        :param ListItem or None item: The item as of now, None for deleted items
+        """
+        self.event_type = event_type
+        self.item_id = item_id
+        self.item = item
+
+    def __repr__(self):
+        return "{0}({1})".format(self.event_type, self.item_id or "")
+
+
+class ListChangeSynchronizer(object):
+    """
+    Produces the events of list items changed since the previous synchronization.
+
+    The last processed change token is kept in a store. Changes are retrieved from the change log
+    in batches, collapsed per item and the changed items are resolved by identifiers. The token is advanced
+    once the events of a batch have been consumed, so events of an interrupted run are produced once again.
+    When the token is missing or has expired, a Reset event is produced followed by Add events
+    of all the items.
+    """
+
+    def __init__(
+        self,
+        target_list,
+        store,
+        properties=None,
+        batch_size=1000,
+        page_size=5000,
+        resolve_batch_size=50,
+    ):
+        # type: (SPList, ChangeTokenStore, Optional[List[str]], int, int, int) -> None
+        """
+        :param office365.sharepoint.lists.list.List target_list: The list to synchronize
+        :param ChangeTokenStore store: Persistent store of change tokens
+        :param list[str] or None properties: Item properties to retrieve
+        :param int batch_size: Number of changes retrieved per request
+        :param int page_size: Number of items per request during a full synchronization
+        :param int resolve_batch_size: Number of changed items retrieved per request
+        """
+        self._list = target_list
+        self._store = store
+        self._properties = properties
+        self._batch_size = batch_size
+        self._page_size = page_size
+        self._resolve_batch_size = resolve_batch_size
+
+    def __iter__(self):
+        # type: () -> Iterator[ChangeSyncEvent]
+        context = self._list.context
+        context.load(self._list, ["Id", "CurrentChangeToken"]).execute_query()
+        key = self._list.id
+        token = self._store.get(key)
+        if token is not None:
+            try:
+                for event in self._get_changes(key, token):
+                    yield event
+                return
+            except ClientRequestException as e:
+                if not _is_change_token_expired(e):
+                    raise
+        for event in self._get_all(key):
+            yield event
+
+    def _get_all(self, key):
+        # type: (str) -> Iterator[ChangeSyncEvent]
+        # the token is taken before items are read, so that changes made meanwhile are picked up next time
+        token = self._list.current_change_token.StringValue
+        yield ChangeSyncEvent(ChangeSyncEventType.Reset)
+        for item in self._create_items().iter_items(self._page_size):
+            yield ChangeSyncEvent(ChangeSyncEventType.Add, item.id, item)
+        self._store.set(key, token)
+
+    def _get_changes(self, key, token):
+        # type: (str, str) -> Iterator[ChangeSyncEvent]
+        while True:
+            query = ChangeQuery(
+                item=True,
+                role_assignment_add=False,
+                role_assignment_delete=False,
+                change_token_start=ChangeToken(token),
+                fetch_limit=self._batch_size,
+            )
+            changes = self._list.get_changes(query).execute_query()
+            if len(changes) == 0:
+                return
+            for event in self._resolve(self._collapse(changes)):
+                yield event
+            token = changes[-1].change_token.StringValue
+            self._store.set(key, token)
+            if len(changes) < self._batch_size:
+                return
+
+    @staticmethod
+    def _collapse(changes):
+        # type: (ChangeCollection) -> Dict[int, str]
+        """Determines a single event type per item, in the order items were changed first"""
+        event_types = {}  # type: Dict[int, str]
+        for change in changes:
+            if not isinstance(change, ChangeItem) or change.item_id is None:
+                continue
+            event_type = _EVENT_TYPES.get(change.change_type, None)
+            if event_type is None:
+                continue
+            previous = event_types.get(change.item_id, None)
+            if (
+                previous == ChangeSyncEventType.Add
+                and event_type == ChangeSyncEventType.Update
+            ):
+                continue
+            event_types[change.item_id] = event_type
+        return event_types
+
+    def _resolve(self, event_types):
+        # type: (Dict[int, str]) -> Iterator[ChangeSyncEvent]
+        """Retrieves changed items, an item which no longer exists is reported as deleted"""
+        item_ids = [
+            item_id
+            for item_id, event_type in event_types.items()
+            if event_type != ChangeSyncEventType.Delete
+        ]
+        batches = []
+        for i in range(0, len(item_ids), self._resolve_batch_size):
+            batch_ids = item_ids[i : i + self._resolve_batch_size]
+            batches.append(
+                self._create_items()
+                .filter(" or ".join("ID eq {0}".format(n) for n in batch_ids))
+                .top(len(batch_ids))
+                .get()
+            )
+        if batches:
+            self._list.context.execute_query()
+        items = {item.id: item for batch in batches for item in batch}
+        for item_id, event_type in event_types.items():
+            item = items.get(item_id, None)
+            if item is None:
+                event_type = ChangeSyncEventType.Delete
+            yield ChangeSyncEvent(event_type, item_id, item)
+
+    def _create_items(self):
+        # type: () -> ListItemCollection
+        items = ListItemCollection(self._list.context, self._list.items.resource_path)
+        if self._properties:
+            properties = list(self._properties)
+            if "Id" not in properties:
+                properties.append("Id")
+            items.select(properties)
+        return items
+
+
+def _is_change_token_expired(e):
+    # type: (ClientRequestException) -> bool
+    """The change token refers to a time before the start of the current change log"""
+    return "current change log" in (e.message or "").lower()
@@ -0,0 +1,99 @@
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Optional
+
+
+class ChangeTokenStore(object):
+    """
+    Persistent store of change tokens, so that a synchronization resumes from the change
+    where the previous run has stopped
+    """
+
+    def get(self, key):
+        # type: (str) -> Optional[str]
+        """
+        Returns the change token stored under the key or None if it is missing
+
+        :param str key: Identifies the synchronized object, e.g. the list id
+        """
+        raise NotImplementedError("get")
+
+    def set(self, key, value):
+        # type: (str, str) -> None
+        """
+        Stores the change token
+
+        :param str key: Identifies the synchronized object
+        :param str value: Serialized change token, see ChangeToken.StringValue
+        """
+        raise NotImplementedError("set")
+
+    def remove(self, key):
+        # type: (str) -> None
+        """Removes the change token stored under the key"""
+        raise NotImplementedError("remove")
+
+
+class SqliteChangeTokenStore(ChangeTokenStore):
+    """
+    Stores change tokens in a SQLite database. A connection is opened per operation, hence the store
+    can be shared between threads and processes
+    """
+
+    def __init__(self, path=None, timeout=30):
+        # type: (Optional[str], float) -> None
+        """
+        :param str or None path: Path to the database file, defaults to ~/.office365/change_tokens.db
+        :param float timeout: Number of seconds to wait for a database locked by another process
+        """
+        if path is None:
+            path = os.path.join(
+                os.path.expanduser("~"), ".office365", "change_tokens.db"
+            )
+        self._path = path
+        self._timeout = timeout
+        self._initialized = False
+
+    @property
+    def path(self):
+        # type: () -> str
+        return self._path
+
+    def get(self, key):
+        # type: (str) -> Optional[str]
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value FROM change_tokens WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, value):
+        # type: (str, str) -> None
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO change_tokens (key, value, updated) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+
+    def remove(self, key):
+        # type: (str) -> None
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM change_tokens WHERE key = ?", (key,))
+
+    def _connect(self):
+        # type: () -> sqlite3.Connection
+        if not self._initialized:
+            folder = os.path.dirname(os.path.abspath(self._path))
+            if not os.path.isdir(folder):
+                os.makedirs(folder, exist_ok=True)
+        conn = sqlite3.connect(self._path, timeout=self._timeout)
+        if not self._initialized:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS change_tokens "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, updated REAL)"
+                )
+            self._initialized = True
+        return conn
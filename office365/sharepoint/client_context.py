@@ -6,6 +6,7 @@ from typing_extensions import Self
 
 from office365.runtime.auth.authentication_context import AuthenticationContext
 from office365.runtime.auth.client_credential import ClientCredential
+from office365.runtime.auth.credential_store import CredentialStore
 from office365.runtime.auth.token_response import TokenResponse
 from office365.runtime.auth.user_credential import UserCredential
 from office365.runtime.client_result import ClientResult
@@ -196,6 +197,16 @@ class ClientContext(ClientRuntimeContext):
         )
         return self
 
+    def with_credential_store(self, store):
+        # type: (CredentialStore) -> Self
+        """
+        Shares acquired tokens and authentication cookies between processes via a persistent store,
+        e.g. FileCredentialStore
+        :param CredentialStore store: Credential store
+        """
+        self.authentication_context.with_credential_store(store)
+        return self
+
     def execute_batch(self, items_per_batch=100, success_callback=None):
         # type: (int, Callable[[int], None]) -> Self
         """
@@ -203,9 +214,7 @@ class ClientContext(ClientRuntimeContext):
         :param int items_per_batch: Maximum to be selected for bulk operation
         :param (int)-> None success_callback: A callback
         """
-        batch_request = ODataBatchV3Request(JsonLightFormat())
-        batch_request.beforeExecute += self._authenticate_request
-        batch_request.beforeExecute += self._ensure_form_digest
+        batch_request = self._create_batch_request()
         while self.has_pending_request:
             qry = self._get_next_query(items_per_batch)
             batch_request.execute_query(qry)
@@ -213,12 +222,36 @@ class ClientContext(ClientRuntimeContext):
                 success_callback(items_per_batch)
         return self
 
+    async def execute_batch_async(self, items_per_batch=100, success_callback=None):
+        # type: (int, Callable[[int], None]) -> Self
+        """
+        Construct and submit to a server a batch request without blocking the event loop
+        :param int items_per_batch: Maximum to be selected for bulk operation
+        :param (int)-> None success_callback: A callback
+        """
+        batch_request = self._create_batch_request()
+        while self.has_pending_request:
+            qry = self._get_next_query(items_per_batch)
+            await self._execute_async(batch_request, [qry])
+            if callable(success_callback):
+                success_callback(items_per_batch)
+        return self
+
+    def _create_batch_request(self):
+        # type: () -> ODataBatchV3Request
+        batch_request = ODataBatchV3Request(JsonLightFormat(), self.transport)
+        batch_request.beforeExecute += self._authenticate_request
+        batch_request.beforeExecute += self._ensure_form_digest
+        batch_request.unauthorized += self._reauthenticate_request
+        return batch_request
+
     def pending_request(self):
         """Provides access to underlying request instance"""
         if self._pending_request is None:
-            self._pending_request = ODataRequest(JsonLightFormat())
+            self._pending_request = ODataRequest(JsonLightFormat(), self.transport)
             self._pending_request.beforeExecute += self._authenticate_request
             self._pending_request.beforeExecute += self._build_modification_query
+            self._pending_request.unauthorized += self._reauthenticate_request
         return self._pending_request
 
     def _ensure_form_digest(self, request):
@@ -229,8 +262,9 @@ class ClientContext(ClientRuntimeContext):
 
     def _get_context_web_information(self):
         """Returns an ContextWebInformation object that specifies metadata about the site"""
-        client = ODataRequest(JsonLightFormat())
+        client = ODataRequest(JsonLightFormat(), self.transport)
         client.beforeExecute += self._authenticate_request
+        client.unauthorized += self._reauthenticate_request
         for e in self.pending_request().beforeExecute:
             if not EventHandler.is_system(e):
                 client.beforeExecute += e
@@ -282,6 +316,11 @@ class ClientContext(ClientRuntimeContext):
         """Authenticate request"""
         self.authentication_context.authenticate_request(request)
 
+    def _reauthenticate_request(self, request):
+        # type: (RequestOptions) -> None
+        """Renews rejected credentials"""
+        self.authentication_context.reauthenticate_request(request)
+
     def _build_modification_query(self, request):
         # type: (RequestOptions) -> None
         """Constructs SharePoint specific modification OData request"""
@@ -2,6 +2,8 @@ from office365.runtime.client_value import ClientValue
 
 
 class FieldLookupValue(ClientValue):
+    __slots__ = ("LookupId", "LookupValue")
+
     def __init__(self, lookup_id=None, lookup_value=None):
         """Specifies the value of a lookup for a fields within a list item.
 
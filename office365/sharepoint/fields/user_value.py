@@ -3,6 +3,8 @@ from office365.sharepoint.principal.users.user import User
 
 
 class FieldUserValue(FieldLookupValue):
+    __slots__ = ()
+
     def __init__(self, user_id):
         """Represents the value of a user fields for a list item."""
         super(FieldUserValue, self).__init__(user_id)
@@ -1,7 +1,7 @@
 import hashlib
 import os
 import uuid
-from typing import IO, TYPE_CHECKING, Callable
+from typing import IO, TYPE_CHECKING, Callable, Optional
 
 from office365.runtime.client_result import ClientResult
 from office365.runtime.paths.resource_path import ResourcePath
@@ -14,6 +14,7 @@ from office365.sharepoint.files.file import File
 from office365.sharepoint.types.resource_path import ResourcePath as SPResPath
 
 if TYPE_CHECKING:
+    from office365.delta_iterator import DeltaCheckpointStore
     from office365.sharepoint.folders.folder import Folder
 
 
@@ -117,6 +118,30 @@ class FileCollection(EntityCollection[File]):
         else:
             return self.add(file_name, file.read(), True)
 
+    def resumable_upload(
+        self,
+        source_path,
+        chunk_size=10 * 1024 * 1024,
+        store=None,
+        chunk_uploaded=None,
+        file_name=None,
+    ):
+        # type: (str, int, Optional[DeltaCheckpointStore], Optional[Callable[[int], None]], Optional[str]) -> File
+        """Uploads a file as multiple chunks, an interrupted upload resumes from the last chunk the server
+        has received. Unlike create_upload_session, the upload is executed immediately
+
+        :param str source_path: Path where file to upload resides
+        :param int chunk_size: Upload chunk size (in bytes)
+        :param DeltaCheckpointStore or None store: Persistent store of upload sessions,
+            e.g. FileDeltaCheckpointStore, by default sessions are kept in memory
+        :param (int)->None or None chunk_uploaded: Called with the number of bytes uploaded
+        :param str file_name: Custom file name
+        """
+        from office365.sharepoint.files.upload_manager import FileUploadManager
+
+        manager = FileUploadManager(self, chunk_size, store, chunk_uploaded)
+        return manager.upload(source_path, file_name)
+
     def add(self, url, content, overwrite=False):
         """
         Adds a file to the collection based on provided file creation information. A reference to the SP.File that
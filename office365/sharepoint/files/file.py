@@ -6,9 +6,11 @@ import requests
 from office365.runtime.client_result import ClientResult
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.http.segmented_download import SegmentedDownload
 from office365.runtime.paths.resource_path import ResourcePath
 from office365.runtime.paths.service_operation import ServiceOperationPath
 from office365.runtime.queries.function import FunctionQuery
+from office365.runtime.queries.read_entity import ReadEntityQuery
 from office365.runtime.queries.service_operation import ServiceOperationQuery
 from office365.runtime.queries.update_entity import UpdateEntityQuery
 from office365.sharepoint.activities.capabilities import ActivityCapabilities
@@ -33,7 +35,7 @@ from office365.sharepoint.webparts.limited_manager import LimitedWebPartManager
 from office365.sharepoint.webparts.personalization_scope import PersonalizationScope
 
 if TYPE_CHECKING:
-    from typing import Optional
+    from typing import Callable, Optional
 
 
 class AbstractFile(Entity):
@@ -694,6 +696,49 @@ class File(AbstractFile):
             self.ensure_property("ServerRelativeUrl", _download_as_stream)
         return self
 
+    def download_segmented(
+        self,
+        path,
+        max_workers=4,
+        segment_size=8 * 1024 * 1024,
+        chunk_downloaded=None,
+    ):
+        # type: (str, int, int, Optional[Callable[[int], None]]) -> "File"
+        """
+        Downloads a file content into a local file as concurrent range requests, see SegmentedDownload.
+        An interrupted download is resumed once started again, as long as the file has not changed (ETag).
+        The REST API does not expose content hashes of files, hence only the size of the downloaded file matches
+        the remote one for sure
+
+        :param str path: Path of the local file
+        :param int max_workers: Number of ranges downloaded at the same time
+        :param int segment_size: Size of a range requested at once
+        :param (int)->None or None chunk_downloaded: Called with the number of bytes downloaded
+        """
+
+        def _download(return_type):
+            # type: (File) -> None
+            current_query = self.context.current_query
+            request = self.context.build_request(FunctionQuery(self, "$value"))
+            self.context._current_query = current_query
+            download = SegmentedDownload(
+                self.context.pending_request(),
+                request,
+                self.length,
+                self.properties.get("ETag", None),
+                segment_size,
+                max_workers,
+                chunk_downloaded=chunk_downloaded,
+            )
+            download.download(path)
+
+        def _load_file():
+            qry = ReadEntityQuery(self, ["Length", "ETag"])
+            self.context.add_query(qry).after_query_execute(_download)
+
+        self.ensure_property("ServerRelativePath", _load_file)
+        return self
+
     def rename(self, new_file_name):
         """
         Rename a file
@@ -713,16 +758,19 @@ class File(AbstractFile):
     @property
     def author(self):
         """Specifies the user who added the file."""
-        return self.properties.get(
-            "Author", User(self.context, ResourcePath("Author", self.resource_path))
+        return self._get_navigation_property(
+            "Author",
+            lambda: User(self.context, ResourcePath("Author", self.resource_path)),
         )
 
     @property
     def checked_out_by_user(self):
         """Gets an object that represents the user who has checked out the file."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "CheckedOutByUser",
-            User(self.context, ResourcePath("CheckedOutByUser", self.resource_path)),
+            lambda: User(
+                self.context, ResourcePath("CheckedOutByUser", self.resource_path)
+            ),
         )
 
     @property
@@ -740,9 +788,9 @@ class File(AbstractFile):
     def version_events(self):
         # type: () -> EntityCollection[FileVersionEvent]
         """Gets the history of events on this version object."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "VersionEvents",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context,
                 FileVersionEvent,
                 ResourcePath("VersionEvents", self.resource_path),
@@ -761,17 +809,17 @@ class File(AbstractFile):
         path = ResourcePath(
             "EffectiveInformationRightsManagementSettings", self.resource_path
         )
-        return self.properties.get(
+        return self._get_navigation_property(
             "EffectiveInformationRightsManagementSettings",
-            EffectiveInformationRightsManagementSettings(self.context, path),
+            lambda: EffectiveInformationRightsManagementSettings(self.context, path),
         )
 
     @property
     def information_rights_management_settings(self):
         """Returns the Information Rights Management (IRM) settings for the file."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "InformationRightsManagementSettings",
-            InformationRightsManagementFileSettings(
+            lambda: InformationRightsManagementFileSettings(
                 self.context,
                 ResourcePath("InformationRightsManagementSettings", self.resource_path),
             ),
@@ -791,9 +839,9 @@ class File(AbstractFile):
     @property
     def version_expiration_report(self):
         """"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "VersionExpirationReport",
-            FileVersionCollection(
+            lambda: FileVersionCollection(
                 self.context,
                 ResourcePath("VersionExpirationReport", self.resource_path),
             ),
@@ -803,9 +851,9 @@ class File(AbstractFile):
     def versions(self):
         # type: () -> FileVersionCollection
         """Gets a value that returns a collection of file version objects that represent the versions of the file."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Versions",
-            FileVersionCollection(
+            lambda: FileVersionCollection(
                 self.context, ResourcePath("versions", self.resource_path)
             ),
         )
@@ -813,17 +861,19 @@ class File(AbstractFile):
     @property
     def modified_by(self):
         """Gets a value that returns the user who last modified the file."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ModifiedBy",
-            User(self.context, ResourcePath("ModifiedBy", self.resource_path)),
+            lambda: User(self.context, ResourcePath("ModifiedBy", self.resource_path)),
         )
 
     @property
     def locked_by_user(self):
         """Gets a value that returns the user that owns the current lock on the file."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "LockedByUser",
-            User(self.context, ResourcePath("LockedByUser", self.resource_path)),
+            lambda: User(
+                self.context, ResourcePath("LockedByUser", self.resource_path)
+            ),
         )
 
     @property
@@ -0,0 +1,239 @@
+import json
+import mmap
+import os
+import uuid
+from typing import TYPE_CHECKING, Callable, Optional
+
+from office365.delta_iterator import DeltaCheckpointStore, MemoryDeltaCheckpointStore
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.queries.read_entity import ReadEntityQuery
+from office365.sharepoint.files.file import File
+
+if TYPE_CHECKING:
+    from office365.sharepoint.files.collection import FileCollection
+
+
+class _ChunkStream(object):
+    """
+    File-like view over a chunk of a memory mapped file, the chunk is sent block by block
+    instead of being copied as a whole
+    """
+
+    def __init__(self, mm, start, end):
+        # type: (mmap.mmap, int, int) -> None
+        self._mm = mm
+        self._start = start
+        self._end = end
+        self._position = start
+
+    def __len__(self):
+        return self._end - self._start
+
+    def read(self, size=-1):
+        # type: (int) -> bytes
+        end = self._end if size is None or size < 0 else self._position + size
+        data = self._mm[self._position : min(end, self._end)]
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        # type: () -> int
+        return self._position - self._start
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        # type: (int, int) -> int
+        if whence == os.SEEK_CUR:
+            offset += self.tell()
+        elif whence == os.SEEK_END:
+            offset += len(self)
+        self._position = self._start + offset
+        return offset
+
+
+class FileUploadCheckpoint(object):
+    """The state of a chunk upload session"""
+
+    def __init__(self, upload_id, file_url, offset, fingerprint):
+        # type: (str, str, int, str) -> None
+        """
+        :param str upload_id: The upload session ID
+        :param str file_url: Server relative url of the uploaded file
+        :param int offset: Number of bytes the server has received
+        :param str fingerprint: Size and modification time of the local file, see FileUploadManager.fingerprint
+        """
+        self.upload_id = upload_id
+        self.file_url = file_url
+        self.offset = offset
+        self.fingerprint = fingerprint
+
+    def to_json(self):
+        # type: () -> str
+        return json.dumps(
+            {
+                "uploadId": self.upload_id,
+                "fileUrl": self.file_url,
+                "offset": self.offset,
+                "fingerprint": self.fingerprint,
+            }
+        )
+
+    @staticmethod
+    def from_json(value):
+        # type: (Optional[str]) -> Optional["FileUploadCheckpoint"]
+        if not value:
+            return None
+        try:
+            json_value = json.loads(value)
+            return FileUploadCheckpoint(
+                json_value["uploadId"],
+                json_value["fileUrl"],
+                int(json_value["offset"]),
+                json_value["fingerprint"],
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+
+
+class FileUploadManager(object):
+    """
+    Uploads a file into a folder as multiple chunks and keeps the state of the upload session in a store.
+
+    After every chunk the upload id, the offset the server has confirmed and the fingerprint of the local file
+    are saved, so that an interrupted upload resumes from the offset the server reports
+    (File.get_upload_status) instead of starting from the first byte. The checkpoint is discarded once the
+    file is committed, or ignored if the local file has been modified in the meantime.
+
+    Chunks are sent straight from a memory mapped file.
+    """
+
+    def __init__(self, files, chunk_size, store=None, chunk_uploaded=None):
+        # type: (FileCollection, int, Optional[DeltaCheckpointStore], Optional[Callable[[int], None]]) -> None
+        """
+        :param office365.sharepoint.files.collection.FileCollection files: Files of the target folder
+        :param int chunk_size: Upload chunk size (in bytes)
+        :param DeltaCheckpointStore or None store: Persistent store of checkpoints,
+            e.g. FileDeltaCheckpointStore, by default checkpoints are kept in memory
+        :param (int)->None or None chunk_uploaded: Called with the number of bytes uploaded
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self._files = files
+        self._chunk_size = chunk_size
+        self._store = store if store is not None else MemoryDeltaCheckpointStore()
+        self._chunk_uploaded = chunk_uploaded
+
+    @property
+    def context(self):
+        return self._files.context
+
+    def get_key(self, file_name):
+        # type: (str) -> str
+        """Identifies the upload of a file in the store"""
+        return "{0}/{1}".format(ReadEntityQuery(self._files).url, file_name)
+
+    @staticmethod
+    def fingerprint(source_path):
+        # type: (str) -> str
+        stat = os.stat(source_path)
+        return "{0}:{1}".format(stat.st_size, stat.st_mtime_ns)
+
+    def upload(self, source_path, file_name=None):
+        # type: (str, Optional[str]) -> File
+        """
+        Uploads the file, the upload is executed immediately
+
+        :param str source_path: Path where file to upload resides
+        :param str or None file_name: Custom file name
+        """
+        file_name = file_name or os.path.basename(source_path)
+        file_size = os.path.getsize(source_path)
+        if file_size <= self._chunk_size:
+            with open(source_path, "rb") as f:
+                return_type = self._files.add(file_name, f.read(), True)
+            self.context.execute_query()
+            self._notify(file_size)
+            return return_type
+
+        key = self.get_key(file_name)
+        fingerprint = self.fingerprint(source_path)
+        checkpoint = self._resume(key, fingerprint)
+        with open(source_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            if checkpoint is None:
+                return_type = self._files.add(file_name, None, True)
+                self.context.execute_query()
+                checkpoint = FileUploadCheckpoint(
+                    str(uuid.uuid4()), return_type.serverRelativeUrl, 0, fingerprint
+                )
+            else:
+                return_type = self.context.web.get_file_by_server_relative_path(
+                    checkpoint.file_url
+                )
+                self._notify(checkpoint.offset)
+            while checkpoint.offset + self._chunk_size < file_size:
+                self._upload_chunk(return_type, checkpoint, mm)
+                self._store.set(key, checkpoint.to_json())
+                self._notify(checkpoint.offset)
+            chunk = _ChunkStream(mm, checkpoint.offset, file_size)
+            return_type.finish_upload(checkpoint.upload_id, checkpoint.offset, chunk)
+            self.context.execute_query()
+        self._store.remove(key)
+        self._notify(file_size)
+        return return_type
+
+    def _resume(self, key, fingerprint):
+        # type: (str, str) -> Optional[FileUploadCheckpoint]
+        """Determines the offset of an interrupted upload, None when the upload has to start over"""
+        checkpoint = FileUploadCheckpoint.from_json(self._store.get(key))
+        if checkpoint is None:
+            return None
+        target_file = self.context.web.get_file_by_server_relative_path(
+            checkpoint.file_url
+        )
+        if checkpoint.fingerprint != fingerprint:
+            target_file.cancel_upload(checkpoint.upload_id)
+            try:
+                self.context.execute_query()
+            except ClientRequestException:
+                pass
+            self._store.remove(key)
+            return None
+        try:
+            status = target_file.get_upload_status(checkpoint.upload_id)
+            self.context.execute_query()
+        except ClientRequestException:
+            # the session has expired or the file has been deleted
+            self._store.remove(key)
+            return None
+        offset = _parse_offset(status.expected_content_range)
+        if offset is None:
+            self._store.remove(key)
+            return None
+        checkpoint.offset = offset
+        return checkpoint
+
+    def _upload_chunk(self, target_file, checkpoint, mm):
+        # type: (File, FileUploadCheckpoint, mmap.mmap) -> None
+        start = checkpoint.offset
+        chunk = _ChunkStream(mm, start, min(start + self._chunk_size, len(mm)))
+        if start == 0:
+            result = target_file.start_upload(checkpoint.upload_id, chunk)
+        else:
+            result = target_file.continue_upload(checkpoint.upload_id, start, chunk)
+        self.context.execute_query()
+        checkpoint.offset = int(result.value or start + len(chunk))
+
+    def _notify(self, uploaded_bytes):
+        # type: (int) -> None
+        if callable(self._chunk_uploaded):
+            self._chunk_uploaded(uploaded_bytes)
+
+
+def _parse_offset(content_range):
+    # type: (Optional[str]) -> Optional[int]
+    """The expected content range is of the format "start-" or "start-end" """
+    if not content_range:
+        return None
+    start = content_range.split("-")[0].strip()
+    return int(start) if start.isdigit() else None
@@ -0,0 +1,67 @@
+from typing import IO, TYPE_CHECKING, Callable, List, Optional, Tuple
+
+from office365.folder_exporter import BaseFolderExporter
+from office365.folder_uploader import RemoteFile
+from office365.runtime.client_object_collection import ClientObjectCollection
+from office365.runtime.odata.type import ODataType
+from office365.runtime.queries.client_query import ClientQuery
+from office365.runtime.queries.function import FunctionQuery
+from office365.sharepoint.files.file import File
+
+if TYPE_CHECKING:
+    from office365.sharepoint.folders.folder import Folder
+
+
+class FolderExporter(BaseFolderExporter["Folder"]):
+    """
+    Exports a SharePoint folder tree into a zip archive, see BaseFolderExporter.
+    Listed files and folders are addressed by their unique ids
+    """
+
+    def __init__(
+        self,
+        source,
+        download_file,
+        max_workers=8,
+        recursive=True,
+        small_file_size=1024 * 1024,
+        chunk_size=1024 * 1024,
+        file_downloaded=None,
+    ):
+        # type: (Folder, IO, int, bool, int, int, Optional[Callable[[File], None]]) -> None
+        super(FolderExporter, self).__init__(
+            source.context,
+            source,
+            download_file,
+            max_workers,
+            recursive,
+            small_file_size,
+            chunk_size,
+            file_downloaded=file_downloaded,
+        )
+
+    def _list_children(self, folder):
+        # type: (Folder) -> List[ClientObjectCollection]
+        return [
+            folder.files.select(
+                ["Name", "Length", "TimeLastModified", "UniqueId", "ServerRelativeUrl"]
+            ).get_all(),
+            folder.folders.select(["Name", "UniqueId", "ServerRelativeUrl"]).get_all(),
+        ]
+
+    def _get_remote_entry(self, entity):
+        # type: (File|Folder) -> Tuple[str, Optional[RemoteFile]]
+        if not isinstance(entity, File):
+            return entity.name, None
+        return entity.name, RemoteFile(
+            entity.length,
+            ODataType.try_parse_datetime(entity.properties.get("TimeLastModified")),
+        )
+
+    def _get_folder(self, parent, entity):
+        # type: (Folder, Folder) -> Folder
+        return entity
+
+    def _get_content_query(self, parent, entity):
+        # type: (Folder, File) -> ClientQuery
+        return FunctionQuery(entity, "$value")
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from typing_extensions import Self
 
@@ -22,7 +22,9 @@ from office365.sharepoint.utilities.move_copy_options import MoveCopyOptions
 from office365.sharepoint.utilities.move_copy_util import MoveCopyUtil
 
 if TYPE_CHECKING:
+    from office365.folder_uploader import FolderUploadResult
     from office365.sharepoint.files.collection import FileCollection
+    from office365.sharepoint.files.file import File
     from office365.sharepoint.folders.collection import FolderCollection
 
 
@@ -48,16 +50,17 @@ class Folder(Entity):
         return ctx.web.get_folder_by_server_relative_url(relative_url)
 
     def download_folder(
-        self, download_file, after_file_downloaded=None, recursive=True
+        self, download_file, after_file_downloaded=None, recursive=True, max_workers=8
     ):
         """
-        Downloads a folder into a zip file
+        Downloads a folder into a zip file, the download is executed immediately
         :param typing.IO download_file: A download zip file object
         :param (office365.sharepoint.files.file.File)->None after_file_downloaded: A download callback
         :param bool recursive: Determines whether to traverse folders recursively
+        :param int max_workers: Number of files downloaded at the same time
         """
         return MoveCopyUtil.download_folder(
-            self, download_file, after_file_downloaded, recursive
+            self, download_file, after_file_downloaded, recursive, max_workers
         )
 
     def get_folders(self, recursive=False):
@@ -295,6 +298,29 @@ class Folder(Entity):
         self.context.add_query(qry)
         return self
 
+    def bulk_upload_folder(
+        self, source_path, max_workers=8, skip_unchanged=True, file_uploaded=None
+    ):
+        # type: (str, int, bool, Optional[Callable[[File], None]]) -> FolderUploadResult
+        """
+        Uploads a local folder tree into the folder with a pool of workers, files which are up to date
+        (the same size and modified later than the local ones) are skipped. The upload is executed immediately
+
+        :param str source_path: Path of the local folder
+        :param int max_workers: Number of files uploaded at the same time
+        :param bool skip_unchanged: Skips files which are up to date
+        :param (File)->None file_uploaded: Called once a file has been uploaded
+        """
+        from office365.sharepoint.folders.uploader import FolderUploader
+
+        return FolderUploader(
+            self,
+            source_path,
+            max_workers=max_workers,
+            skip_unchanged=skip_unchanged,
+            file_uploaded=file_uploaded,
+        ).execute()
+
     def upload_file(self, file_name, content):
         """Uploads a file into folder.
         Note: This method only supports files up to 4MB in size!
@@ -446,9 +472,9 @@ class Folder(Entity):
     def storage_metrics(self):
         # type: () -> StorageMetrics
         """Specifies the storage-related metrics for list folders in the site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "StorageMetrics",
-            StorageMetrics(
+            lambda: StorageMetrics(
                 self.context, ResourcePath("StorageMetrics", self.resource_path)
             ),
         )
@@ -457,9 +483,9 @@ class Folder(Entity):
     def list_item_all_fields(self):
         # type: () -> ListItem
         """Specifies the list item fields values for the list item corresponding to the folder."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ListItemAllFields",
-            ListItem(
+            lambda: ListItem(
                 self.context, ResourcePath("ListItemAllFields", self.resource_path)
             ),
         )
@@ -470,9 +496,9 @@ class Folder(Entity):
         """Specifies the collection of files contained in the list folder."""
         from office365.sharepoint.files.collection import FileCollection  # noqa
 
-        return self.properties.get(
+        return self._get_navigation_property(
             "Files",
-            FileCollection(
+            lambda: FileCollection(
                 self.context, ResourcePath("Files", self.resource_path), self
             ),
         )
@@ -483,9 +509,9 @@ class Folder(Entity):
         """Specifies the collection of list folders contained within the list folder."""
         from office365.sharepoint.folders.collection import FolderCollection  # noqa
 
-        return self.properties.get(
+        return self._get_navigation_property(
             "Folders",
-            FolderCollection(
+            lambda: FolderCollection(
                 self.context, ResourcePath("Folders", self.resource_path), self
             ),
         )
@@ -494,9 +520,11 @@ class Folder(Entity):
     def parent_folder(self):
         # type: () -> "Folder"
         """Specifies the list folder."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ParentFolder",
-            Folder(self.context, ResourcePath("ParentFolder", self.resource_path)),
+            lambda: Folder(
+                self.context, ResourcePath("ParentFolder", self.resource_path)
+            ),
         )
 
     @property
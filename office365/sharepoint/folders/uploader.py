@@ -0,0 +1,98 @@
+import datetime
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from office365.folder_uploader import BaseFolderUploader, LocalFile, RemoteFile
+from office365.runtime.client_object_collection import ClientObjectCollection
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.odata.type import ODataType
+from office365.runtime.queries.client_query import ClientQuery
+from office365.runtime.queries.service_operation import ServiceOperationQuery
+from office365.sharepoint.files.creation_information import FileCreationInformation
+from office365.sharepoint.files.file import File
+
+if TYPE_CHECKING:
+    from office365.sharepoint.folders.folder import Folder
+
+
+class FolderUploader(BaseFolderUploader["Folder"]):
+    """
+    Uploads a local folder tree into a SharePoint folder, see BaseFolderUploader.
+
+    Files up to large_file_size are uploaded with a single request, larger ones as multiple chunks
+    (FileCollection.resumable_upload) once the others have been uploaded. The REST API does not expose
+    content hashes of files, a remote file is considered up to date when its size matches the local file
+    and it was modified after the local one.
+    """
+
+    def __init__(
+        self,
+        target,
+        source_path,
+        max_workers=8,
+        large_file_size=100 * 1024 * 1024,
+        chunk_size=10 * 1024 * 1024,
+        skip_unchanged=True,
+        batch_size=100,
+        file_uploaded=None,
+    ):
+        super(FolderUploader, self).__init__(
+            target.context,
+            target,
+            source_path,
+            max_workers,
+            large_file_size,
+            chunk_size,
+            skip_unchanged,
+            batch_size,
+            file_uploaded,
+        )
+
+    def _list_children(self, folder):
+        # type: (Folder) -> List[ClientObjectCollection]
+        return [
+            folder.files.select(["Name", "Length", "TimeLastModified"]).get_all(),
+            folder.folders.select(["Name"]).get_all(),
+        ]
+
+    def _get_remote_entry(self, entity):
+        # type: (File|Folder) -> Tuple[str, Optional[RemoteFile]]
+        if not isinstance(entity, File):
+            return entity.name, None
+        return entity.name, RemoteFile(
+            entity.length,
+            ODataType.try_parse_datetime(entity.properties.get("TimeLastModified")),
+        )
+
+    def _get_folder(self, parent, name):
+        # type: (Folder, str) -> Folder
+        return parent.folders.get_by_url(name)
+
+    def _create_folder(self, parent, name):
+        # type: (Folder, str) -> Folder
+        return parent.folders.add(name)
+
+    def _prepare_upload(self, folder, local_file):
+        # type: (Folder, LocalFile) -> Optional[Tuple[ClientQuery, RequestOptions, callable]]
+        if local_file.size > self._large_file_size:
+            return None
+        return_type = File(self._context)
+        params = FileCreationInformation(url=local_file.name, overwrite=True)
+        qry = ServiceOperationQuery(
+            folder.files, "add", params.to_json(), None, None, return_type
+        )
+        return qry, self._context.build_request(qry), self._send_content
+
+    def _upload_large_file(self, folder, local_file):
+        # type: (Folder, LocalFile) -> File
+        return folder.files.resumable_upload(
+            local_file.path, self._chunk_size, file_name=local_file.name
+        )
+
+    def _is_unchanged(self, local_file, remote_file):
+        # type: (LocalFile, RemoteFile) -> bool
+        if remote_file.modified is None:
+            return False
+        local_modified = datetime.datetime.fromtimestamp(
+            local_file.modified, datetime.timezone.utc
+        ).replace(tzinfo=None)
+        return remote_file.modified >= local_modified
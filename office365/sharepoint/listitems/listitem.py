@@ -43,6 +43,18 @@ class ListItem(SecurableObject):
     """An individual entry within a SharePoint list. Each list item has a schema that maps to fields in the list
     that contains the item, depending on the content type of the item."""
 
+    _property_mapping = {
+        "AttachmentFiles": "attachment_files",
+        "ContentType": "content_type",
+        "ComplianceInfo": "compliance_info",
+        "EffectiveBasePermissions": "effective_base_permissions",
+        "GetDlpPolicyTip": "get_dlp_policy_tip",
+        "FieldValuesAsHtml": "field_values_as_html",
+        "LikedByInformation": "liked_by_information",
+        "ParentList": "parent_list",
+    }
+    """Maps navigation properties to attributes, so that only the requested default gets instantiated"""
+
     def __init__(self, context, resource_path=None, parent_list=None):
         """
 
@@ -377,9 +389,9 @@ class ListItem(SecurableObject):
         """Get parent List"""
         from office365.sharepoint.lists.list import List
 
-        return self.properties.get(
+        return self._get_navigation_property(
             "ParentList",
-            List(self.context, ResourcePath("ParentList", self.resource_path)),
+            lambda: List(self.context, ResourcePath("ParentList", self.resource_path)),
         )
 
     @property
@@ -387,8 +399,8 @@ class ListItem(SecurableObject):
         """Get file"""
         from office365.sharepoint.files.file import File
 
-        return self.properties.get(
-            "File", File(self.context, ResourcePath("File", self.resource_path))
+        return self._get_navigation_property(
+            "File", lambda: File(self.context, ResourcePath("File", self.resource_path))
         )
 
     @property
@@ -396,21 +408,22 @@ class ListItem(SecurableObject):
         """Get folder"""
         from office365.sharepoint.folders.folder import Folder
 
-        return self.properties.get(
-            "Folder", Folder(self.context, ResourcePath("Folder", self.resource_path))
+        return self._get_navigation_property(
+            "Folder",
+            lambda: Folder(self.context, ResourcePath("Folder", self.resource_path)),
         )
 
     @property
     def attachment_files(self):
         # type: () -> AttachmentCollection
         """Specifies the collection of attachments that are associated with the list item.<62>"""
-        from office365.sharepoint.attachments.collection import (
-            AttachmentCollection,  # noqa
+        from office365.sharepoint.attachments.collection import (  # noqa
+            AttachmentCollection,
         )
 
-        return self.properties.get(
+        return self._get_navigation_property(
             "AttachmentFiles",
-            AttachmentCollection(
+            lambda: AttachmentCollection(
                 self.context, ResourcePath("AttachmentFiles", self.resource_path), self
             ),
         )
@@ -420,9 +433,11 @@ class ListItem(SecurableObject):
         """Gets a value that specifies the content type of the list item."""
         from office365.sharepoint.contenttypes.content_type import ContentType
 
-        return self.properties.get(
+        return self._get_navigation_property(
             "ContentType",
-            ContentType(self.context, ResourcePath("ContentType", self.resource_path)),
+            lambda: ContentType(
+                self.context, ResourcePath("ContentType", self.resource_path)
+            ),
         )
 
     @property
@@ -470,9 +485,9 @@ class ListItem(SecurableObject):
     @property
     def get_dlp_policy_tip(self):
         """Gets the Data Loss Protection policy tip notification for this item."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "GetDlpPolicyTip",
-            DlpPolicyTip(
+            lambda: DlpPolicyTip(
                 self.context, ResourcePath("GetDlpPolicyTip", self.resource_path)
             ),
         )
@@ -480,9 +495,9 @@ class ListItem(SecurableObject):
     @property
     def field_values_as_html(self):
         """Specifies the values for the list item as Hypertext Markup Language (HTML)."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "FieldValuesAsHtml",
-            FieldStringValues(
+            lambda: FieldStringValues(
                 self.context, ResourcePath("FieldValuesAsHtml", self.resource_path)
             ),
         )
@@ -490,9 +505,9 @@ class ListItem(SecurableObject):
     @property
     def liked_by_information(self):
         """Gets a value that specifies the list item identifier."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "LikedByInformation",
-            LikedByInformation(
+            lambda: LikedByInformation(
                 self.context, ResourcePath("likedByInformation", self.resource_path)
             ),
         )
@@ -500,26 +515,16 @@ class ListItem(SecurableObject):
     @property
     def versions(self):
         """Gets the collection of item version objects that represent the versions of the item."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Versions",
-            ListItemVersionCollection(
+            lambda: ListItemVersionCollection(
                 self.context, ResourcePath("versions", self.resource_path)
             ),
         )
 
     def get_property(self, name, default_value=None):
-        if default_value is None:
-            property_mapping = {
-                "AttachmentFiles": self.attachment_files,
-                "ContentType": self.content_type,
-                "ComplianceInfo": self.compliance_info,
-                "EffectiveBasePermissions": self.effective_base_permissions,
-                "GetDlpPolicyTip": self.get_dlp_policy_tip,
-                "FieldValuesAsHtml": self.field_values_as_html,
-                "LikedByInformation": self.liked_by_information,
-                "ParentList": self.parent_list,
-            }
-            default_value = property_mapping.get(name, None)
+        if default_value is None and name in self._property_mapping:
+            default_value = getattr(self, self._property_mapping[name])
 
         value = super(ListItem, self).get_property(name, default_value)
         if self.is_property_available(name[:-2]):
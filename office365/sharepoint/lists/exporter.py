@@ -0,0 +1,293 @@
+import csv
+import datetime
+import json
+from typing import IO, Any, Dict, List, Optional
+
+from office365.runtime.client_object_collection import ClientObjectCollection
+from office365.runtime.odata.type import ODataType
+from office365.sharepoint.fields.field import Field
+from office365.sharepoint.listitems.listitem import ListItem
+
+
+class ListExportFormat:
+    """File formats supported by List.export"""
+
+    Csv = "csv"
+    Arrow = "arrow"
+    Parquet = "parquet"
+
+
+_LOOKUP_TYPES = ("Lookup", "LookupMulti", "User", "UserMulti")
+_TAXONOMY_TYPES = ("TaxonomyFieldType", "TaxonomyFieldTypeMulti")
+_MULTI_TYPES = ("LookupMulti", "UserMulti", "TaxonomyFieldTypeMulti", "MultiChoice")
+_FLOAT_TYPES = ("Number", "Currency")
+_INTEGER_TYPES = ("Integer", "Counter")
+
+_BUILTIN_TYPES = {"ID": "Counter", "Id": "Counter"}
+"""Columns which are not returned by the list fields endpoint"""
+
+
+class ListExportColumn(object):
+    """Describes how a list field is selected and converted into a column value"""
+
+    def __init__(self, name, field=None):
+        # type: (str, Optional[Field]) -> None
+        """
+        :param str name: Column name, the internal name of the field
+        :param Field or None field: List field, None for columns unknown to the list
+        """
+        self.name = name
+        if field is not None:
+            self.type_name = field.type_as_string
+            self.lookup_field = field.properties.get("LookupField", None)
+        else:
+            self.type_name = _BUILTIN_TYPES.get(name, None)
+            self.lookup_field = None
+        # internal names which start with an underscore are prefixed in payloads, e.g. OData__UIVersionString
+        self.key = "OData_" + name if name.startswith("_") else name
+        if self.type_name in ("User", "UserMulti"):
+            self.lookup_field = "Title"
+        elif self.type_name in ("Lookup", "LookupMulti") and not self.lookup_field:
+            self.lookup_field = "Title"
+
+    @property
+    def is_multi(self):
+        # type: () -> bool
+        return self.type_name in _MULTI_TYPES
+
+    @property
+    def is_text(self):
+        # type: () -> bool
+        """Determines whether values are exported as strings"""
+        return self.type_name not in _FLOAT_TYPES + _INTEGER_TYPES + (
+            "Boolean",
+            "DateTime",
+        )
+
+    @property
+    def select(self):
+        # type: () -> str
+        if self.type_name in _LOOKUP_TYPES:
+            return "{0}/{1}".format(self.key, self.lookup_field)
+        return self.key
+
+    @property
+    def expand(self):
+        # type: () -> Optional[str]
+        if self.type_name in _LOOKUP_TYPES:
+            return self.key
+        return None
+
+    def convert(self, value, terms):
+        # type: (Any, Dict[str, str]) -> Any
+        """
+        Converts a value as returned by the service into a column value
+
+        :param value: The value of the field
+        :param dict terms: Term labels of the list item by WssId, see TaxCatchAll
+        """
+        if value is None:
+            return [] if self.is_multi else None
+        if self.is_multi:
+            if isinstance(value, dict):
+                value = [value[k] for k in sorted(value)]
+            return [self._convert_single(v, terms) for v in value]
+        return self._convert_single(value, terms)
+
+    def _convert_single(self, value, terms):
+        # type: (Any, Dict[str, str]) -> Any
+        if self.type_name in _LOOKUP_TYPES:
+            value = value.get(self.lookup_field, None)
+        elif self.type_name in _TAXONOMY_TYPES:
+            label = terms.get(str(value.get("WssId", None)), None)
+            value = label if label is not None else value.get("Label", None)
+        elif self.type_name == "URL":
+            value = value.get("Url", None)
+        elif isinstance(value, (dict, list)):
+            return json.dumps(value)
+        if self.is_text and value is not None and not isinstance(value, str):
+            return str(value)
+        return value
+
+
+class ListItemExporter(ClientObjectCollection[ListItem]):
+    """
+    Receives list items page by page and writes them into a file column-wise.
+    Items are converted straight from the payload, ListItem objects are never constructed,
+    so that only a single page of column values is kept in memory
+    """
+
+    def __init__(self, source, columns, writer):
+        # type: (ClientObjectCollection, List[ListExportColumn], "ListExportWriter") -> None
+        """
+        :param ClientObjectCollection source: List items collection
+        :param list[ListExportColumn] columns: Columns to export
+        :param ListExportWriter writer: Writes pages of column values
+        """
+        super(ListItemExporter, self).__init__(
+            source.context, ListItem, source.resource_path
+        )
+        self._columns = columns
+        self._writer = writer
+        self._buffers = {c.name: [] for c in columns}
+        self._has_taxonomy = any(c.type_name in _TAXONOMY_TYPES for c in columns)
+        self.row_count = 0
+        select = [c.select for c in columns]
+        expand = [c.expand for c in columns if c.expand is not None]
+        if self._has_taxonomy:
+            select.extend(["TaxCatchAll/ID", "TaxCatchAll/Term"])
+            expand.append("TaxCatchAll")
+        self.query_options.select = select
+        self.query_options.expand = expand
+        self.streamed()
+
+    def set_property(self, key, value, persist_changes=False):
+        # type: (str | int, dict, bool) -> "ListItemExporter"
+        if key == "__nextLinkUrl":
+            self._next_request_url = value
+            return self
+
+        terms = {}
+        if self._has_taxonomy:
+            catch_all = value.get("TaxCatchAll", None) or {}
+            for term in catch_all.values():
+                terms[str(term.get("ID", None))] = term.get("Term", None)
+        for column in self._columns:
+            self._buffers[column.name].append(
+                column.convert(value.get(column.key, None), terms)
+            )
+        self.row_count += 1
+        return self
+
+    def flush(self):
+        # type: () -> None
+        """Writes the buffered page"""
+        if not self._buffers[self._columns[0].name]:
+            return
+        for column in self._columns:
+            if column.type_name == "DateTime":
+                self._buffers[column.name] = ODataType.try_parse_datetimes(
+                    self._buffers[column.name]
+                )
+        self._writer.write(self._buffers)
+        self._buffers = {c.name: [] for c in self._columns}
+
+    def close(self):
+        # type: () -> None
+        self.flush()
+        self._writer.close()
+
+
+class ListExportWriter(object):
+    """Writes pages of column values into a file"""
+
+    def __init__(self, output, columns):
+        # type: (str | IO, List[ListExportColumn]) -> None
+        self._output = output
+        self._columns = columns
+
+    def write(self, batch):
+        # type: (Dict[str, List[Any]]) -> None
+        """
+        :param dict batch: Column values by column name
+        """
+        raise NotImplementedError("write")
+
+    def close(self):
+        # type: () -> None
+        pass
+
+    @staticmethod
+    def create(output, columns, file_format):
+        # type: (str | IO, List[ListExportColumn], str) -> "ListExportWriter"
+        if file_format == ListExportFormat.Csv:
+            return CsvListExportWriter(output, columns)
+        elif file_format in (ListExportFormat.Arrow, ListExportFormat.Parquet):
+            return ArrowListExportWriter(output, columns, file_format)
+        raise ValueError("Unsupported export format: {0}".format(file_format))
+
+
+class CsvListExportWriter(ListExportWriter):
+    """Writes rows into a CSV file, multiple values are separated by a semicolon"""
+
+    def __init__(self, output, columns):
+        # type: (str | IO, List[ListExportColumn]) -> None
+        super(CsvListExportWriter, self).__init__(output, columns)
+        if isinstance(output, str):
+            self._file = open(output, "w", newline="", encoding="utf-8")
+        else:
+            self._file = output
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([c.name for c in columns])
+
+    def write(self, batch):
+        # type: (Dict[str, List[Any]]) -> None
+        self._writer.writerows(
+            zip(*[map(self._format, batch[c.name]) for c in self._columns])
+        )
+
+    def close(self):
+        # type: () -> None
+        if self._file is not self._output:
+            self._file.close()
+
+    @staticmethod
+    def _format(value):
+        # type: (Any) -> Any
+        if value is None:
+            return ""
+        elif isinstance(value, list):
+            return "; ".join(str(v) for v in value if v is not None)
+        elif isinstance(value, datetime.datetime):
+            return value.isoformat()
+        return value
+
+
+class ArrowListExportWriter(ListExportWriter):
+    """Writes record batches into an Arrow IPC stream or a Parquet file"""
+
+    def __init__(self, output, columns, file_format):
+        # type: (str | IO, List[ListExportColumn], str) -> None
+        super(ArrowListExportWriter, self).__init__(output, columns)
+        pa = _get_pyarrow()
+        self._schema = pa.schema([(c.name, _get_arrow_type(pa, c)) for c in columns])
+        if file_format == ListExportFormat.Parquet:
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(output, self._schema)
+        else:
+            self._writer = pa.ipc.new_stream(output, self._schema)
+
+    def write(self, batch):
+        # type: (Dict[str, List[Any]]) -> None
+        pa = _get_pyarrow()
+        self._writer.write_table(pa.Table.from_pydict(batch, schema=self._schema))
+
+    def close(self):
+        # type: () -> None
+        self._writer.close()
+
+
+def _get_arrow_type(pa, column):
+    # type: (Any, ListExportColumn) -> Any
+    if column.type_name in _FLOAT_TYPES:
+        value_type = pa.float64()
+    elif column.type_name in _INTEGER_TYPES:
+        value_type = pa.int64()
+    elif column.type_name == "Boolean":
+        value_type = pa.bool_()
+    elif column.type_name == "DateTime":
+        value_type = pa.timestamp("us", tz="UTC")
+    else:
+        value_type = pa.string()
+    return pa.list_(value_type) if column.is_multi else value_type
+
+
+def _get_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "To export into Arrow or Parquet format the package 'pyarrow' needs to be installed."
+        )
+    return pyarrow
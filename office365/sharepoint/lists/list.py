@@ -1,6 +1,6 @@
 import os
 from datetime import datetime
-from typing import TYPE_CHECKING, AnyStr, Dict, Optional
+from typing import IO, TYPE_CHECKING, AnyStr, Dict, Iterator, Optional
 
 from office365.runtime.client_result import ClientResult
 from office365.runtime.client_value_collection import ClientValueCollection
@@ -60,6 +60,8 @@ from office365.sharepoint.views.view import View
 from office365.sharepoint.webhooks.subscription_collection import SubscriptionCollection
 
 if TYPE_CHECKING:
+    from office365.sharepoint.changes.sync import ChangeSyncEvent
+    from office365.sharepoint.changes.token_store import ChangeTokenStore
     from office365.sharepoint.lists.collection import ListCollection
 
 
@@ -492,6 +494,96 @@ class List(SecurableObject):
         self.context.add_query(qry)
         return return_type
 
+    def export(self, columns, output, file_format="csv", page_size=5000):
+        # type: (list[str], str|IO, str, int) -> ClientResult[int]
+        """
+        Exports list items into a CSV, Arrow IPC stream or Parquet file. Items are written page by page
+        straight from the payload, so that memory stays bounded regardless of the size of the list.
+        Lookup and user fields are exported as the looked up values, taxonomy fields as term labels,
+        date and time fields as UTC datetime values. Arrow and Parquet formats require pyarrow package
+
+        Returns the number of exported items.
+
+        :param list[str] columns: Internal names of the fields to export
+        :param str or typing.IO output: Path to the file or a writable file object
+        :param str file_format: File format, see ListExportFormat
+        :param int page_size: Number of items retrieved per request
+        """
+        from office365.sharepoint.lists.exporter import (
+            ListExportColumn,
+            ListExportWriter,
+            ListItemExporter,
+        )
+
+        if not columns:
+            raise ValueError("At least one column has to be specified")
+        return_type = ClientResult(self.context, int())
+        fields = FieldCollection(
+            self.context, ResourcePath("Fields", self.resource_path), self
+        ).filter(" or ".join("InternalName eq '{0}'".format(name) for name in columns))
+
+        def _fields_loaded(col):
+            # type: (FieldCollection) -> None
+            fields_by_name = {f.internal_name: f for f in col}
+            export_columns = [
+                ListExportColumn(name, fields_by_name.get(name, None))
+                for name in columns
+            ]
+            writer = ListExportWriter.create(output, export_columns, file_format)
+            exporter = ListItemExporter(self.items, export_columns, writer)
+
+            def _page_loaded(items):
+                # type: (ListItemExporter) -> None
+                exporter.flush()
+                if not exporter.has_next:
+                    exporter.close()
+                    return_type.set_property("__value", exporter.row_count)
+
+            exporter.get_all(page_size, _page_loaded)
+
+        fields.get().after_execute(_fields_loaded)
+        return return_type
+
+    def iter_items_partitioned(
+        self,
+        partitions=8,
+        page_size=5000,
+        max_workers=None,
+        ordered=False,
+        properties=None,
+        buffer_pages=1,
+    ):
+        # type: (int, int, Optional[int], bool, Optional[list[str]], int) -> Iterator[ListItem]
+        """
+        Enumerates list items by splitting the range of item identifiers into windows
+        (ID ge x and ID lt y) which are paged through concurrently. Requests are sent immediately,
+        regardless of the pending queries of the context
+
+        :param int partitions: Number of identifier windows
+        :param int page_size: Number of items per request
+        :param int or None max_workers: Number of requests in flight, defaults to the number of windows
+        :param bool ordered: Yields items ordered by identifier, otherwise in the order pages are received
+        :param list[str] or None properties: Item properties to retrieve
+        :param int buffer_pages: Number of received pages a window keeps before its next page is requested,
+            a larger buffer speeds up ordered mode at the expense of memory
+        """
+        from office365.sharepoint.lists.partitioned_reader import (
+            ListItemPartitionedReader,
+        )
+
+        return iter(
+            ListItemPartitionedReader(
+                self.context,
+                self.items.resource_path,
+                partitions,
+                page_size,
+                max_workers,
+                ordered,
+                properties,
+                buffer_pages,
+            )
+        )
+
     def add_item(self, creation_information):
         # type: (ListItemCreationInformation|dict) -> ListItem
         """The recommended way to add a list item is to send a POST request to the ListItemCollection resource endpoint,
@@ -639,6 +731,24 @@ class List(SecurableObject):
         self.context.add_query(qry)
         return return_type
 
+    def sync_changes(self, store, properties=None, batch_size=1000, page_size=5000):
+        # type: (ChangeTokenStore, Optional[list[str]], int, int) -> Iterator[ChangeSyncEvent]
+        """
+        Returns events of items changed since the previous synchronization of the list, the last processed
+        change token is kept in the store. When there is no token or it has expired, a reset event is returned
+        followed by events of all the items
+
+        :param ChangeTokenStore store: Persistent store of change tokens, e.g. SqliteChangeTokenStore
+        :param list[str] or None properties: Item properties to retrieve
+        :param int batch_size: Number of changes retrieved per request
+        :param int page_size: Number of items per request during a full synchronization
+        """
+        from office365.sharepoint.changes.sync import ListChangeSynchronizer
+
+        return iter(
+            ListChangeSynchronizer(self, store, properties, batch_size, page_size)
+        )
+
     def get_checked_out_files(self):
         """Returns a collection of checked-out files as specified in section 3.2.5.381."""
         return_type = CheckedOutFileCollection(self.context)
@@ -702,8 +812,9 @@ class List(SecurableObject):
     @property
     def author(self):
         """Specifies the user who created the list."""
-        return self.properties.get(
-            "Author", User(self.context, ResourcePath("Author", self.resource_path))
+        return self._get_navigation_property(
+            "Author",
+            lambda: User(self.context, ResourcePath("Author", self.resource_path)),
         )
 
     @property
@@ -788,9 +899,9 @@ class List(SecurableObject):
          The consumer SHOULD also consider appending &IsDlg=1 to the link, to remove the UI from the linked page,
          if desired.
         """
-        return self.properties.get(
+        return self._get_navigation_property(
             "CreatablesInfo",
-            CreatablesInfo(
+            lambda: CreatablesInfo(
                 self.context, ResourcePath("CreatablesInfo", self.resource_path)
             ),
         )
@@ -957,27 +1068,31 @@ class List(SecurableObject):
     def items(self):
         # type: () -> ListItemCollection
         """Get list items"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Items",
-            ListItemCollection(self.context, ResourcePath("items", self.resource_path)),
+            lambda: ListItemCollection(
+                self.context, ResourcePath("items", self.resource_path)
+            ),
         )
 
     @property
     def root_folder(self):
         # type: () -> Folder
         """Get a root folder"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "RootFolder",
-            Folder(self.context, ResourcePath("RootFolder", self.resource_path)),
+            lambda: Folder(
+                self.context, ResourcePath("RootFolder", self.resource_path)
+            ),
         )
 
     @property
     def fields(self):
         # type: () -> FieldCollection
         """Gets a value that specifies the collection of all fields in the list."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Fields",
-            FieldCollection(
+            lambda: FieldCollection(
                 self.context, ResourcePath("Fields", self.resource_path), self
             ),
         )
@@ -985,9 +1100,9 @@ class List(SecurableObject):
     @property
     def subscriptions(self):
         """Gets one or more webhook subscriptions on a SharePoint list."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Subscriptions",
-            SubscriptionCollection(
+            lambda: SubscriptionCollection(
                 self.context, ResourcePath("Subscriptions", self.resource_path), self
             ),
         )
@@ -997,9 +1112,9 @@ class List(SecurableObject):
         # type: () -> ViewCollection
         """Gets a value that specifies the collection of all public views on the list and personal views
         of the current user on the list."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Views",
-            ViewCollection(
+            lambda: ViewCollection(
                 self.context, ResourcePath("views", self.resource_path), self
             ),
         )
@@ -1007,17 +1122,19 @@ class List(SecurableObject):
     @property
     def default_view(self):
         """Gets or sets a value that specifies whether the list view is the default list view."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "DefaultView",
-            View(self.context, ResourcePath("DefaultView", self.resource_path), self),
+            lambda: View(
+                self.context, ResourcePath("DefaultView", self.resource_path), self
+            ),
         )
 
     @property
     def content_types(self):
         """Gets the content types that are associated with the list."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ContentTypes",
-            ContentTypeCollection(
+            lambda: ContentTypeCollection(
                 self.context, ResourcePath("ContentTypes", self.resource_path), self
             ),
         )
@@ -1058,9 +1175,9 @@ class List(SecurableObject):
     @property
     def user_custom_actions(self):
         """Gets the User Custom Actions that are associated with the list."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "UserCustomActions",
-            UserCustomActionCollection(
+            lambda: UserCustomActionCollection(
                 self.context, ResourcePath("UserCustomActions", self.resource_path)
             ),
         )
@@ -1074,9 +1191,11 @@ class List(SecurableObject):
     @property
     def forms(self):
         """Gets a value that specifies the collection of all list forms in the list."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Forms",
-            FormCollection(self.context, ResourcePath("forms", self.resource_path)),
+            lambda: FormCollection(
+                self.context, ResourcePath("forms", self.resource_path)
+            ),
         )
 
     @property
@@ -1084,17 +1203,17 @@ class List(SecurableObject):
         """Gets a value that specifies the web where list resides."""
         from office365.sharepoint.webs.web import Web
 
-        return self.properties.get(
+        return self._get_navigation_property(
             "ParentWeb",
-            Web(self.context, ResourcePath("parentWeb", self.resource_path)),
+            lambda: Web(self.context, ResourcePath("parentWeb", self.resource_path)),
         )
 
     @property
     def event_receivers(self):
         """Get Event receivers"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "EventReceivers",
-            EventReceiverDefinitionCollection(
+            lambda: EventReceiverDefinitionCollection(
                 self.context, ResourcePath("eventReceivers", self.resource_path), self
             ),
         )
@@ -1275,9 +1394,9 @@ class List(SecurableObject):
     @property
     def description_resource(self):
         """Represents the description of this list."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "DescriptionResource",
-            UserResource(
+            lambda: UserResource(
                 self.context, ResourcePath("DescriptionResource", self.resource_path)
             ),
         )
@@ -1305,9 +1424,9 @@ class List(SecurableObject):
     @property
     def title_resource(self):
         """Represents the title of this list."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "TitleResource",
-            UserResource(
+            lambda: UserResource(
                 self.context, ResourcePath("TitleResource", self.resource_path)
             ),
         )
@@ -0,0 +1,202 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Deque, Iterator, List, Optional
+
+import requests
+from requests import HTTPError
+
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.paths.resource_path import ResourcePath
+from office365.runtime.queries.read_entity import ReadEntityQuery
+from office365.sharepoint.listitems.collection import ListItemCollection
+from office365.sharepoint.listitems.listitem import ListItem
+
+if TYPE_CHECKING:
+    from office365.sharepoint.client_context import ClientContext
+
+
+class _IdRangeWindow(object):
+    """List items whose identifiers fall within [start_id, end_id), retrieved page by page"""
+
+    def __init__(self, items, start_id, end_id):
+        # type: (ListItemCollection, int, int) -> None
+        self.items = items.filter("ID ge {0} and ID lt {1}".format(start_id, end_id))
+        self.pages = deque()  # type: Deque[List[ListItem]]
+        self.query = None  # type: Optional[ReadEntityQuery]
+        self.future = None  # type: Optional[Future]
+        self.next_url = None  # type: Optional[str]
+        self.started = False
+
+    @property
+    def is_completed(self):
+        # type: () -> bool
+        return (
+            self.started
+            and self.future is None
+            and self.next_url is None
+            and not self.pages
+        )
+
+
+class ListItemPartitionedReader(object):
+    """
+    Enumerates list items by splitting the range of item identifiers into windows which are paged through
+    independently and concurrently. Every request filters on the indexed ID column, so that
+    the list view threshold is never exceeded.
+
+    Requests are built on the calling thread and sent from a pool of threads, responses are processed
+    on the calling thread. A window keeps at most buffer_pages pages which have not been consumed yet,
+    so memory is bounded by the number of windows multiplied by the buffer and page sizes.
+    """
+
+    def __init__(
+        self,
+        context,
+        items_path,
+        partitions=8,
+        page_size=5000,
+        max_workers=None,
+        ordered=False,
+        properties=None,
+        buffer_pages=1,
+    ):
+        # type: (ClientContext, ResourcePath, int, int, Optional[int], bool, Optional[List[str]], int) -> None
+        """
+        :param office365.sharepoint.client_context.ClientContext context: SharePoint context
+        :param ResourcePath items_path: Resource path of the list items
+        :param int partitions: Number of identifier windows
+        :param int page_size: Number of items per request
+        :param int or None max_workers: Number of requests in flight, defaults to the number of windows
+        :param bool ordered: Yields items ordered by identifier, otherwise in the order pages are received
+        :param list[str] or None properties: Item properties to retrieve
+        :param int buffer_pages: Number of received pages a window keeps before its next page is requested.
+            In ordered mode windows wait for the preceding ones, a larger buffer lets them run ahead
+        """
+        if partitions < 1:
+            raise ValueError("Number of partitions must be positive")
+        self._items_path = items_path
+        self._context = context
+        self._partitions = partitions
+        self._page_size = page_size
+        self._max_workers = max_workers or partitions
+        self._ordered = ordered
+        self._properties = properties
+        self._buffer_pages = buffer_pages
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+
+    def __iter__(self):
+        # type: () -> Iterator[ListItem]
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        windows = []  # type: List[_IdRangeWindow]
+        try:
+            id_range = self._get_id_range()
+            if id_range is None:
+                return
+            windows = self._create_windows(*id_range)
+            while windows:
+                self._schedule(windows)
+                window = self._get_ready_window(windows)
+                if window is None:
+                    self._receive(windows)
+                    continue
+                page = window.pages.popleft()
+                if window.is_completed:
+                    windows.remove(window)
+                for item in page:
+                    yield item
+        finally:
+            for window in windows:
+                if window.future is not None:
+                    window.future.cancel()
+            self._executor.shutdown(wait=False)
+
+    def _get_id_range(self):
+        # type: () -> Optional[tuple]
+        """Returns the lowest and the highest item identifiers, None when the list is empty"""
+        bounds = [
+            self._create_items().select(["ID"]).order_by(order).top(1)
+            for order in ("ID asc", "ID desc")
+        ]
+        futures = [self._send(items) for items in bounds]
+        for items, (qry, future) in zip(bounds, futures):
+            self._process(qry, future)
+        if len(bounds[0]) == 0 or len(bounds[1]) == 0:
+            return None
+        return tuple(b[0].properties.get("ID", b[0].id) for b in bounds)
+
+    def _create_windows(self, min_id, max_id):
+        # type: (int, int) -> List[_IdRangeWindow]
+        size = -(-(max_id + 1 - min_id) // self._partitions)
+        windows = []
+        for start_id in range(min_id, max_id + 1, size):
+            items = self._create_items().order_by("ID").top(self._page_size)
+            if self._properties:
+                items.select(self._properties)
+            windows.append(
+                _IdRangeWindow(items, start_id, min(start_id + size, max_id + 1))
+            )
+        return windows
+
+    def _create_items(self):
+        # type: () -> ListItemCollection
+        return ListItemCollection(self._context, self._items_path)
+
+    def _schedule(self, windows):
+        # type: (List[_IdRangeWindow]) -> None
+        """Requests next pages of windows whose buffers are not full, in window order"""
+        in_flight = len([w for w in windows if w.future is not None])
+        for window in windows:
+            if in_flight >= self._max_workers:
+                break
+            if window.future is not None or len(window.pages) >= self._buffer_pages:
+                continue
+            if window.started and window.next_url is None:
+                continue
+            window.query, window.future = self._send(window.items, window.next_url)
+            window.started = True
+            in_flight += 1
+
+    def _get_ready_window(self, windows):
+        # type: (List[_IdRangeWindow]) -> Optional[_IdRangeWindow]
+        if self._ordered:
+            window = windows[0]
+            if window.pages:
+                return window
+            if window.is_completed:
+                windows.remove(window)
+            return None
+        return next((w for w in windows if w.pages), None)
+
+    def _receive(self, windows):
+        # type: (List[_IdRangeWindow]) -> None
+        """Waits for responses and turns them into pages"""
+        futures = [w.future for w in windows if w.future is not None]
+        if not futures:
+            return
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for window in windows:
+            if window.future in done:
+                self._process(window.query, window.future)
+                window.next_url = window.items._next_request_url
+                window.pages.append(window.items.current_page)
+                window.items._data = []
+                window.query = window.future = None
+
+    def _send(self, items, url=None):
+        # type: (ListItemCollection, Optional[str]) -> tuple
+        qry = ReadEntityQuery(items)
+        request = self._context.build_request(qry)
+        if url is not None:
+            request.url = url
+        request.stream = False
+        return qry, self._executor.submit(self._context.pending_request().send, request)
+
+    def _process(self, qry, future):
+        # type: (ReadEntityQuery, Future) -> None
+        client_request = self._context.pending_request()
+        try:
+            response = future.result()  # type: requests.Response
+            client_request.process_response(response, qry)
+            client_request.afterExecute.notify(response)
+        except HTTPError as e:
+            raise ClientRequestException(*e.args, response=e.response)
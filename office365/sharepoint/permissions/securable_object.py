@@ -164,9 +164,9 @@ class SecurableObject(Entity):
     def first_unique_ancestor_securable_object(self):
         # type: () -> SecurableObject
         """Specifies the object where role assignments for this object are defined"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "FirstUniqueAncestorSecurableObject",
-            SecurableObject(
+            lambda: SecurableObject(
                 self.context,
                 ResourcePath("FirstUniqueAncestorSecurableObject", self.resource_path),
             ),
@@ -176,9 +176,9 @@ class SecurableObject(Entity):
     def role_assignments(self):
         # type: () -> RoleAssignmentCollection
         """The role assignments for the securable object."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "RoleAssignments",
-            RoleAssignmentCollection(
+            lambda: RoleAssignmentCollection(
                 self.context, ResourcePath("RoleAssignments", self.resource_path)
             ),
         )
@@ -16,6 +16,7 @@ class SharePointRequest(ODataRequest):
         super().__init__(JsonLightFormat())
         self._auth_context = AuthenticationContext(url=base_url)
         self.beforeExecute += self._authenticate_request
+        self.unauthorized += self._reauthenticate_request
 
     def execute_request(self, path):
         # type: (str) -> Response
@@ -37,3 +38,8 @@ class SharePointRequest(ODataRequest):
         # type: (RequestOptions) -> None
         """Authenticate request"""
         self._auth_context.authenticate_request(request)
+
+    def _reauthenticate_request(self, request):
+        # type: (RequestOptions) -> None
+        """Renews rejected credentials"""
+        self._auth_context.reauthenticate_request(request)
@@ -520,8 +520,9 @@ class Site(Entity):
     @property
     def audit(self):
         """Enables auditing of how site collection is accessed, changed, and used."""
-        return self.properties.get(
-            "Audit", Audit(self.context, ResourcePath("Audit", self.resource_path))
+        return self._get_navigation_property(
+            "Audit",
+            lambda: Audit(self.context, ResourcePath("Audit", self.resource_path)),
         )
 
     @property
@@ -581,16 +582,18 @@ class Site(Entity):
     def root_web(self):
         # type: () -> Web
         """Get root web"""
-        return self.properties.get(
-            "RootWeb", Web(self.context, ResourcePath("RootWeb", self.resource_path))
+        return self._get_navigation_property(
+            "RootWeb",
+            lambda: Web(self.context, ResourcePath("RootWeb", self.resource_path)),
         )
 
     @property
     def owner(self):
         # type: () -> User
         """Gets or sets the owner of the site collection. (Read-only in sandboxed solutions.)"""
-        return self.properties.get(
-            "Owner", User(self.context, ResourcePath("Owner", self.resource_path))
+        return self._get_navigation_property(
+            "Owner",
+            lambda: User(self.context, ResourcePath("Owner", self.resource_path)),
         )
 
     @property
@@ -682,17 +685,19 @@ class Site(Entity):
     @property
     def secondary_contact(self):
         """Gets or sets the secondary contact that is used for the site collection."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "SecondaryContact",
-            User(self.context, ResourcePath("SecondaryContact", self.resource_path)),
+            lambda: User(
+                self.context, ResourcePath("SecondaryContact", self.resource_path)
+            ),
         )
 
     @property
     def recycle_bin(self):
         """Get recycle bin"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "RecycleBin",
-            RecycleBinItemCollection(
+            lambda: RecycleBinItemCollection(
                 self.context, ResourcePath("RecycleBin", self.resource_path)
             ),
         )
@@ -701,9 +706,9 @@ class Site(Entity):
     def features(self):
         # type: () -> FeatureCollection
         """Get features"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Features",
-            FeatureCollection(
+            lambda: FeatureCollection(
                 self.context, ResourcePath("Features", self.resource_path), self
             ),
         )
@@ -728,9 +733,9 @@ class Site(Entity):
         """
         Provides event receivers for events that occur at the scope of the site collection.
         """
-        return self.properties.get(
+        return self._get_navigation_property(
             "EventReceivers",
-            EventReceiverDefinitionCollection(
+            lambda: EventReceiverDefinitionCollection(
                 self.context, ResourcePath("eventReceivers", self.resource_path), self
             ),
         )
@@ -799,9 +804,9 @@ class Site(Entity):
     @property
     def user_custom_actions(self):
         """Gets the User Custom Actions that are associated with the site."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "UserCustomActions",
-            UserCustomActionCollection(
+            lambda: UserCustomActionCollection(
                 self.context, ResourcePath("UserCustomActions", self.resource_path)
             ),
         )
@@ -809,9 +814,9 @@ class Site(Entity):
     @property
     def version_policy_for_new_libraries_template(self):
         """"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "VersionPolicyForNewLibrariesTemplate",
-            SiteVersionPolicyManager(
+            lambda: SiteVersionPolicyManager(
                 self.context,
                 ResourcePath(
                     "VersionPolicyForNewLibrariesTemplate", self.resource_path
@@ -13,10 +13,14 @@ class TaxonomyService(ClientRuntimeContext):
         :type  context: office365.sharepoint.client_context.ClientContext
         """
         super(TaxonomyService, self).__init__()
-        self._pending_request = ODataRequest(V4JsonFormat())
+        self._transport = context.transport
+        self._pending_request = ODataRequest(V4JsonFormat(), context.transport)
         self._pending_request.beforeExecute += (
             context.authentication_context.authenticate_request
         )
+        self._pending_request.unauthorized += (
+            context.authentication_context.reauthenticate_request
+        )
         self._service_root_url = "{0}/v2.1".format(context.service_root_url())
 
     def pending_request(self):
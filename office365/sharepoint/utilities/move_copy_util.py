@@ -1,5 +1,4 @@
-import os
-from typing import IO, TYPE_CHECKING, AnyStr, Callable
+from typing import IO, TYPE_CHECKING, Callable
 
 from office365.runtime.client_result import ClientResult
 from office365.runtime.queries.service_operation import ServiceOperationQuery
@@ -144,51 +143,29 @@ class MoveCopyUtil(Entity):
 
     @staticmethod
     def download_folder(
-        remove_folder, download_file, after_file_downloaded=None, recursive=True
+        remove_folder,
+        download_file,
+        after_file_downloaded=None,
+        recursive=True,
+        max_workers=8,
     ):
-        # type: (Folder, IO, Callable[[File], None], bool) -> Folder
+        # type: (Folder, IO, Callable[[File], None], bool, int) -> Folder
         """
-        Downloads a folder into a zip file
+        Downloads a folder into a zip file, see FolderExporter. The download is executed immediately
+
         :param office365.sharepoint.folders.folder.Folder remove_folder: Parent folder
         :param typing.IO download_file: A download zip file object
         :param (office365.sharepoint.files.file.File)->None after_file_downloaded: A download callback
         :param bool recursive: Determines whether to traverse folders recursively
+        :param int max_workers: Number of files downloaded at the same time
         """
-        import zipfile
-
-        def _get_relative_file_path(file):
-            # type: (File) -> str
-            return os.path.join(
-                file.parent_folder.serverRelativeUrl.replace(
-                    remove_folder.serverRelativeUrl, ""
-                ),
-                file.name,
-            )
-
-        def _download_file(file):
-            # type: (File) -> None
-
-            def _after_downloaded(result):
-                # type: (ClientResult[AnyStr]) -> None
-                filename = _get_relative_file_path(file)
-                if callable(after_file_downloaded):
-                    after_file_downloaded(file)
-                with zipfile.ZipFile(
-                    download_file.name, "a", zipfile.ZIP_DEFLATED
-                ) as zf:
-                    zf.writestr(filename, result.value)
-
-            file.get_content().after_execute(_after_downloaded)
-
-        def _download_folder(folder):
-            # type: (Folder) -> None
-
-            def _download_files(rt):
-                [_download_file(file) for file in folder.files]
-                if recursive:
-                    [_download_folder(sub_folder) for sub_folder in folder.folders]
-
-            folder.expand(["Files", "Folders"]).get().after_execute(_download_files)
-
-        _download_folder(remove_folder)
+        from office365.sharepoint.folders.exporter import FolderExporter
+
+        FolderExporter(
+            remove_folder,
+            download_file,
+            max_workers=max_workers,
+            recursive=recursive,
+            file_downloaded=after_file_downloaded,
+        ).execute()
         return remove_folder
@@ -1791,9 +1791,9 @@ class Web(SecurableObject):
     @property
     def activities(self):
         # type: () -> EntityCollection[SPActivityEntity]
-        return self.properties.get(
+        return self._get_navigation_property(
             "Activities",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context,
                 SPActivityEntity,
                 ResourcePath("Activities", self.resource_path),
@@ -1803,9 +1803,9 @@ class Web(SecurableObject):
     @property
     def activity_logger(self):
         """"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ActivityLogger",
-            ActivityLogger(
+            lambda: ActivityLogger(
                 self.context, ResourcePath("ActivityLogger", self.resource_path)
             ),
         )
@@ -1838,8 +1838,9 @@ class Web(SecurableObject):
         """
         Gets a user object that represents the user who created the Web site.
         """
-        return self.properties.get(
-            "Author", User(self.context, ResourcePath("Author", self.resource_path))
+        return self._get_navigation_property(
+            "Author",
+            lambda: User(self.context, ResourcePath("Author", self.resource_path)),
         )
 
     @property
@@ -1908,9 +1909,11 @@ class Web(SecurableObject):
     @property
     def access_requests_list(self):
         """"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "AccessRequestsList",
-            List(self.context, ResourcePath("AccessRequestsList", self.resource_path)),
+            lambda: List(
+                self.context, ResourcePath("AccessRequestsList", self.resource_path)
+            ),
         )
 
     @property
@@ -1965,17 +1968,19 @@ class Web(SecurableObject):
         """Specifies the collection of all child sites for the site"""
         from office365.sharepoint.webs.collection import WebCollection
 
-        return self.properties.get(
+        return self._get_navigation_property(
             "Webs",
-            WebCollection(self.context, ResourcePath("webs", self.resource_path), self),
+            lambda: WebCollection(
+                self.context, ResourcePath("webs", self.resource_path), self
+            ),
         )
 
     @property
     def folders(self):
         """Specifies the collection of all first-level folders in the site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Folders",
-            FolderCollection(
+            lambda: FolderCollection(
                 self.context, ResourcePath("folders", self.resource_path), self
             ),
         )
@@ -1983,9 +1988,9 @@ class Web(SecurableObject):
     @property
     def hosted_apps(self):
         """"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "HostedApps",
-            HostedAppsManager(
+            lambda: HostedAppsManager(
                 self.context, ResourcePath("HostedApps", self.resource_path)
             ),
         )
@@ -1995,18 +2000,20 @@ class Web(SecurableObject):
         # type: () -> ListCollection
         """Specifies the collection of lists that are contained in the site available to the current user based on the
         current user's permissions."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Lists",
-            ListCollection(self.context, ResourcePath("lists", self.resource_path)),
+            lambda: ListCollection(
+                self.context, ResourcePath("lists", self.resource_path)
+            ),
         )
 
     @property
     def onedrive_shared_items(self):
         # type: () -> EntityCollection[SharedDocumentInfo]
         """"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "OneDriveSharedItems",
-            EntityCollection(
+            lambda: EntityCollection(
                 self.context,
                 SharedDocumentInfo,
                 ResourcePath("OneDriveSharedItems", self.resource_path),
@@ -2017,18 +2024,20 @@ class Web(SecurableObject):
     def site_users(self):
         # type: () -> UserCollection
         """Specifies the collection of users in the site collection that contains the site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "SiteUsers",
-            UserCollection(self.context, ResourcePath("siteUsers", self.resource_path)),
+            lambda: UserCollection(
+                self.context, ResourcePath("siteUsers", self.resource_path)
+            ),
         )
 
     @property
     def site_groups(self):
         # type: () -> GroupCollection
         """Gets the collection of groups for the site collection."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "SiteGroups",
-            GroupCollection(
+            lambda: GroupCollection(
                 self.context, ResourcePath("siteGroups", self.resource_path)
             ),
         )
@@ -2037,27 +2046,27 @@ class Web(SecurableObject):
     def current_user(self):
         # type: () -> User
         """Gets the current user."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "CurrentUser",
-            User(self.context, ResourcePath("CurrentUser", self.resource_path)),
+            lambda: User(self.context, ResourcePath("CurrentUser", self.resource_path)),
         )
 
     @property
     def parent_web(self):
         # type: () -> Web
         """Gets the parent website of the specified website."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ParentWeb",
-            Web(self.context, ResourcePath("ParentWeb", self.resource_path)),
+            lambda: Web(self.context, ResourcePath("ParentWeb", self.resource_path)),
         )
 
     @property
     def associated_visitor_group(self):
         # type: () -> Group
         """Gets or sets the associated visitor group of the Web site."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "AssociatedVisitorGroup",
-            Group(
+            lambda: Group(
                 self.context, ResourcePath("AssociatedVisitorGroup", self.resource_path)
             ),
         )
@@ -2066,9 +2075,9 @@ class Web(SecurableObject):
     def associated_owner_group(self):
         # type: () -> Group
         """Gets or sets the associated owner group of the Web site."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "AssociatedOwnerGroup",
-            Group(
+            lambda: Group(
                 self.context, ResourcePath("AssociatedOwnerGroup", self.resource_path)
             ),
         )
@@ -2077,9 +2086,9 @@ class Web(SecurableObject):
     def associated_member_group(self):
         # type: () -> Group
         """Gets or sets the group of users who have been given contribute permissions to the Web site."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "AssociatedMemberGroup",
-            Group(
+            lambda: Group(
                 self.context, ResourcePath("AssociatedMemberGroup", self.resource_path)
             ),
         )
@@ -2087,9 +2096,9 @@ class Web(SecurableObject):
     @property
     def can_modernize_homepage(self):
         """Specifies the site theme associated with the site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "CanModernizeHomepage",
-            ModernizeHomepageResult(
+            lambda: ModernizeHomepageResult(
                 self.context, ResourcePath("CanModernizeHomepage", self.resource_path)
             ),
         )
@@ -2098,18 +2107,20 @@ class Web(SecurableObject):
     def fields(self):
         # type: () -> FieldCollection
         """Specifies the collection of all the fields (2) in the site (2)."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Fields",
-            FieldCollection(self.context, ResourcePath("Fields", self.resource_path)),
+            lambda: FieldCollection(
+                self.context, ResourcePath("Fields", self.resource_path)
+            ),
         )
 
     @property
     def content_types(self):
         # type: () -> ContentTypeCollection
         """Gets the collection of content types for the Web site."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ContentTypes",
-            ContentTypeCollection(
+            lambda: ContentTypeCollection(
                 self.context, ResourcePath("ContentTypes", self.resource_path), self
             ),
         )
@@ -2126,9 +2137,9 @@ class Web(SecurableObject):
     @property
     def description_resource(self):
         """A UserResource object that represents the description of this web."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "DescriptionResource",
-            UserResource(
+            lambda: UserResource(
                 self.context, ResourcePath("DescriptionResource", self.resource_path)
             ),
         )
@@ -2137,9 +2148,9 @@ class Web(SecurableObject):
     def role_definitions(self):
         # type: () -> RoleDefinitionCollection
         """Gets the collection of role definitions for the Web site."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "RoleDefinitions",
-            RoleDefinitionCollection(
+            lambda: RoleDefinitionCollection(
                 self.context, ResourcePath("RoleDefinitions", self.resource_path)
             ),
         )
@@ -2148,9 +2159,9 @@ class Web(SecurableObject):
     def event_receivers(self):
         # type: () -> EventReceiverDefinitionCollection
         """Specifies the collection of event receiver definitions that are currently available on the Web site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "EventReceivers",
-            EventReceiverDefinitionCollection(
+            lambda: EventReceiverDefinitionCollection(
                 self.context, ResourcePath("EventReceivers", self.resource_path), self
             ),
         )
@@ -2161,9 +2172,9 @@ class Web(SecurableObject):
         Gets a collection of the ClientWebParts installed in this SP.Web. It can be used to get metadata of the
         ClientWebParts or render them. It is a read-only collection as ClientWebParts need to be installed in
         an app package."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ClientWebParts",
-            ClientWebPartCollection(
+            lambda: ClientWebPartCollection(
                 self.context, ResourcePath("ClientWebParts", self.resource_path)
             ),
         )
@@ -2171,9 +2182,9 @@ class Web(SecurableObject):
     @property
     def features(self):
         """Get web features"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Features",
-            FeatureCollection(
+            lambda: FeatureCollection(
                 self.context, ResourcePath("Features", self.resource_path), self
             ),
         )
@@ -2181,9 +2192,9 @@ class Web(SecurableObject):
     @property
     def tenant_app_catalog(self):
         """Returns the tenant app catalog for the given tenant if it exists."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "TenantAppCatalog",
-            TenantCorporateCatalogAccessor(
+            lambda: TenantCorporateCatalogAccessor(
                 self.context, ResourcePath("TenantAppCatalog", self.resource_path)
             ),
         )
@@ -2191,9 +2202,9 @@ class Web(SecurableObject):
     @property
     def site_collection_app_catalog(self):
         """Returns the site collection app catalog for the given web if it exists."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "SiteCollectionAppCatalog",
-            SiteCollectionCorporateCatalogAccessor(
+            lambda: SiteCollectionCorporateCatalogAccessor(
                 self.context,
                 ResourcePath("SiteCollectionAppCatalog", self.resource_path),
             ),
@@ -2202,9 +2213,9 @@ class Web(SecurableObject):
     @property
     def web_infos(self):
         """Specifies the collection of all child sites for the site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "WebInfos",
-            WebInformationCollection(
+            lambda: WebInformationCollection(
                 self.context, ResourcePath("WebInfos", self.resource_path)
             ),
         )
@@ -2212,9 +2223,11 @@ class Web(SecurableObject):
     @property
     def theme_info(self):
         """Specifies the site theme associated with the site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ThemeInfo",
-            ThemeInfo(self.context, ResourcePath("ThemeInfo", self.resource_path)),
+            lambda: ThemeInfo(
+                self.context, ResourcePath("ThemeInfo", self.resource_path)
+            ),
         )
 
     @property
@@ -2251,9 +2264,9 @@ class Web(SecurableObject):
     def list_templates(self):
         """Gets a value that specifies the collection of list definitions and list templates available for creating
         lists on the site."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "ListTemplates",
-            ListTemplateCollection(
+            lambda: ListTemplateCollection(
                 self.context, ResourcePath("ListTemplates", self.resource_path)
             ),
         )
@@ -2276,9 +2289,9 @@ class Web(SecurableObject):
     def multilingual_settings(self):
         """Gets a value that specifies the collection of list definitions and list templates available for creating
         lists on the site."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "MultilingualSettings",
-            MultilingualSettings(
+            lambda: MultilingualSettings(
                 self.context, ResourcePath("MultilingualSettings", self.resource_path)
             ),
         )
@@ -2292,9 +2305,9 @@ class Web(SecurableObject):
     @property
     def regional_settings(self):
         """Gets the regional settings that are currently implemented on the website."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "RegionalSettings",
-            RegionalSettings(
+            lambda: RegionalSettings(
                 self.context, ResourcePath("RegionalSettings", self.resource_path)
             ),
         )
@@ -2302,9 +2315,9 @@ class Web(SecurableObject):
     @property
     def recycle_bin(self):
         """Specifies the collection of Recycle Bin items of the Recycle Bin of the site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "RecycleBin",
-            RecycleBinItemCollection(
+            lambda: RecycleBinItemCollection(
                 self.context, ResourcePath("RecycleBin", self.resource_path)
             ),
         )
@@ -2317,17 +2330,19 @@ class Web(SecurableObject):
     @property
     def navigation(self):
         """Specifies the navigation structure on the site (2), including the Quick Launch area and the link bar."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Navigation",
-            Navigation(self.context, ResourcePath("Navigation", self.resource_path)),
+            lambda: Navigation(
+                self.context, ResourcePath("Navigation", self.resource_path)
+            ),
         )
 
     @property
     def push_notification_subscribers(self):
         """Specifies the collection of push notification subscribers for the site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "PushNotificationSubscribers",
-            PushNotificationSubscriberCollection(
+            lambda: PushNotificationSubscriberCollection(
                 self.context,
                 ResourcePath("PushNotificationSubscribers", self.resource_path),
             ),
@@ -2336,18 +2351,22 @@ class Web(SecurableObject):
     @property
     def root_folder(self):
         """Get a root folder"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "RootFolder",
-            Folder(self.context, ResourcePath("RootFolder", self.resource_path)),
+            lambda: Folder(
+                self.context, ResourcePath("RootFolder", self.resource_path)
+            ),
         )
 
     @property
     def alerts(self):
         # type: () -> AlertCollection
         """Gets the collection of alerts for the site or subsite."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "Alerts",
-            AlertCollection(self.context, ResourcePath("Alerts", self.resource_path)),
+            lambda: AlertCollection(
+                self.context, ResourcePath("Alerts", self.resource_path)
+            ),
         )
 
     @property
@@ -2357,9 +2376,9 @@ class Web(SecurableObject):
         Specifies the collection of all fields available for the current scope, including those of the
         current site, as well as any parent sites.
         """
-        return self.properties.get(
+        return self._get_navigation_property(
             "AvailableFields",
-            FieldCollection(
+            lambda: FieldCollection(
                 self.context, ResourcePath("AvailableFields", self.resource_path)
             ),
         )
@@ -2371,9 +2390,9 @@ class Web(SecurableObject):
         Specifies the collection of all site content types that apply to the current scope,
         including those of the current site (2), as well as any parent sites.
         """
-        return self.properties.get(
+        return self._get_navigation_property(
             "AvailableContentTypes",
-            ContentTypeCollection(
+            lambda: ContentTypeCollection(
                 self.context, ResourcePath("AvailableContentTypes", self.resource_path)
             ),
         )
@@ -2383,9 +2402,11 @@ class Web(SecurableObject):
         """
         Specifies the user information list for the site collection that contains the site
         """
-        return self.properties.get(
+        return self._get_navigation_property(
             "SiteUserInfoList",
-            List(self.context, ResourcePath("SiteUserInfoList", self.resource_path)),
+            lambda: List(
+                self.context, ResourcePath("SiteUserInfoList", self.resource_path)
+            ),
         )
 
     @property
@@ -2414,9 +2435,9 @@ class Web(SecurableObject):
     @property
     def user_custom_actions(self):
         """Specifies the collection of user custom actions for the site"""
-        return self.properties.get(
+        return self._get_navigation_property(
             "UserCustomActions",
-            UserCustomActionCollection(
+            lambda: UserCustomActionCollection(
                 self.context, ResourcePath("UserCustomActions", self.resource_path)
             ),
         )
@@ -2435,9 +2456,9 @@ class Web(SecurableObject):
     @property
     def title_resource(self):
         """A UserResource object that represents the title of this web."""
-        return self.properties.get(
+        return self._get_navigation_property(
             "TitleResource",
-            UserResource(
+            lambda: UserResource(
                 self.context, ResourcePath("TitleResource", self.resource_path)
             ),
         )
@@ -25,7 +25,12 @@ setup(
         "pytz",
         "typing_extensions>=4.0.0",
     ],
-    extras_require={"NtlmProvider": ["requests_ntlm"]},
+    extras_require={
+        "NtlmProvider": ["requests_ntlm"],
+        "HTTP2": ["httpx[http2]"],
+        "Async": ["httpx"],
+        "Arrow": ["pyarrow"],
+    },
     tests_require=["pytest", "adal"],
     test_suite="tests",
     license="MIT",
@@ -84,3 +84,10 @@ class TestGraphUser(GraphTestCase):
     def test_14_delete_extension(self):
         result = self.__class__.test_extension.delete_object().execute_query()
         self.assertIsNotNone(result.resource_path)
+
+    def test_15_track_user_changes(self):
+        changes = self.client.users.delta.select(["displayName"]).iter_changes(
+            page_size=100
+        )
+        self.assertGreater(len(list(changes)), 0)
+        self.assertIsNotNone(changes.delta_link)
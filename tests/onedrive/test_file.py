@@ -1,4 +1,5 @@
 import os
+import tempfile
 import uuid
 from datetime import datetime, timedelta
 
@@ -89,10 +90,29 @@ class TestFile(GraphTestCase):
         )
         self.assertIsNotNone(target_file.web_url)
 
+    def test_11_resume_upload_file_session(self):
+        local_path = "{0}/../data/Sample.txt".format(os.path.dirname(__file__))
+        session_urls = []
+        self.target_drive.root.resumable_upload(
+            local_path, session_created=session_urls.append
+        ).execute_query()
+        self.assertEqual(len(session_urls), 1)
+
     def test_12_download_file(self):
         result = self.__class__.target_file.get_content().execute_query()
         self.assertIsNotNone(result.value)
 
+    def test_12_download_file_segmented(self):
+        with tempfile.TemporaryDirectory() as local_path:
+            path = os.path.join(local_path, self.__class__.target_file.name)
+            self.__class__.target_file.download_segmented(
+                path, segment_size=1024 * 1024
+            ).execute_query()
+            self.assertEqual(
+                self.__class__.target_file.properties.get("size"),
+                os.path.getsize(path),
+            )
+
     def test_13_convert_file(self):
         result = self.__class__.target_file.convert("pdf").execute_query()
         self.assertIsNotNone(result.value)
@@ -1,4 +1,7 @@
+import os
+import tempfile
 import uuid
+import zipfile
 
 from office365.onedrive.driveitems.driveItem import DriveItem
 from office365.onedrive.drives.drive import Drive
@@ -61,5 +64,21 @@ class TestFolder(GraphTestCase):
         result = self.__class__.target_folder.analytics.get().execute_query()
         self.assertIsNotNone(result.resource_path)
 
-    def test6_delete_folder(self):
+    def test6_bulk_upload_folder(self):
+        local_path = "{0}/../data".format(os.path.dirname(__file__))
+        result = self.__class__.target_folder.bulk_upload_folder(local_path)
+        self.assertGreater(len(result.uploaded), 0)
+        result = self.__class__.target_folder.bulk_upload_folder(local_path)
+        self.assertEqual(len(result.uploaded), 0)
+
+    def test7_download_folder(self):
+        downloaded = []
+        with tempfile.TemporaryFile() as f:
+            self.__class__.target_folder.download_folder(f, downloaded.append)
+            f.seek(0)
+            with zipfile.ZipFile(f) as zf:
+                self.assertEqual(len(zf.namelist()), len(downloaded))
+        self.assertGreater(len(downloaded), 0)
+
+    def test8_delete_folder(self):
         self.__class__.target_folder.delete_object().execute_query()
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import TestCase
+
+from office365.runtime.http.async_transport import HttpxAsyncTransport
+from office365.runtime.http.request_options import RequestOptions
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAsyncTransport(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = "http://127.0.0.1:{0}/".format(cls.server.server_port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test1_send_within_multiple_event_loops(self):
+        transport = HttpxAsyncTransport()
+        clients = []
+
+        async def _send():
+            response = await transport.send(RequestOptions(self.url))
+            clients.append(transport.client)
+            return response.content
+
+        self.assertEqual(asyncio.run(_send()), b"ok")
+        self.assertEqual(asyncio.run(_send()), b"ok")
+        self.assertIsNot(clients[0], clients[1])
+
+    def test2_reuse_client_within_event_loop(self):
+        transport = HttpxAsyncTransport()
+
+        async def _send_twice():
+            await transport.send(RequestOptions(self.url))
+            client = transport.client
+            await transport.send(RequestOptions(self.url))
+            self.assertIs(transport.client, client)
+            await transport.close()
+            self.assertIsNot(transport.client, client)
+
+        asyncio.run(_send_twice())
@@ -1,5 +1,10 @@
+import os
+import tempfile
+
 from office365.sharepoint.changes.collection import ChangeCollection
 from office365.sharepoint.changes.log_item_query import ChangeLogItemQuery
+from office365.sharepoint.changes.sync import ChangeSyncEventType
+from office365.sharepoint.changes.token_store import SqliteChangeTokenStore
 from tests.sharepoint.sharepoint_case import SPTestCase
 
 
@@ -17,3 +22,17 @@ class TestChange(SPTestCase):
         query = ChangeLogItemQuery(row_limit=100)
         result = target_list.get_list_item_changes_since_token(query).execute_query()
         self.assertIsNotNone(result.value)
+
+    def test_4_sync_list_changes(self):
+        store = SqliteChangeTokenStore(
+            os.path.join(tempfile.mkdtemp(), "change_tokens.db")
+        )
+        target_list = self.client.site.root_web.default_document_library()
+        events = list(target_list.sync_changes(store, ["Title"]))
+        self.assertEqual(events[0].event_type, ChangeSyncEventType.Reset)
+        self.assertIsNotNone(store.get(target_list.id))
+
+        events = list(target_list.sync_changes(store, ["Title"]))
+        self.assertNotIn(
+            ChangeSyncEventType.Reset, [event.event_type for event in events]
+        )
@@ -1,8 +1,15 @@
+import asyncio
+import os
+import tempfile
 from unittest import TestCase
 
 from office365.runtime.auth.authentication_context import AuthenticationContext
+from office365.runtime.auth.credential_store import FileCredentialStore
+from office365.runtime.auth.providers.acs_token_provider import ACSTokenProvider
+from office365.runtime.auth.token_response import TokenResponse
 from office365.runtime.client_result import ClientResult
 from office365.runtime.client_value_collection import ClientValueCollection
+from office365.runtime.http.transport import RequestsTransport
 from office365.runtime.odata.query_options import QueryOptions
 from office365.runtime.odata.type import ODataType
 from office365.runtime.types.collections import GuidCollection, StringCollection
@@ -180,3 +187,71 @@ class TestSharePointClient(TestCase):
     def test_18_query_options_is_empty(self):
         options = QueryOptions()
         self.assertTrue(options.is_empty)
+
+    def test_19_execute_with_pooled_transport(self):
+        transport = RequestsTransport(pool_maxsize=4, timeout=(5, 60))
+        client = (
+            ClientContext(test_site_url)
+            .with_credentials(test_user_credentials)
+            .with_transport(transport)
+        )
+        self.assertIs(client.pending_request().transport, transport)
+        web = client.web.get().execute_query()
+        lib = client.web.default_document_library().get().execute_query()
+        self.assertIsNotNone(web.url)
+        self.assertIsNotNone(lib.title)
+
+    def test_20_execute_independent_queries_concurrently(self):
+        client = ClientContext(test_site_url).with_credentials(test_user_credentials)
+        current_user = client.web.current_user.get()
+        current_web = client.web.get()
+        lists = client.web.lists.get()
+        client.execute_query(max_workers=4)
+        self.assertIsNotNone(current_web.url)
+        self.assertIsNotNone(current_user.login_name)
+        self.assertGreater(len(lists), 0)
+        self.assertIs(client.current_query.return_type, lists)
+
+    def test_21_execute_query_async(self):
+        client = ClientContext(test_site_url).with_credentials(test_user_credentials)
+        current_web = client.web.get()
+        lists = client.web.lists.get()
+        asyncio.run(client.execute_query_async(max_concurrency=2))
+        self.assertIsNotNone(current_web.url)
+        self.assertGreater(len(lists), 0)
+
+    def test_22_renew_rejected_token(self):
+        provider = ACSTokenProvider(
+            test_site_url,
+            settings.get("client_credentials", "client_id"),
+            settings.get("client_credentials", "client_secret"),
+        )
+        tokens = [TokenResponse("invalid", "Bearer")]
+
+        def _acquire_token():
+            if tokens:
+                return tokens.pop()
+            return provider.get_app_only_access_token()
+
+        client = ClientContext(test_site_url).with_access_token(_acquire_token)
+        web = client.web.get().execute_query()
+        self.assertIsNotNone(web.url)
+        self.assertEqual(len(tokens), 0)
+
+    def test_23_share_token_via_credential_store(self):
+        store = FileCredentialStore(os.path.join(tempfile.mkdtemp(), "credentials.bin"))
+        client = (
+            ClientContext(test_site_url)
+            .with_credential_store(store)
+            .with_credentials(test_client_credentials)
+        )
+        client.web.get().execute_query()
+        self.assertTrue(os.path.exists(store.path))
+
+        other_client = (
+            ClientContext(test_site_url)
+            .with_credentials(test_client_credentials)
+            .with_credential_store(store)
+        )
+        web = other_client.web.get().execute_query()
+        self.assertIsNotNone(web.url)
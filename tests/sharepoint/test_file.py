@@ -1,4 +1,5 @@
 import os
+import tempfile
 from io import BytesIO
 
 from office365.sharepoint.changes.query import ChangeQuery
@@ -147,3 +148,19 @@ class TestSharePointFile(SPTestCase):
             path, size_1mb
         ).execute_query()
         self.assertEqual(file_size, file.length)
+
+    def test_23_resumable_upload_large_file(self):
+        path = "{0}/../data/big_buck_bunny.mp4".format(os.path.dirname(__file__))
+        file_size = os.path.getsize(path)
+        file = self.folder_from.files.resumable_upload(
+            path, 1000000, file_name="resumable.mp4"
+        )
+        file.get().execute_query()
+        self.assertEqual(file_size, file.length)
+
+    def test_24_download_large_file_segmented(self):
+        source_file = self.folder_from.files.get_by_url("resumable.mp4")
+        with tempfile.TemporaryDirectory() as local_path:
+            path = os.path.join(local_path, "big_buck_bunny.mp4")
+            source_file.download_segmented(path, segment_size=1000000).execute_query()
+            self.assertEqual(source_file.length, os.path.getsize(path))
@@ -179,3 +179,15 @@ class TestSPList(SPTestCase):
         site_pages = self.client.web.get_list_by_title("Site Pages")
         result = site_pages.get_metadata_navigation_settings().execute_query()
         self.assertIsNotNone(result.value)
+
+    def test_23_export_list_items(self):
+        import io
+
+        site_pages = self.client.web.get_list_by_title("Site Pages")
+        output = io.StringIO()
+        result = site_pages.export(
+            ["ID", "Title", "Modified", "Author"], output, page_size=100
+        ).execute_query()
+        rows = output.getvalue().splitlines()
+        self.assertEqual(rows[0], "ID,Title,Modified,Author")
+        self.assertEqual(len(rows) - 1, result.value)
@@ -172,3 +172,28 @@ class TestSharePointListItem(SPTestCase):
         items_count = len(items)
         items = users_list.items.get_all(page_size=1000).execute_query()
         self.assertEqual(len(items), items_count)
+
+    def test_22_get_all_items_streamed(self):
+        users_list = self.client.web.lists.get_by_title("User Information List")
+        items = users_list.items.get_all(page_size=1000).execute_query()
+        streamed_items = (
+            users_list.items.get_all(page_size=1000).streamed().execute_query()
+        )
+        self.assertEqual(len(streamed_items), len(items))
+
+        ids = []
+        users_list.items.streamed(lambda item: ids.append(item.id)).get_all(
+            page_size=1000
+        ).execute_query()
+        self.assertEqual(ids, [item.id for item in items])
+
+    def test_23_get_all_items_partitioned(self):
+        users_list = self.client.web.lists.get_by_title("User Information List")
+        items = users_list.items.get_all(page_size=1000).execute_query()
+        ids = [
+            item.id
+            for item in users_list.iter_items_partitioned(
+                partitions=4, page_size=100, ordered=True, properties=["ID"]
+            )
+        ]
+        self.assertEqual(ids, [item.id for item in items])
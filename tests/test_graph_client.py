@@ -1,9 +1,17 @@
 import uuid
 
+from office365.graph_client import GraphClient
 from office365.onedrive.internal.paths.url import UrlPath
 from office365.runtime.paths.builder import ODataPathBuilder
 from office365.runtime.paths.resource_path import ResourcePath
-from tests import test_team_site_url
+from office365.runtime.queries.batch import BatchQuery
+from tests import (
+    test_client_id,
+    test_password,
+    test_team_site_url,
+    test_tenant,
+    test_username,
+)
 from tests.graph_case import GraphTestCase
 
 
@@ -111,3 +119,55 @@ class TestGraphClient(GraphTestCase):
         path_str = "/teams('7f919b9f-c220-4290-a4d8-5ff9300d1296')/operations('dc97f61a-0040-436f-ac09-427cd2456fd8')"
         path = ODataPathBuilder.parse_url(path_str)
         self.assertIsNotNone(path.segment)
+
+    def test_18_execute_auto_batch(self):
+        client = GraphClient.with_username_and_password(
+            test_tenant, test_client_id, test_username, test_password
+        ).with_auto_batch(20)
+        loaded = []
+        current_user = client.me.get().after_execute(lambda u: loaded.append(u))
+        my_drive = client.me.drive.get().after_execute(lambda d: loaded.append(d))
+        client.execute_query()
+        self.assertIsNotNone(current_user.id)
+        self.assertIsNotNone(my_drive.web_url)
+        self.assertEqual(loaded, [current_user, my_drive])
+
+    def test_19_build_batch_depends_on(self):
+        client = GraphClient(lambda: {})
+        client.users["1"].get()
+        client.me.drive.root.create_folder("Archive")
+        client.users["2"].get()
+        client.users["3"].get()
+        batch_qry = BatchQuery(client, client._get_batch_queries(20))
+        payload = client._create_batch_request()._prepare_payload(batch_qry)
+        depends_on = [r.get("dependsOn") for r in payload["requests"]]
+        self.assertEqual(depends_on, [None, ["0"], ["1"], ["2"]])
+
+    def test_20_resolve_cached_child_path(self):
+        path = self.client.me.drive.root.children.resource_path
+        child_path = ResourcePath("content", path)
+        self.assertEqual("/me/drive/root/children/content", str(child_path))
+        item_id = uuid.uuid4().hex
+        path.patch(item_id)
+        self.assertEqual(f"/me/drive/items/{item_id}/content", str(child_path))
+        self.assertEqual(ResourcePath("content", path), child_path)
+
+    def test_21_iter_pages(self):
+        users = self.client.users
+        page_sizes = []
+        for page in users.iter_pages(page_size=5):
+            page_sizes.append(len(page))
+            self.assertEqual(len(users), 0)
+        self.assertGreater(sum(page_sizes), 0)
+        self.assertTrue(all(size <= 5 for size in page_sizes))
+
+    def test_22_build_batch_request_body(self):
+        client = GraphClient(lambda: {})
+        client.users["1"].get()
+        client.me.drive.root.create_folder("Archive")
+        batch_qry = BatchQuery(client, client._get_batch_queries(20))
+        payload = client._create_batch_request()._prepare_payload(batch_qry)
+        read_request, create_request = payload["requests"]
+        self.assertNotIn("body", read_request)
+        self.assertEqual(create_request["method"], "POST")
+        self.assertEqual(create_request["body"]["name"], "Archive")